@@ -0,0 +1,222 @@
+# archive.py — ZIP output-এর compression policy
+# xlsx/parquet ইত্যাদি ভেতরে আগেই deflate করা থাকে; আবার deflate করলে CPU খরচ হয়, size কমে না।
+# Policy প্রতিটি entry-র extension দেখে ঠিক করে: store, না কোন level-এ deflate।
+#   "auto"    → compressed format store, text (csv/json/txt) deflate level 6
+#   "fast"    → compressed format store, text deflate level 1
+#   "deflate" → আগের আচরণ: সব entry deflate (default level)
+#   "store"   → কিছুই compress না
+# workers > 1 হলে entry গুলো thread pool-এ compress হয় (zlib GIL ছেড়ে দেয়),
+# আর ZIP-এ লেখা হয় add() করার ক্রমেই। আগে compress করা byte লেখার public API zipfile-এ নেই, তাই
+# সেটা zipfile-এর কিছু private অংশের উপর দাঁড়িয়ে — শুধু যাচাই করা Python version-এ; অন্যথায়
+# entry গুলো writestr দিয়ে ক্রমে (একটা thread-এ) compress হয়।
+# প্রতিটি entry-র size আর sha256 মনে রাখা হয়; add_manifest() শেষে সেগুলো manifest.json হিসেবে লেখে।
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+POLICIES = ("auto", "fast", "deflate", "store")
+COMPRESSED_EXTS = {"xlsx", "zip", "gz", "bz2", "xz", "zst", "parquet", "feather", "arrow", "png", "jpg", "jpeg"}
+TEXT_EXTS = {"csv", "tsv", "txt", "json", "jsonl"}
+
+
+def choose(name: str, policy: str) -> tuple:
+    # ফেরত দেয় (compress_type, level) — level None মানে zlib default
+    if policy not in POLICIES:
+        raise ValueError(f"unknown zip policy: {policy!r} (choose from {', '.join(POLICIES)})")
+    ext = os.path.splitext(name)[1].lower().lstrip(".")
+    if policy == "store" or (policy in ("auto", "fast") and ext in COMPRESSED_EXTS):
+        return zipfile.ZIP_STORED, None
+    if policy == "deflate":
+        return zipfile.ZIP_DEFLATED, None
+    if ext in TEXT_EXTS:
+        return zipfile.ZIP_DEFLATED, 1 if policy == "fast" else 6
+    return zipfile.ZIP_DEFLATED, 6
+
+
+def choice_label(compress_type: int, level) -> str:
+    if compress_type == zipfile.ZIP_STORED:
+        return "store"
+    return f"deflate-{level if level is not None else 'default'}"
+
+
+def _zinfo(name: str, compress_type: int, level) -> zipfile.ZipInfo:
+    zinfo = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+    zinfo.compress_type = compress_type
+    zinfo.external_attr = 0o600 << 16
+    if level is not None:
+        # 3.13 থেকে public compress_level; আগে writestr(compresslevel=...) নিজেও _compresslevel বসায়
+        if hasattr(zipfile.ZipInfo, "compress_level"):
+            zinfo.compress_level = level
+        else:
+            zinfo._compresslevel = level
+    return zinfo
+
+
+def _raw_writable(z: zipfile.ZipFile) -> bool:
+    # _write_raw যে zipfile internals ছোঁয় সেগুলো 3.8–3.14-এ একই; অন্য version-এ parallel mode বন্ধ
+    return ((3, 8) <= sys.version_info[:2] <= (3, 14) and hasattr(zipfile.ZipInfo, "FileHeader")
+            and all(hasattr(z, a) for a in ("_lock", "_seekable", "_writing", "_writecheck", "_didModify",
+                                             "start_dir", "fp")))
+
+
+def _compress(data: bytes, compress_type: int, level) -> tuple:
+    t0 = time.perf_counter()
+    crc = zlib.crc32(data)
+    sha = hashlib.sha256(data).hexdigest()
+    if compress_type == zipfile.ZIP_STORED:
+        packed = data
+    else:
+        c = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION if level is None else level, zlib.DEFLATED, -15)
+        packed = c.compress(data) + c.flush()
+    return crc, sha, packed, time.perf_counter() - t0
+
+
+class _TimedEntry(io.BufferedIOBase):
+    # z.open(..., "w")-এর উপর পাতলা wrapper: write()-এর ভেতরের সময় = CRC + sha256 + compress।
+    # BufferedIOBase, তাই pandas / openpyxl এটাকে binary file হিসেবে চেনে।
+    def __init__(self, archive, entry, zinfo: zipfile.ZipInfo, label: str, meta: dict):
+        super().__init__()
+        self._archive, self._entry, self._zinfo, self._label, self._meta = archive, entry, zinfo, label, meta
+        self._sha = hashlib.sha256()
+        self._secs = 0.0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        t0 = time.perf_counter()
+        self._sha.update(b)
+        n = self._entry.write(b)
+        self._secs += time.perf_counter() - t0
+        return n
+
+    def close(self):
+        if self.closed:
+            return
+        t0 = time.perf_counter()
+        self._entry.close()
+        self._secs += time.perf_counter() - t0
+        self._archive._record(self._label, self._zinfo.file_size, self._zinfo.compress_size, self._secs)
+        self._archive._entry(self._zinfo.filename, self._zinfo.file_size, self._sha.hexdigest(), self._meta)
+        super().close()
+
+
+class ArchiveWriter:
+    def __init__(self, out, policy: str = "auto", workers: int = 1):
+        choose("", policy)  # ভুল policy নাম হলে এখনই error
+        self.policy = policy
+        self.stats = {}  # choice label → {"entries", "raw", "packed", "seconds"}
+        self.entries = []  # লেখার ক্রমে: {"name", "bytes", "sha256", ...meta}
+        self._z = zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED)
+        self._workers = workers
+        self._pool = ThreadPoolExecutor(workers) if workers > 1 and _raw_writable(self._z) else None
+        self._pending = deque()
+
+    @property
+    def parallel(self) -> bool:
+        return self._pool is not None
+
+    def _record(self, label: str, raw: int, packed: int, secs: float):
+        s = self.stats.setdefault(label, {"entries": 0, "raw": 0, "packed": 0, "seconds": 0.0})
+        s["entries"] += 1
+        s["raw"] += raw
+        s["packed"] += packed
+        s["seconds"] += secs
+
+    def _entry(self, name: str, size: int, sha: str, meta: dict):
+        self.entries.append({"name": name, **meta, "bytes": size, "sha256": sha})
+
+    def open(self, name: str, **meta):
+        # streaming entry (size আগে জানা নেই); parallel mode-এ আগের entry গুলো আগে লিখে ফেলি
+        self._drain(0)
+        compress_type, level = choose(name, self.policy)
+        zinfo = _zinfo(name, compress_type, level)
+        entry = self._z.open(zinfo, "w", force_zip64=True)
+        return _TimedEntry(self, entry, zinfo, choice_label(compress_type, level), meta)
+
+    def add(self, name: str, data: bytes, **meta):
+        # meta (যেমন rows=...) manifest-এ এই entry-র সাথে যায়
+        compress_type, level = choose(name, self.policy)
+        if self._pool is None:
+            t0 = time.perf_counter()
+            sha = hashlib.sha256(data).hexdigest()
+            zinfo = _zinfo(name, compress_type, level)
+            self._z.writestr(zinfo, data)
+            self._record(choice_label(compress_type, level), len(data), zinfo.compress_size,
+                         time.perf_counter() - t0)
+            self._entry(name, len(data), sha, meta)
+            return
+        # queue ভরে থাকলে সবচেয়ে পুরোনোটা লেখা পর্যন্ত অপেক্ষা (memory bounded)
+        self._drain(self._workers * 2 - 1)
+        fut = self._pool.submit(_compress, data, compress_type, level)
+        self._pending.append((name, compress_type, level, len(data), meta, fut))
+
+    def _drain(self, keep: int):
+        while len(self._pending) > keep:
+            name, compress_type, level, size, meta, fut = self._pending.popleft()
+            crc, sha, packed, secs = fut.result()
+            self._write_raw(name, compress_type, level, size, crc, packed, secs)
+            self._entry(name, size, sha, meta)
+
+    def _write_raw(self, name: str, compress_type: int, level, size: int, crc: int, packed: bytes, secs: float):
+        # আগেই compress করা data সরাসরি লিখি: CRC আর size জানা, তাই header একবারেই সঠিক।
+        # zipfile-এর _open_to_write / _ZipWriteFile.close যা করে তার সমতুল্য; শুধু _raw_writable হলে
+        z = self._z
+        zinfo = _zinfo(name, compress_type, level)
+        zinfo.file_size = size
+        zinfo.compress_size = len(packed)
+        zinfo.CRC = crc
+        zip64 = size > zipfile.ZIP64_LIMIT or len(packed) > zipfile.ZIP64_LIMIT
+        with z._lock:
+            if z._writing:
+                raise ValueError("Can't write to the ZIP file while there is another write handle open on it.")
+            if z._seekable:
+                z.fp.seek(z.start_dir)
+            zinfo.header_offset = z.fp.tell()
+            z._writecheck(zinfo)
+            z._didModify = True
+            z.fp.write(zinfo.FileHeader(zip64))
+            z.fp.write(packed)
+            z.start_dir = z.fp.tell()
+            z.filelist.append(zinfo)
+            z.NameToInfo[zinfo.filename] = zinfo
+        self._record(choice_label(compress_type, level), size, len(packed), secs)
+
+    def add_manifest(self, name: str = "manifest.json", **info) -> dict:
+        # এ পর্যন্ত লেখা সব entry-র তালিকা (name, rows, bytes, sha256 ...) একটা JSON entry হিসেবে।
+        # manifest নিজে entries / stats-এ গোনা হয় না
+        self._drain(0)
+        manifest = {**info, "parts": list(self.entries)}
+        data = json.dumps(manifest, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+        compress_type, level = choose(name, self.policy)
+        self._z.writestr(name, data, compress_type, level)
+        return manifest
+
+    def close(self):
+        try:
+            self._drain(0)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+            self._z.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def report(self) -> list:
+        rows = []
+        for label, s in sorted(self.stats.items()):
+            rows.append({"choice": label, "entries": s["entries"], "raw_bytes": s["raw"],
+                         "zip_bytes": s["packed"], "saved_bytes": s["raw"] - s["packed"],
+                         "seconds": round(s["seconds"], 4)})
+        return rows
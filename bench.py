@@ -0,0 +1,352 @@
+# bench.py — reproducible benchmark suite
+# Seed থেকে synthetic CSV / xlsx / PDF বানিয়ে engine.py-র প্রতিটি tool path headless চালায়,
+# আর wall time, peak RSS ও output size একটা JSON report-এ লেখে। দুইটা report মিলিয়ে regression ধরা যায়:
+#   python bench.py run --sizes s m -o before.json
+#   python bench.py run --sizes s m -o after.json
+#   python bench.py compare before.json after.json --threshold 0.10
+# প্রতিটি case আলাদা Python process-এ চলে, তাই peak RSS আগের case-এর memory-তে মিশে যায় না।
+# Input একই seed আর size থেকে সবসময় একই data পায় (xlsx/PDF-এর ভেতরের timestamp ছাড়া); --data folder-এ রেখে দিলে পরের run-এ আবার বানাতে হয় না।
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(tempfile.gettempdir(), "shikder-bench")
+SEED = 42
+
+# size → input-এর মাপ: প্রতি ফাইলে rows × cols, ফাইলের সংখ্যা, প্রতি PDF-এ page
+SIZES = {
+    "s": {"rows": 2_000, "cols": 8, "files": 3, "pages": 10},
+    "m": {"rows": 50_000, "cols": 12, "files": 4, "pages": 100},
+    "l": {"rows": 250_000, "cols": 16, "files": 6, "pages": 400},
+}
+
+# case → (tool, engine.py argv-এর বাকি অংশ, output extension); {csv} / {xlsx} / {pdf} = input ফাইলগুলো,
+# {csv0} / {xlsx0} = প্রথম ফাইলটা
+CASES = {
+    "pdf":            ("pdf", ["{pdf}"], "pdf"),
+    "pdf-dedupe":     ("pdf", ["--dedupe", "{pdf}"], "pdf"),
+    "excel":          ("excel", ["{xlsx}"], "xlsx"),
+    "excel-compact":  ("excel", ["--compact", "{xlsx}"], "xlsx"),
+    "csv":            ("csv", ["{csv}"], "csv"),
+    "csv-no-stream":  ("csv", ["--no-stream", "{csv}"], "csv"),
+    "csv-compact":    ("csv", ["--no-stream", "--compact", "{csv}"], "csv"),
+    "csv-dedupe":     ("csv", ["--dedupe-rows=", "{csv}"], "csv"),
+    "e2c":            ("e2c", ["{xlsx0}"], "csv"),
+    "c2e":            ("c2e", ["{csv0}"], "xlsx"),
+    "split-csv":      ("split", ["--rows", "{part_rows}", "{csv0}"], "zip"),
+    "split-xlsx":     ("split", ["--rows", "{part_rows}", "{xlsx0}"], "zip"),
+}
+
+# compare: এর চেয়ে কম পার্থক্য noise — শতাংশ যতই হোক
+MIN_WALL_DELTA = 0.05  # সেকেন্ড
+MIN_RSS_DELTA = 5 << 20  # byte
+
+
+# ═══════════════════════════════════════════════════════
+# Synthetic input
+# ═══════════════════════════════════════════════════════
+
+def make_frame(rows: int, cols: int, seed: int):
+    # id, পূর্ণসংখ্যা, খালি ঘরসহ পূর্ণসংখ্যা, দশমিক, কম-unique text, date, free text — পালা করে
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    data = {"id": np.arange(rows, dtype="int64") + seed * rows}
+    cities = np.array(["Dhaka", "Chattogram", "Khulna", "Rajshahi", "Sylhet", "Barishal", "Rangpur", "Mymensingh"])
+    for i in range(1, cols):
+        kind = i % 6
+        if kind == 1:
+            data[f"qty_{i}"] = rng.integers(0, 1_000, rows)
+        elif kind == 2:
+            col = rng.integers(0, 100, rows).astype("float64")
+            col[rng.random(rows) < 0.05] = np.nan
+            data[f"score_{i}"] = col
+        elif kind == 3:
+            data[f"price_{i}"] = np.round(rng.random(rows) * 10_000, 2)
+        elif kind == 4:
+            data[f"city_{i}"] = cities[rng.integers(0, len(cities), rows)]
+        elif kind == 5:
+            data[f"date_{i}"] = (np.datetime64("2024-01-01") + rng.integers(0, 730, rows)).astype(str)
+        else:
+            data[f"note_{i}"] = np.char.add("ref-", rng.integers(0, 10**9, rows).astype(str))
+    return pd.DataFrame(data)
+
+
+def make_pdf(path: str, pages: int, seed: int):
+    # reportlab ছাড়াই: pypdf দিয়ে blank page-এ Helvetica-র কয়েক লাইন text
+    from pypdf import PdfWriter
+    from pypdf.generic import ContentStream, DictionaryObject, NameObject
+
+    writer = PdfWriter()
+    font = DictionaryObject({NameObject("/Type"): NameObject("/Font"), NameObject("/Subtype"): NameObject("/Type1"),
+                             NameObject("/BaseFont"): NameObject("/Helvetica")})
+    for p in range(pages):
+        page = writer.add_blank_page(612, 792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})})
+        lines = [f"Invoice {seed}-{p + 1} line {n} amount {(seed * 7919 + p * 31 + n) % 100_000}" for n in range(40)]
+        ops = "\n".join(f"BT /F1 11 Tf 56 {740 - 17 * n} Td ({text}) Tj ET" for n, text in enumerate(lines))
+        stream = ContentStream(None, None)
+        stream.set_data(ops.encode("ascii"))
+        page.replace_contents(stream)
+    with open(path, "wb") as fh:
+        writer.write(fh)
+
+
+def make_inputs(size: str, data_dir: str = DATA_DIR, seed: int = SEED) -> dict:
+    # {"csv": [...], "xlsx": [...], "pdf": [...]} — ফাইল আগে থেকে থাকলে আবার বানাই না
+    spec = SIZES[size]
+    folder = os.path.join(data_dir, f"{size}-{seed}")
+    os.makedirs(folder, exist_ok=True)
+    inputs = {"csv": [], "xlsx": [], "pdf": []}
+    for i in range(spec["files"]):
+        base = os.path.join(folder, f"part{i}")
+        df = None
+        for ext in ("csv", "xlsx"):
+            path = f"{base}.{ext}"
+            if not os.path.exists(path):
+                if df is None:
+                    df = make_frame(spec["rows"], spec["cols"], seed + i)
+                tmp = f"{base}.tmp.{ext}"
+                if ext == "csv":
+                    df.to_csv(tmp, index=False)
+                else:
+                    df.to_excel(tmp, index=False, engine="openpyxl")
+                os.replace(tmp, path)
+            inputs[ext].append(path)
+        path = f"{base}.pdf"
+        if not os.path.exists(path):
+            make_pdf(f"{base}.tmp.pdf", spec["pages"], seed + i)
+            os.replace(f"{base}.tmp.pdf", path)
+        inputs["pdf"].append(path)
+    return inputs
+
+
+# ═══════════════════════════════════════════════════════
+# Running cases
+# ═══════════════════════════════════════════════════════
+
+def case_argv(case: str, inputs: dict, size: str, output: str) -> list:
+    tool, args, _ = CASES[case]
+    fill = {"csv0": inputs["csv"][0], "xlsx0": inputs["xlsx"][0],
+            "part_rows": str(max(1, SIZES[size]["rows"] // 10))}
+    argv = [tool, "-q", "-o", output]
+    for a in args:
+        key = a.strip("{}")
+        if a.startswith("{") and key in inputs:
+            argv += inputs[key]
+        else:
+            argv.append(a.format(**fill))
+    return argv
+
+
+def _hwm():
+    # Linux: এই process-এর নিজের peak RSS। ru_maxrss fork+exec-এর পরও parent-এর মান বয়ে আনে,
+    # তাই bench process বড় হলে প্রতিটি case-এ একই সংখ্যা দেখাত
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _peak_rss() -> int:
+    # এই process আর এর process pool worker-দের মধ্যে সর্বোচ্চ RSS (byte); Windows-এ None
+    try:
+        import resource
+    except ImportError:
+        return None
+    scale = 1 if sys.platform == "darwin" else 1024  # Linux-এ ru_maxrss KiB-এ
+    own = _hwm() or resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    kids = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    return max(own, kids)
+
+
+def _child(argv: list) -> dict:
+    # আলাদা process-এর ভেতরে: import শেষের RSS আর tool চালানোর পরের peak দুটোই রাখি
+    import engine
+
+    base = _peak_rss()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        code = engine.main(argv)
+    wall = time.perf_counter() - start
+    return {"exit": code, "wall_s": wall, "peak_rss": _peak_rss(), "import_rss": base}
+
+
+def run_case(case: str, inputs: dict, size: str, out_dir: str) -> dict:
+    output = os.path.join(out_dir, f"{case}-{size}.{CASES[case][2]}")
+    argv = case_argv(case, inputs, size, output)
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "_child", json.dumps(argv)],
+                          cwd=HERE, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{case} ({size}) failed:\n{proc.stderr.strip()}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["output_bytes"] = os.path.getsize(output)
+    os.remove(output)
+    return result
+
+
+def run(sizes: list, cases: list, repeat: int = 1, data_dir: str = DATA_DIR, seed: int = SEED, log=None) -> dict:
+    # প্রতিটি (case, size) repeat বার চলে; wall-এর median আর RSS-এর সর্বোচ্চটা report-এ যায়
+    results = []
+    with tempfile.TemporaryDirectory(prefix="shikder-bench-out-") as out_dir:
+        for size in sizes:
+            inputs = make_inputs(size, data_dir, seed)
+            input_bytes = {k: sum(os.path.getsize(p) for p in v) for k, v in inputs.items()}
+            for case in cases:
+                runs = [run_case(case, inputs, size, out_dir) for _ in range(repeat)]
+                rss = [r["peak_rss"] for r in runs if r["peak_rss"] is not None]
+                entry = {
+                    "case": case, "tool": CASES[case][0], "size": size, **SIZES[size],
+                    "repeat": repeat,
+                    "wall_s": round(statistics.median(r["wall_s"] for r in runs), 4),
+                    "wall_all_s": [round(r["wall_s"], 4) for r in runs],
+                    "peak_rss_bytes": max(rss) if rss else None,
+                    "import_rss_bytes": runs[0]["import_rss"],
+                    "output_bytes": runs[0]["output_bytes"],
+                    "input_bytes": input_bytes,
+                }
+                results.append(entry)
+                if log:
+                    log(entry)
+    return {"meta": _meta(seed), "results": results}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _meta(seed: int) -> dict:
+    import pandas as pd
+    import pypdf
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "seed": seed,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "pandas": pd.__version__,
+        "pypdf": pypdf.__version__,
+        "xlsx_engine": os.environ.get("XLSX_ENGINE", "auto"),
+    }
+
+
+# ═══════════════════════════════════════════════════════
+# Comparing reports
+# ═══════════════════════════════════════════════════════
+
+def compare(old: dict, new: dict, threshold: float = 0.10) -> list:
+    # দুই report-এ যে (case, size) দুটোতেই আছে তার প্রতিটির জন্য একটা row;
+    # "regressions" খালি না হলে নতুন run threshold-এর বেশি ধীর / বেশি memory নিয়েছে
+    before = {(r["case"], r["size"]): r for r in old["results"]}
+    rows = []
+    for r in new["results"]:
+        o = before.get((r["case"], r["size"]))
+        if o is None:
+            continue
+        row = {"case": r["case"], "size": r["size"], "regressions": []}
+        for metric, floor in (("wall_s", MIN_WALL_DELTA), ("peak_rss_bytes", MIN_RSS_DELTA), ("output_bytes", 0)):
+            a, b = o.get(metric), r.get(metric)
+            if a is None or b is None:
+                continue
+            change = (b - a) / a if a else 0.0
+            row[metric] = (a, b, change)
+            if change > threshold and b - a > floor:
+                row["regressions"].append(metric)
+        rows.append(row)
+    return rows
+
+
+def _fmt(metric: str, v) -> str:
+    if metric == "wall_s":
+        return f"{v:.3f}s"
+    return f"{v / (1 << 20):.1f}M" if metric == "peak_rss_bytes" else f"{v:,}"
+
+
+def print_comparison(rows: list, out=sys.stdout):
+    metrics = ("wall_s", "peak_rss_bytes", "output_bytes")
+    print(f"{'case':<16} {'size':<4} " + " ".join(f"{m:>30}" for m in metrics), file=out)
+    for row in rows:
+        cells = []
+        for m in metrics:
+            if m not in row:
+                cells.append(f"{'-':>30}")
+                continue
+            a, b, change = row[m]
+            cells.append(f"{_fmt(m, a) + ' → ' + _fmt(m, b):>22} {change:+7.1%}")
+        flag = "  REGRESSION: " + ", ".join(row["regressions"]) if row["regressions"] else ""
+        print(f"{row['case']:<16} {row['size']:<4} " + " ".join(cells) + flag, file=out)
+
+
+# ═══════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="bench.py", description="Shikder Smart Tools — benchmark suite")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("run", help="generate inputs, run every tool path and write a JSON report")
+    p.add_argument("--sizes", nargs="+", choices=list(SIZES), default=["s", "m"])
+    p.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    p.add_argument("--repeat", type=int, default=3, help="runs per case; the report keeps the median wall time")
+    p.add_argument("--data", default=DATA_DIR, help=f"where generated inputs are kept (default: {DATA_DIR})")
+    p.add_argument("--seed", type=int, default=SEED)
+    p.add_argument("-o", "--output", default="bench.json")
+    p = sub.add_parser("compare", help="compare two reports; exit status 1 if anything regressed")
+    p.add_argument("old")
+    p.add_argument("new")
+    p.add_argument("--threshold", type=float, default=0.10, help="relative slowdown that counts (default: 0.10)")
+    p = sub.add_parser("_child")  # run_case এটা দিয়ে আলাদা process-এ একটা case চালায়
+    p.add_argument("argv")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "_child":
+        print(json.dumps(_child(json.loads(args.argv))))
+        return 0
+    if args.cmd == "compare":
+        with open(args.old) as fh:
+            old = json.load(fh)
+        with open(args.new) as fh:
+            new = json.load(fh)
+        rows = compare(old, new, args.threshold)
+        print_comparison(rows)
+        return 1 if any(r["regressions"] for r in rows) else 0
+
+    if args.repeat < 1:
+        ap.error("--repeat must be at least 1")
+
+    def log(e):
+        rss = f"{e['peak_rss_bytes'] / (1 << 20):.1f} MiB" if e["peak_rss_bytes"] is not None else "n/a"
+        print(f"{e['case']:<16} {e['size']:<3} {e['wall_s']:>8.3f} s  {rss:>12}  {e['output_bytes']:>14,} bytes",
+              file=sys.stderr)
+
+    report = run(args.sizes, args.cases, args.repeat, args.data, args.seed, log)
+    with open(args.output, "w") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"{len(report['results'])} results → {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
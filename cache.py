@@ -0,0 +1,176 @@
+# cache.py — parse করা DataFrame-এর in-memory cache আর tool output-এর on-disk cache
+# Streamlit প্রতিটি click / theme / language toggle-এ পুরো script আবার চালায়।
+# Upload-এর content hash + parse option দিয়ে key বানিয়ে parse করা DataFrame রেখে দিই,
+# যাতে "Rows per file" বদলালে বা rerun হলে আবার parse করতে না হয়।
+# একই ক্রমের একই ফাইল + একই option আবার merge করলে আগের output disk থেকে ফেরত আসে।
+# Module-level object, তাই একই process-এর সব rerun আর session এটা share করে।
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+FRAME_CACHE_MB = int(os.environ.get("FRAME_CACHE_MB", "512"))
+RESULT_CACHE_MB = int(os.environ.get("RESULT_CACHE_MB", "1024"))
+RESULT_CACHE_TTL = int(os.environ.get("RESULT_CACHE_TTL", str(24 * 3600)))
+RESULT_CACHE_DIR = os.environ.get("RESULT_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "shikder-results")
+RESULT_VERSION = 4  # output format বদলালে বাড়াও, পুরোনো entry আর মিলবে না
+
+
+def content_hash(f) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    pos = f.tell()
+    f.seek(0)
+    for block in iter(lambda: f.read(1 << 20), b""):
+        h.update(block)
+    f.seek(pos)
+    return h.hexdigest()
+
+
+class FrameCache:
+    # LRU: memory সীমা ছাড়ালে সবচেয়ে পুরোনো ব্যবহার হওয়া frame আগে বাদ পড়ে।
+    # ফেরত দেওয়া DataFrame share করা — caller এটাকে in-place বদলাবে না।
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+        self._items = OrderedDict()  # key → (df, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key, df):
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            return  # একাই পুরো cache-এর চেয়ে বড়: রাখি না
+        with self._lock:
+            if key in self._items:
+                self._bytes -= self._items.pop(key)[1]
+            self._items[key] = (df, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, old) = self._items.popitem(last=False)
+                self._bytes -= old
+
+    def get_or_load(self, key, loader):
+        df = self.get(key)
+        if df is None:
+            df = loader()
+            self.put(key, df)
+        return df
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    @property
+    def used_bytes(self) -> int:
+        return self._bytes
+
+
+def result_key(tool: str, hashes: list, options: dict) -> str:
+    # input-এর ক্রম key-এর অংশ: ⬆/⬇ দিয়ে ক্রম বদলালে অন্য output
+    raw = json.dumps([RESULT_VERSION, tool, hashes, options], sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    # প্রতি entry দুটো file: <key>.bin (output) আর <key>.json (job-এর result)।
+    # mtime = শেষ ব্যবহার; TTL পার হলে বা মোট size সীমা ছাড়ালে পুরোনোটা আগে মোছে।
+    def __init__(self, root: str, max_bytes: int, ttl: int):
+        self.root, self.max_bytes, self.ttl = root, max_bytes, ttl
+        self.hits = self.misses = 0
+        self._lock = threading.Lock()
+
+    def _paths(self, key: str) -> tuple:
+        return os.path.join(self.root, key + ".bin"), os.path.join(self.root, key + ".json")
+
+    def get(self, key: str, out) -> dict:
+        # hit হলে output out-এ copy করে result dict ফেরত দেয়, না হলে None
+        data, meta = self._paths(key)
+        with self._lock:
+            try:
+                if time.time() - os.path.getmtime(meta) > self.ttl:
+                    self._remove(key)
+                    raise FileNotFoundError(meta)
+                with open(meta, encoding="utf-8") as fh:
+                    result = json.load(fh)
+                src = open(data, "rb")
+            except (OSError, ValueError):
+                self.misses += 1
+                return None
+            now = time.time()
+            os.utime(meta, (now, now))
+            os.utime(data, (now, now))
+            self.hits += 1
+        with src:
+            shutil.copyfileobj(src, out, 1 << 20)
+        return result
+
+    def put(self, key: str, src, result: dict):
+        # temp file-এ লিখে os.replace: অন্য session আধা-লেখা entry কখনো দেখে না
+        os.makedirs(self.root, exist_ok=True)
+        data, meta = self._paths(key)
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                src.seek(0)
+                shutil.copyfileobj(src, fh, 1 << 20)
+            fd, tmp_meta = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(result, fh, default=str)
+        except (OSError, TypeError):
+            return  # cache না হলেও কাজ চলবে
+        with self._lock:
+            os.replace(tmp, data)
+            os.replace(tmp_meta, meta)
+            self._evict()
+
+    def _remove(self, key: str):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _evict(self):
+        entries, total, now = [], 0, time.time()
+        for name in os.listdir(self.root):
+            if not name.endswith(".bin"):
+                continue
+            try:
+                st = os.stat(os.path.join(self.root, name))
+            except OSError:
+                continue
+            key = name[:-4]
+            if now - st.st_mtime > self.ttl:
+                self._remove(key)
+                continue
+            entries.append((st.st_mtime, st.st_size, key))
+            total += st.st_size
+        for _, size, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            if os.path.isdir(self.root):
+                shutil.rmtree(self.root, ignore_errors=True)
+
+
+frames = FrameCache(FRAME_CACHE_MB << 20)
+results = ResultCache(RESULT_CACHE_DIR, RESULT_CACHE_MB << 20, RESULT_CACHE_TTL)
@@ -0,0 +1,606 @@
+# csvio.py — সব CSV পড়া এখান দিয়ে: encoding, delimiter, quoting আর দশমিক চিহ্ন ফাইলের শুরুর
+# SNIFF_BYTES দেখে একবার আন্দাজ (sniff), তারপর সেই dialect দিয়েই parse।
+#   * parse: pyarrow থাকলে তার CSV reader (block ভাগ করে একাধিক thread-এ), নাহলে pandas C engine।
+#     pyarrow কিছু মানতে না পারলে (ভুল সংখ্যক field, নাম ছাড়া / একই নামের column, মাঝপথে type বদল)
+#     সেই ফাইল C engine-এ পড়া হয় — ফলাফল একই থাকে, শুধু ধীর।
+#   * pyarrow তারিখ / সময় নিজে থেকে date / timestamp বানায়, pandas লেখা যেমন তেমন রাখে — output-এর
+#     লেখা যাতে না বদলায় সেই column গুলো string হিসেবেই পড়ি। দুই engine-ই float round-trip নিখুঁত পড়ে।
+#   * ধরা dialect ফাইলের size + শুরুর byte-এর hash দিয়ে মনে রাখা হয়: একই ফাইলের পরের pass / rerun-এ
+#     আর sniff হয় না, আর merge-এ আগের ফাইলের dialect মিলে গেলে পরের ফাইল শুধু যাচাই হয়।
+# CSV_ENGINE: auto (pyarrow থাকলে সেটা) / pyarrow / c — CLI --csv-engine এটাই সেট করে।
+import codecs
+import csv
+import hashlib
+import importlib.util
+import io
+import mmap
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
+
+CSV_ENGINES = ("pyarrow", "c")
+SNIFF_BYTES = 64 << 10
+# pyarrow একেক thread-কে যত byte দেয়। streaming reader ~32 block আগাম পড়ে রাখে, তাই chunk ধরে পড়ায়
+# ছোট block (memory ~32 MB-এ বাঁধা); পুরো ফাইল পড়ায় সব block তো memory-তে আসবেই, সেখানে বড়
+STREAM_BLOCK_BYTES = 1 << 20
+BLOCK_BYTES = 4 << 20
+COUNT_BYTES = 16 << 20  # row গোনায় একবারে যত byte দেখি
+DELIMITERS = ",;\t|"
+KNOWN_MAX = 256
+
+_BOMS = ((codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16"))
+_NULLS = sorted(STR_NA_VALUES)
+_COMMA_DECIMAL = re.compile(r"-?\d+,\d+")
+_DOT_DECIMAL = re.compile(r"-?\d+\.\d+")
+_INTEGER = re.compile(r"[+-]?\d+")
+_HEX = re.compile(r"[+-]?0[xX][0-9a-fA-F]+")
+_HEX_BYTES = re.compile(rb"(?<![\w.])[+-]?0[xX][0-9a-fA-F]+(?![\w.])")
+_PLUS_BYTES = re.compile(rb"(?<![\w.+-])\+\d+(?![\w.])")
+_INT64 = (-(1 << 63), (1 << 63) - 1)
+
+_known = OrderedDict()  # (size, head hash) → Dialect
+_lock = threading.Lock()
+
+
+def has_pyarrow() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def csv_engine(engine: str = None) -> str:
+    # engine না দিলে CSV_ENGINE env var (worker process-ও পায়)
+    engine = engine or os.environ.get("CSV_ENGINE", "auto")
+    if engine == "auto":
+        return "pyarrow" if has_pyarrow() else "c"
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"unknown csv engine: {engine!r} (choose from auto, {', '.join(CSV_ENGINES)})")
+    if engine == "pyarrow" and not has_pyarrow():
+        raise ValueError("csv engine 'pyarrow' needs the pyarrow package")
+    return engine
+
+
+class Dialect:
+    def __init__(self, encoding: str = "utf-8", delimiter: str = ",", quotechar: str = '"', doublequote: bool = True,
+                 escapechar: str = None, decimal: str = ".", multiline: bool = False, header: list = None):
+        self.encoding = encoding
+        self.delimiter = delimiter
+        self.quotechar = quotechar
+        self.doublequote = doublequote
+        self.escapechar = escapechar
+        self.decimal = decimal
+        self.multiline = multiline  # sample-এ quote-এর ভেতরে newline দেখা গেছে
+        self.header = header or []
+        self.temporal = []  # sample-এ pyarrow যে column গুলো তারিখ / সময় ভাবে
+        self.literal = False  # int64-এর বাইরের পূর্ণসংখ্যা, "0x1F" বা "+880..." আছে — pyarrow এগুলো float / 31 বানায়
+        self.scanned = False  # sample-এর পরের অংশে hex খোঁজা হয়েছে (pyarrow-এ প্রথম parse-এর আগে একবার)
+
+    @property
+    def is_default(self) -> bool:
+        return (self.encoding in ("utf-8", "utf-8-sig") and self.delimiter == "," and self.quotechar == '"'
+                and self.escapechar is None and self.decimal == ".")
+
+    def describe(self) -> str:
+        parts = [self.encoding, "tab" if self.delimiter == "\t" else repr(self.delimiter)]
+        if self.quotechar != '"':
+            parts.append(f"quote {self.quotechar!r}")
+        if self.escapechar:
+            parts.append(f"escape {self.escapechar!r}")
+        if self.decimal != ".":
+            parts.append(f"decimal {self.decimal!r}")
+        return " · ".join(parts)
+
+    def to_dict(self) -> dict:
+        return {"encoding": self.encoding, "delimiter": self.delimiter, "quotechar": self.quotechar,
+                "doublequote": self.doublequote, "escapechar": self.escapechar, "decimal": self.decimal}
+
+    def kwargs(self) -> dict:
+        # pandas read_csv-এর জন্য
+        return {"encoding": self.encoding, "sep": self.delimiter, "quotechar": self.quotechar,
+                "doublequote": self.doublequote, "escapechar": self.escapechar, "decimal": self.decimal}
+
+    def arrow_options(self, column_types: dict = None, block_size: int = BLOCK_BYTES) -> tuple:
+        import pyarrow as pa
+        import pyarrow.csv as pc
+
+        types = {c: pa.string() for c in self.temporal}
+        types.update(column_types or {})
+        read = pc.ReadOptions(use_threads=True, block_size=block_size,
+                              encoding="utf8" if self.encoding in ("utf-8", "utf-8-sig") else self.encoding)
+        parse = pc.ParseOptions(delimiter=self.delimiter, quote_char=self.quotechar, double_quote=self.doublequote,
+                                escape_char=self.escapechar or False, newlines_in_values=self.multiline)
+        convert = pc.ConvertOptions(column_types=types, null_values=_NULLS, strings_can_be_null=True,
+                                    quoted_strings_can_be_null=True, decimal_point=self.decimal)
+        return read, parse, convert
+
+    @property
+    def arrow_safe(self) -> bool:
+        # pandas নাম ছাড়া column-কে "Unnamed: 2", একই নামকে "a.1" বানায় — pyarrow পারে না; আর literal
+        # column-এ pandas লেখা / uint64 যেমন তেমন রাখে, pyarrow মান বদলায়
+        return (bool(self.header) and all(self.header) and len(set(self.header)) == len(self.header)
+                and not self.literal)
+
+
+# ---------- sniff ----------
+def _head(f) -> bytes:
+    pos = f.tell()
+    try:
+        f.seek(0)
+        return f.read(SNIFF_BYTES)
+    finally:
+        f.seek(pos)
+
+
+def _encoding(head: bytes) -> str:
+    for bom, name in _BOMS:
+        if head.startswith(bom):
+            return name
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)  # শেষে কাটা multi-byte অক্ষর চলবে
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    try:
+        head.decode("cp1252")  # Windows / Excel-এর "CSV" export
+        return "cp1252"
+    except UnicodeDecodeError:
+        return "latin-1"  # যেকোনো byte চলে
+
+
+def _text(head: bytes, encoding: str, complete: bool) -> str:
+    text = codecs.getincrementaldecoder(encoding)(errors="replace").decode(head, final=complete)
+    # শেষ লাইনটা অর্ধেক হতে পারে
+    return text if complete else text[:text.rfind("\n") + 1] or text
+
+
+def _rows(text: str, delimiter: str, quotechar: str, escapechar: str = None) -> list:
+    try:
+        return [r for r in csv.reader(io.StringIO(text), delimiter=delimiter, quotechar=quotechar,
+                                      escapechar=escapechar) if r]
+    except csv.Error:
+        return []
+
+
+def _score(rows: list) -> tuple:
+    # header-এর যত field, ততগুলো field-এর row কত ভাগ — তারপর field সংখ্যা
+    if len(rows) < 1 or len(rows[0]) < 2:
+        return (0.0, 0)
+    width = len(rows[0])
+    body = rows[1:] or rows
+    return (sum(len(r) == width for r in body) / len(body), width)
+
+
+def _quoting(text: str, delimiter: str) -> tuple:
+    # (quotechar, doublequote, escapechar)। csv.Sniffer quote চিনতে ভালো, delimiter-এ নয়
+    quotechar = '"'
+    if '"' not in text:
+        try:
+            guess = csv.Sniffer().sniff(text, delimiters=delimiter)
+            quotechar = guess.quotechar if guess.quotechar == "'" else '"'
+        except csv.Error:
+            pass
+    escaped = re.search(rf"\\{re.escape(quotechar)}[^{re.escape(delimiter)}\n]", text) is not None
+    doubled = (quotechar * 2) in text
+    if escaped and not doubled:
+        return quotechar, False, "\\"
+    return quotechar, True, None
+
+
+def _decimal(rows: list, delimiter: str) -> str:
+    # ";"-দিয়ে ভাগ করা ইউরোপীয় export-এ দশমিক প্রায়ই ","। অন্তত একটা column-এর সব মান "1,5" ধরনের,
+    # আর কোথাও "1.5" নেই — তবেই ","
+    if delimiter == "," or len(rows) < 2:
+        return "."
+    body = rows[1:]
+    width = len(rows[0])
+    cells = [[r[i].strip() for r in body if i < len(r) and r[i].strip()] for i in range(width)]
+    if any(_DOT_DECIMAL.fullmatch(v) for col in cells for v in col):
+        return "."
+    if any(col and all(_COMMA_DECIMAL.fullmatch(v) for v in col) for col in cells):
+        return ","
+    return "."
+
+
+def _literal(rows: list) -> bool:
+    # sample-এ hex লেখা, "+" চিহ্নসহ বা int64-এ না ধরা পূর্ণসংখ্যা
+    for r in rows[1:]:
+        for v in r:
+            v = v.strip()
+            if _HEX.fullmatch(v) or _INTEGER.fullmatch(v) and (
+                    v.startswith("+") or not _INT64[0] <= int(v) <= _INT64[1]):
+                return True
+    return False
+
+
+def _has_literal(f) -> bool:
+    # hex: pyarrow int column-এ "0x1F"-কে চুপচাপ 31 পড়ে; "+8801712345678"-কে double (…678.0, বড় হলে
+    # precision হারায়), pandas দুটোই ঠিক int রাখে — তাই পুরো ফাইলে খুঁজি। আগে শুধু b"0x" / b"+"
+    # (memchr-এর গতিতে), পেলে সেই block-এ regex। int64-এর বাইরের সংখ্যা _check_literal ধরে
+    buf = _buffer(f)
+    pos = f.tell()
+    try:
+        if buf is not None:
+            view = memoryview(buf)
+            blocks = (view[i:i + COUNT_BYTES + 64].tobytes() for i in range(0, len(view), COUNT_BYTES))
+        else:
+            f.seek(0)
+            blocks = iter(lambda: f.read(COUNT_BYTES), b"")
+        for block in blocks:
+            if (b"0x" in block or b"0X" in block) and _HEX_BYTES.search(block):
+                return True
+            if b"+" in block and _PLUS_BYTES.search(block):
+                return True
+        return False
+    finally:
+        f.seek(pos)
+        if buf is not None:
+            view.release()
+            buf.close() if isinstance(buf, mmap.mmap) else buf.release()
+
+
+def _temporal(text: str, d: Dialect) -> list:
+    # sample-টা (পুরো লাইন পর্যন্ত, UTF-8-এ) pyarrow-কে দিয়ে দেখি কোন column-কে সে date / timestamp / time ভাবে
+    if csv_engine() != "pyarrow" or not d.arrow_safe:
+        return []
+    import pyarrow as pa
+    import pyarrow.csv as pc
+
+    try:
+        _, parse, convert = d.arrow_options()
+        schema = pc.read_csv(io.BytesIO(text.encode("utf-8")), parse_options=parse, convert_options=convert).schema
+    except (pa.ArrowException, ValueError):
+        return []
+    return _temporal_columns(schema)
+
+
+def _temporal_columns(schema) -> list:
+    import pyarrow as pa
+
+    return [f.name for f in schema if pa.types.is_temporal(f.type)]
+
+
+def _detect(head: bytes, complete: bool) -> Dialect:
+    encoding = _encoding(head)
+    text = _text(head, encoding, complete)
+    if text.startswith("\ufeff"):
+        text = text[1:]
+    best, score, rows = ",", (0.0, 0), None
+    for delimiter in DELIMITERS:
+        found = _rows(text, delimiter, '"')
+        s = _score(found)
+        if s > score:
+            best, score, rows = delimiter, s, found
+    quotechar, doublequote, escapechar = _quoting(text, best)
+    if quotechar != '"' or escapechar:
+        rows = _rows(text, best, quotechar, escapechar)
+    rows = rows or _rows(text, best, quotechar, escapechar)
+    multiline = any("\n" in v or "\r" in v for r in rows for v in r)
+    d = Dialect(encoding, best, quotechar, doublequote, escapechar, _decimal(rows, best), multiline,
+                rows[0] if rows else [])
+    d.literal = _literal(rows)
+    d.temporal = _temporal(text, d)
+    return d
+
+
+def _fits(d: Dialect, head: bytes, complete: bool) -> bool:
+    # আগের ফাইলের dialect এই ফাইলেও চলে কিনা: decode হয়, আর header-এর field সংখ্যায় row গুলো মেলে
+    try:
+        text = codecs.getincrementaldecoder(d.encoding)().decode(head, final=complete)
+    except UnicodeDecodeError:
+        return False
+    text = text if complete else text[:text.rfind("\n") + 1]
+    rows = _rows(text.lstrip("\ufeff"), d.delimiter, d.quotechar, d.escapechar)
+    return bool(rows) and (_score(rows)[0] >= 0.9 or len(rows[0]) == len(d.header) == 1)
+
+
+def sniff(f, hint: Dialect = None) -> Dialect:
+    # f-এর অবস্থান বদলায় না। আগে দেখা ফাইল হলে মনে রাখা dialect; hint মিলে গেলে সেটাই (header নতুন)
+    head = _head(f)
+    from stages import size_of
+
+    key = (size_of(f), hashlib.blake2b(head, digest_size=16).hexdigest())
+    with _lock:
+        if key in _known:
+            _known.move_to_end(key)
+            return _known[key]
+    complete = len(head) < SNIFF_BYTES
+    if hint is not None and _fits(hint, head, complete):
+        text = _text(head, hint.encoding, complete).lstrip("\ufeff")
+        rows = _rows(text, hint.delimiter, hint.quotechar, hint.escapechar)
+        d = Dialect(**hint.to_dict(), multiline=any("\n" in v for r in rows for v in r), header=rows[0])
+        d.literal = _literal(rows)
+        d.temporal = _temporal(text, d)
+    else:
+        d = _detect(head, complete)
+    remember(f, d, key)
+    return d
+
+
+def remember(f, d: Dialect, key: tuple = None):
+    if key is None:
+        from stages import size_of
+        key = (size_of(f), hashlib.blake2b(_head(f), digest_size=16).hexdigest())
+    with _lock:
+        _known[key] = d
+        _known.move_to_end(key)
+        while len(_known) > KNOWN_MAX:
+            _known.popitem(last=False)
+
+
+def sniff_all(files: list) -> list:
+    # merge-এর জন্য: প্রতিটি ফাইল আগেরটার dialect hint হিসেবে পায়
+    out, hint = [], None
+    for f in files:
+        hint = sniff(f, hint)
+        out.append(hint)
+    return out
+
+
+# ---------- parse ----------
+class _Retry(Exception):
+    # "encoding": string column-এ অবৈধ byte; "temporal": sample-এর পরে তারিখের column (columns-এ নাম)।
+    # দুটোতেই dialect ঠিক করে pyarrow-এই আবার। "literal": sample-এর পরে int64-এর বাইরের পূর্ণসংখ্যা —
+    # সেই ফাইল C engine-এ
+    def __init__(self, reason: str, columns: list = ()):
+        super().__init__(reason)
+        self.reason = reason
+        self.columns = list(columns)
+
+
+def _arrow_frame(table, start: int = 0) -> pd.DataFrame:
+    import pyarrow as pa
+
+    if any(pa.types.is_binary(t) or pa.types.is_large_binary(t) for t in table.schema.types):
+        # string column-এ অবৈধ UTF-8 — encoding ভুল ধরা হয়েছিল
+        raise _Retry("encoding")
+    if _temporal_columns(table.schema):
+        raise _Retry("temporal", _temporal_columns(table.schema))
+    _check_literal(table)
+    df = table.to_pandas()
+    for name, t in zip(table.column_names, table.schema.types):
+        if pa.types.is_null(t) and table.num_rows:
+            # pandas-এর মতো: পুরো খালি column float, কিন্তু row-ই না থাকলে (শুধু header) object
+            df[name] = df[name].astype("float64")
+    df.index = pd.RangeIndex(start, start + len(df))
+    return df
+
+
+def _wide_ints(col) -> bool:
+    import pyarrow.compute as pac
+
+    top = pac.max(pac.abs(col)).as_py()
+    return top is not None and top >= 2.0 ** 63 and pac.all(pac.equal(pac.floor(col), col)).as_py()
+
+
+def _check_literal(data):
+    # pyarrow int64-এ না ধরা পূর্ণসংখ্যাকে double বানায় (12345678901234567890 → 1.2345678901234567e+19);
+    # pandas সেগুলো uint64 / লেখা হিসেবে ঠিক রাখে। data: Table বা RecordBatch
+    import pyarrow as pa
+
+    if any(_wide_ints(data.column(i)) for i, t in enumerate(data.schema.types) if pa.types.is_floating(t)):
+        raise _Retry("literal")
+
+
+def _float_types(dtype) -> dict:
+    # শুধু {"col": "float64"} ধরনের dtype pyarrow-এ যায় (merge-এর দ্বিতীয় pass); বাকি সব C engine
+    import pyarrow as pa
+
+    if not dtype:
+        return {}
+    if isinstance(dtype, dict) and all(str(v) == "float64" for v in dtype.values()):
+        return {c: pa.float64() for c in dtype}
+    return None
+
+
+def _use_arrow(f, d: Dialect, engine: str, kwargs: dict, dtype) -> bool:
+    if not (csv_engine(engine) == "pyarrow" and d.arrow_safe and not kwargs and _float_types(dtype) is not None):
+        return False
+    if not d.scanned:
+        # sniff (UI-র upload preview) পুরো ফাইল ছোঁয় না; এখানে, parse-এর আগে একবার
+        d.literal, d.scanned = _has_literal(f), True
+    return not d.literal
+
+
+def _c_kwargs(d: Dialect, dtype, kwargs: dict) -> dict:
+    return {**d.kwargs(), "float_precision": "round_trip", **({"dtype": dtype} if dtype else {}), **kwargs}
+
+
+def _recover(f, d: Dialect, e: Exception) -> Dialect:
+    # ভুল ধরা পড়লে নতুন dialect, আর সেটাই মনে রাখি (পরের pass / rerun আবার ভুল করে না):
+    # encoding → cp1252 (utf-8 sample-এর পরে Windows অক্ষর), তারপর latin-1; তারিখ column → string
+    fixed = Dialect(**d.to_dict(), multiline=d.multiline, header=d.header)
+    fixed.temporal = list(d.temporal)
+    fixed.literal, fixed.scanned = d.literal, d.scanned
+    if isinstance(e, UnicodeDecodeError) or getattr(e, "reason", None) == "encoding":
+        fixed.encoding = "cp1252" if d.encoding != "cp1252" else "latin-1"
+    elif getattr(e, "reason", None) == "temporal":
+        fixed.temporal += [c for c in e.columns if c not in fixed.temporal]
+    elif getattr(e, "reason", None) == "literal":
+        fixed.literal = True
+    else:
+        return d
+    remember(f, fixed)
+    return fixed
+
+
+def read(f, dialect: Dialect = None, stats: list = None, engine: str = None, dtype=None, **kwargs) -> pd.DataFrame:
+    # পুরো ফাইল একটা DataFrame-এ। kwargs (nrows, usecols ...) দিলে C engine
+    d = dialect or sniff(f)
+    t0 = time.perf_counter()
+    used = "pyarrow"
+    df = None
+    tries = 3 if _use_arrow(f, d, engine, kwargs, dtype) else 0
+    for _ in range(tries):
+        import pyarrow.csv as pc
+
+        read_, parse, convert = d.arrow_options(_float_types(dtype))
+        try:
+            df = _arrow_frame(pc.read_csv(f, read_options=read_, parse_options=parse, convert_options=convert))
+            break
+        except _errors() as e:
+            d = _recover(f, d, e)
+            f.seek(0)
+            if not d.arrow_safe or not isinstance(e, _Retry):
+                break  # pyarrow এই ফাইল পারে না (ভুল সংখ্যক field, বড় পূর্ণসংখ্যা ইত্যাদি)
+    if df is None:
+        used = "pandas-c"
+        for attempt in range(2):
+            try:
+                df = pd.read_csv(f, **_c_kwargs(d, dtype, kwargs))
+                break
+            except UnicodeDecodeError as e:
+                if attempt:
+                    raise
+                d = _recover(f, d, e)
+                f.seek(0)
+    if stats is not None:
+        stats.append({"engine": used, "rows": len(df), "seconds": time.perf_counter() - t0})
+    return df
+
+
+def _arrow_chunks(f, d: Dialect, chunksize: int, dtype, state: dict):
+    # pyarrow-এর streaming reader-এর batch গুলো ঠিক chunksize row-এর frame-এ কেটে
+    import pyarrow as pa
+    import pyarrow.csv as pc
+
+    read_, parse, convert = d.arrow_options(_float_types(dtype), STREAM_BLOCK_BYTES)
+    reader = pc.open_csv(f, read_options=read_, parse_options=parse, convert_options=convert)
+    if _temporal_columns(reader.schema):
+        raise _Retry("temporal", _temporal_columns(reader.schema))
+    pending, n = [], 0
+    for batch in reader:
+        # column-এর type প্রথম block দেখে ঠিক হয়, তাই chunk কাটার আগেই পুরো batch দেখি
+        _check_literal(batch)
+        pending.append(batch)
+        n += batch.num_rows
+        while n >= chunksize:
+            table = pa.Table.from_batches(pending)
+            yield _arrow_frame(table.slice(0, chunksize), state["rows"])
+            rest = table.slice(chunksize)
+            pending, n = rest.to_batches(), rest.num_rows
+    if n or not state["rows"]:
+        yield _arrow_frame(pa.Table.from_batches(pending, schema=reader.schema), state["rows"])
+
+
+def _c_chunks(f, d: Dialect, chunksize: int, dtype, skip: int):
+    # skip: আগেই দেওয়া row (সবসময় chunksize-এর গুণিতক, তাই পুরো chunk বাদ দিলেই হয়, index-ও মেলে)
+    f.seek(0)
+    for chunk in pd.read_csv(f, chunksize=chunksize, **_c_kwargs(d, dtype, {})):
+        if skip >= len(chunk) and skip:
+            skip -= len(chunk)
+            continue
+        yield chunk
+
+
+def _errors() -> tuple:
+    errors = (_Retry, UnicodeDecodeError)
+    if has_pyarrow():
+        import pyarrow as pa
+        errors += (pa.ArrowException,)
+    return errors
+
+
+def chunks(f, chunksize: int, dialect: Dialect = None, dtype=None, stats: list = None, engine: str = None):
+    # pd.read_csv(chunksize=...)-এর মতো: ঠিক chunksize row-এর frame, index চলমান।
+    # pyarrow মাঝপথে থেমে গেলে (পরের block-এ int column-এ দশমিক ইত্যাদি) C engine-এ ফাইলটা আবার
+    # খুলি আর আগে দেওয়া row গুলো বাদ দিয়ে চালিয়ে যাই — chunk-এর সীমা একই থাকে।
+    # C engine-এ encoding ভুল ধরা পড়লে একবার cp1252 ধরে একইভাবে আবার।
+    d = dialect or sniff(f)
+    state = {"rows": 0}
+    used = "pyarrow" if _use_arrow(f, d, engine, {}, dtype) else "pandas-c"
+    recoded = False
+    retries = 2  # pyarrow-এ আবার চেষ্টা (dialect ঠিক করে)
+    secs = 0.0
+    while True:
+        if used == "pyarrow":
+            it = _arrow_chunks(f, d, chunksize, dtype, state)
+        else:
+            it = _c_chunks(f, d, chunksize, dtype, state["rows"])
+        try:
+            while True:
+                t0 = time.perf_counter()
+                chunk = next(it, None)
+                secs += time.perf_counter() - t0
+                if chunk is None:
+                    break
+                state["rows"] += len(chunk)
+                yield chunk
+            break
+        except _errors() as e:
+            if used == "pandas-c":
+                if recoded or not isinstance(e, UnicodeDecodeError):
+                    raise
+                recoded = True
+            retries -= 1
+            d = _recover(f, d, e)
+            if used == "pyarrow" and not (isinstance(e, _Retry) and retries >= 0 and not state["rows"]
+                                          and d.arrow_safe):
+                used = "pandas-c"  # কিছু row দেওয়া হয়ে গেছে, বা pyarrow এই ফাইল পারে না
+            f.seek(0)
+    if stats is not None:
+        stats.append({"engine": used, "rows": state["rows"], "seconds": secs})
+
+
+def columns(f, dialect: Dialect = None) -> list:
+    # শুধু header, pandas যে নাম দিত সেভাবে ("Unnamed: 2", "a.1"); f-এর অবস্থান বদলায় না
+    d = dialect or sniff(f)
+    pos = f.tell()
+    try:
+        f.seek(0)
+        return list(pd.read_csv(f, nrows=0, **d.kwargs()).columns)
+    finally:
+        f.seek(pos)
+
+
+# ---------- probe ----------
+def _buffer(f):
+    # ফাইলের সব byte copy ছাড়া: disk-এর ফাইল mmap, upload (BytesIO) তার নিজের buffer; নাহলে None
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        pass
+    try:
+        return f.getbuffer()
+    except (AttributeError, BufferError):
+        return None
+
+
+def _newlines(f) -> tuple:
+    # (b"\n" কতবার, শেষের দুই byte)
+    buf = _buffer(f)
+    if buf is None:
+        lines, last = 0, b""
+        f.seek(0)
+        while block := f.read(COUNT_BYTES):
+            lines += block.count(b"\n")
+            last = (last + block)[-2:]
+        return lines, last
+    try:
+        view = memoryview(buf)
+        lines = sum(view[i:i + COUNT_BYTES].tobytes().count(b"\n") for i in range(0, len(view), COUNT_BYTES))
+        last = view[-2:].tobytes()
+        view.release()
+        return lines, last
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+        else:
+            buf.release()
+
+
+def count_rows(f, dialect: Dialect = None) -> tuple:
+    # (row, exact) — parse ছাড়া শুধু newline গুনে, header বাদে। quote-এর ভেতরে newline থাকলে বা UTF-16
+    # হলে আন্দাজ (exact=False); খালি লাইন pandas বাদ দেয়, সেগুলোও গোনায় আসে। f-এর অবস্থান বদলায় না
+    d = dialect or sniff(f)
+    wide = d.encoding.startswith("utf-16")  # সেখানে "\n" দুই byte, শেষ byte-টা 0 হতে পারে
+    pos = f.tell()
+    try:
+        lines, last = _newlines(f)
+    finally:
+        f.seek(pos)
+    if last and not (last.endswith(b"\n") or wide and b"\n" in last):
+        lines += 1  # শেষ লাইনের পরে newline নেই
+    return max(0, lines - 1), not d.multiline and not wide
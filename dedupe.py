@@ -0,0 +1,167 @@
+# dedupe.py — merge-এর সময় সব ফাইল জুড়ে duplicate row বাদ দেওয়া, memory সীমার মধ্যে
+# pd.concat-এর পর drop_duplicates করলে পুরো merged frame আর তার hash দুটোই memory-তে থাকে।
+# এখানে chunk ধরে প্রতিটি row (বা শুধু key column গুলো)-র 64-bit hash নিই, আর আগে দেখা hash গুলো
+# রাখি sorted numpy uint64 array-তে — row প্রতি 8 byte (Python set-এ ~70 byte)।
+# Array DEDUP_MEMORY_MB ছাড়ালে sorted run হিসেবে SPILL_DIR-এ লেখা হয়, পরে mmap করে binary search —
+# OS-এর page cache যতটা পারে রাখে, process-এর memory বাড়ে না।
+# প্রথমবার দেখা row থাকে (drop_duplicates(keep="first")-এর মতো), row-এর ক্রম বদলায় না।
+# 64-bit hash: 10 কোটি row-তে ভুল করে একটা row বাদ পড়ার সম্ভাবনা ~0.03%।
+import os
+import tempfile
+import weakref
+
+import numpy as np
+import pandas as pd
+from pandas.util import hash_pandas_object
+
+import stages
+from spill import SPILL_DIR
+
+DEDUP_MEMORY_MB = int(os.environ.get("DEDUP_MEMORY_MB", "64"))
+
+_MISSING = np.uint64(2 ** 64 - 1)  # object column-এ খালি ঘরের hash; numeric খালি ঘরও তাই, যাতে মেলে
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _int_hash(values: np.ndarray) -> np.ndarray:
+    return hash_pandas_object(pd.Series(values, copy=False), index=False).to_numpy()
+
+
+def _column_hash(s: pd.Series) -> np.ndarray:
+    if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+        # integer ঠিক int64 হিসেবে (float64-এ 2^53-এর উপরের আলাদা ID এক হয়ে যেত)। এক ফাইলে int,
+        # অন্যটায় (খালি ঘরের জন্য) float — তাই পূর্ণসংখ্যা float-ও একই int hash পায়: 1 আর 1.0 একই row
+        na = s.isna().to_numpy()
+        if pd.api.types.is_integer_dtype(s):
+            kind = "uint64" if pd.api.types.is_unsigned_integer_dtype(s) else "int64"
+            h = _int_hash(s.to_numpy(dtype=kind, na_value=0))
+        else:
+            f = s.to_numpy(dtype="float64", na_value=np.nan)
+            with np.errstate(invalid="ignore"):
+                whole = np.isfinite(f) & (np.floor(f) == f) & (f >= -2.0 ** 63) & (f < 2.0 ** 63)
+            h = _int_hash(np.where(whole, f, 0).astype("int64"))
+            if not whole.all():
+                h = np.where(whole, h, hash_pandas_object(pd.Series(f, copy=False), index=False).to_numpy())
+        return np.where(na, _MISSING, h)
+    return hash_pandas_object(s, index=False).to_numpy()
+
+
+def row_hashes(df: pd.DataFrame, keys: list = None) -> np.ndarray:
+    # column-এর ক্রম ধরে hash মেশাই; merge-এ সব chunk আগেই প্রথম ফাইলের column ক্রমে সাজানো
+    h = np.zeros(len(df), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for c in keys or df.columns:
+            h = (h * _MIX) ^ _column_hash(df[c])
+    return h
+
+
+def _contains(sorted_: np.ndarray, values: np.ndarray) -> np.ndarray:
+    if not len(sorted_):
+        return np.zeros(len(values), dtype=bool)
+    idx = np.searchsorted(sorted_, values)
+    return sorted_[np.minimum(idx, len(sorted_) - 1)] == values
+
+
+def _cleanup(state: dict):
+    for path in state["paths"]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    state["paths"] = []
+
+
+class HashSet:
+    # uint64-এর set: memory-তে একটা sorted array, সীমা ছাড়ালে disk-এ sorted run (mmap)
+    def __init__(self, limit_mb: int = DEDUP_MEMORY_MB):
+        self.limit = limit_mb << 20
+        self.spilled_runs = 0
+        self.spilled_bytes = 0
+        self._mem = np.empty(0, dtype=np.uint64)
+        self._runs = []
+        self._state = {"paths": []}
+        self._finalizer = weakref.finalize(self, _cleanup, self._state)
+
+    def __len__(self) -> int:
+        return len(self._mem) + sum(len(r) for r in self._runs)
+
+    def add(self, hashes: np.ndarray) -> np.ndarray:
+        # mask ফেরত: True মানে এই hash আগে দেখা হয়নি (chunk-এর ভেতরে প্রথমবারটাই True)
+        uniq, first = np.unique(hashes, return_index=True)
+        fresh = ~_contains(self._mem, uniq)
+        for run in self._runs:
+            fresh[fresh] = ~_contains(run, uniq[fresh])
+        mask = np.zeros(len(hashes), dtype=bool)
+        mask[first[fresh]] = True
+        new = uniq[fresh]
+        if len(new):
+            self._mem = np.insert(self._mem, np.searchsorted(self._mem, new), new)
+            if self._mem.nbytes > self.limit:
+                self._spill()
+        return mask
+
+    def _spill(self):
+        os.makedirs(SPILL_DIR, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix="dedup-", suffix=".npy", dir=SPILL_DIR)
+        self._state["paths"].append(path)
+        with os.fdopen(fd, "wb") as fh:
+            np.save(fh, self._mem)
+        self.spilled_runs += 1
+        self.spilled_bytes += self._mem.nbytes
+        self._runs.append(np.load(path, mmap_mode="r"))
+        self._mem = np.empty(0, dtype=np.uint64)
+
+    def close(self):
+        self._runs = []
+        self._mem = np.empty(0, dtype=np.uint64)
+        self._finalizer()
+
+
+class RowFilter:
+    # merge-এর chunk stream থেকে duplicate row বাদ দেয়। keys দিলে শুধু সেই column গুলো মিললেই duplicate।
+    # শেষে report() → কত row দেখা হলো, কত বাদ গেল, disk-এ কত গেল
+    def __init__(self, keys: list = None, limit_mb: int = DEDUP_MEMORY_MB):
+        self.keys = list(keys) if keys else None
+        self.rows = 0
+        self.dropped = 0
+        self._seen = HashSet(limit_mb)
+
+    def __call__(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        if self.keys:
+            missing = [k for k in self.keys if k not in chunk.columns]
+            if missing:
+                raise ValueError(f"dedupe key column(s) not found: {', '.join(map(str, missing))}")
+        mask = self._seen.add(row_hashes(chunk, self.keys))
+        kept = int(mask.sum())
+        self.rows += len(chunk)
+        self.dropped += len(chunk) - kept
+        return chunk if kept == len(chunk) else chunk[mask]
+
+    def filter(self, chunks, trace=None):
+        # পুরো chunk বাদ গেলে কিছুই yield করি না (শুধু একদম প্রথম chunk, যাতে header লেখা হয়)
+        first = True
+        for chunk in chunks:
+            with stages.stage(trace, "dedupe"):
+                kept = self(chunk)
+            if len(kept) or first:
+                yield kept
+            first = False
+
+    def report(self) -> dict:
+        return {"rows": self.rows, "dropped": self.dropped, "kept": self.rows - self.dropped,
+                "keys": self.keys, "spilled_runs": self._seen.spilled_runs, "spilled_bytes": self._seen.spilled_bytes}
+
+    def close(self):
+        self._seen.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def apply(rows: RowFilter, chunks, trace=None):
+    # rows=None হলে chunk যেমন আছে তেমনই (engine-এর dedup=None পথ)
+    return rows.filter(chunks, trace) if rows is not None else chunks
@@ -0,0 +1,981 @@
+# engine.py — Shikder Smart Tools-এর headless engine
+# Streamlit ছাড়াই সব tool চালানো যায়: অন্য module থেকে import করে, অথবা CLI দিয়ে —
+#   python engine.py pdf invoices/ -o merged.pdf
+#   python engine.py split big.csv --rows 1000 -o split_files.zip
+#   python engine.py convert sales.xlsx -o sales.parquet
+import argparse
+import heapq
+import io
+import multiprocessing
+import os
+import re
+import sys
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack, contextmanager, nullcontext
+
+import pandas as pd
+
+import archive
+import csvio
+import dedupe
+import partition
+import progress
+import readers
+import schema
+import stages
+import writers
+
+CSV_CHUNK_ROWS = 100_000  # streaming merge: প্রতি chunk-এ কত row memory-তে থাকবে
+MAX_WORKERS = os.cpu_count() or 1  # process pool-এর উপরের সীমা
+
+# প্রতিটি tool কোন extension-এর ফাইল নেয় (CLI-তে folder দিলে এগুলো খোঁজা হয়)
+COLUMNAR_INPUTS = tuple(f".{e}" for e in readers.COLUMNAR_EXTS)
+TOOL_INPUTS = {
+    "pdf":     (".pdf",),
+    "excel":   (".xlsx",) + COLUMNAR_INPUTS,
+    "csv":     (".csv",) + COLUMNAR_INPUTS,
+    "e2c":     (".xlsx",),
+    "c2e":     (".csv",) + COLUMNAR_INPUTS,
+    "split":   (".csv", ".xlsx") + COLUMNAR_INPUTS,
+    "convert": (".csv", ".xlsx") + COLUMNAR_INPUTS,
+}
+
+
+# ═══════════════════════════════════════════════════════
+# READ / WRITE
+# ═══════════════════════════════════════════════════════
+
+def file_ext(name: str) -> str:
+    return os.path.splitext(name)[1].lower().lstrip(".")
+
+
+def input_ext(f, default: str) -> str:
+    # merge-এ একেক ফাইল একেক format হতে পারে; নাম না থাকলে (BytesIO) tool-এর default
+    return file_ext(getattr(f, "name", "") or "") or default
+
+
+def read_table(f, ext: str, stats: list = None, compact: bool = False, mem: dict = None) -> pd.DataFrame:
+    # stats দিলে xlsx reader কোন engine-এ কত row/sec পড়ল তা যোগ করে (readers.throughput)।
+    # compact হলে schema.py-এর ছোট dtype; mem দিলে frame-এর memory সেখানে যোগ হয়
+    if ext == "xlsx" or ext in readers.COLUMNAR_EXTS:
+        df = readers.read_xlsx(f, stats=stats) if ext == "xlsx" else readers.read_columnar(f, ext)
+        if compact:
+            return schema.compact(df, mem)
+    elif compact:
+        sample = schema.sample_csv(f)
+        types = schema.infer([sample])
+        return schema.read_csv(f, types, mem, schema.ratio([sample], types))
+    else:
+        df = csvio.read(f, stats=stats)
+    if mem is not None:
+        mem["frames"] = mem.get("frames", 0) + schema.frame_bytes([df])
+    return df
+
+
+def measured(mem: dict):
+    # mem দিলে ভেতরের কাজের peak memory মাপি, না দিলে কিছুই না
+    return schema.measure(mem) if mem is not None else nullcontext()
+
+
+def write_table(df: pd.DataFrame, out, ext: str):
+    if ext == "xlsx":
+        writers.write_xlsx(writers.frame_chunks(df), out)
+    elif ext in ("parquet", "feather"):
+        writers.write_columnar(writers.frame_chunks(df, writers.ROW_GROUP_ROWS), out, ext)
+    else:
+        df.to_csv(out, index=False)
+
+
+# ═══════════════════════════════════════════════════════
+# TOOLS
+# ═══════════════════════════════════════════════════════
+# সব tool file-like object নেয় (Streamlit UploadedFile বা open(path, "rb")),
+# out-এ লেখে, আর on_file(i, total) / on_part(i, total) দিয়ে progress জানায়।
+
+class _ByteCounter(io.RawIOBase):
+    # কিছু জমা রাখে না, শুধু কত byte লেখা হলো গোনে (PdfWriter tell() চায়)
+    def __init__(self):
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self.size += len(b)
+        return len(b)
+
+    def tell(self) -> int:
+        return self.size
+
+
+def merge_pdfs(files: list, out, on_file=None, dedupe: bool = False, sizes: dict = None, trace=None,
+               measure: bool = False) -> int:
+    # trace দিলে (stages.Trace) প্রতিটি ধাপের সময় / memory / byte সেখানে যায়।
+    # sizes দিলে {"inputs", "after"}: ইনপুট ফাইলগুলোর মোট byte আর output-এর byte। dedupe ছাড়া output কত হতো
+    # ("before") শুধু measure হলে (CLI / bench) — তার জন্য পুরো merged PDF একবার বাড়তি serialise হয়।
+    # pypdf শুধু এখানে লাগে, তাই অন্য tool খুললে import হয় না
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    if sizes is not None:
+        sizes["inputs"] = sum(stages.size_of(f) for f in files)
+    for i, f in enumerate(files, 1):
+        if on_file:
+            on_file(i, len(files))
+        with stages.stage(trace, "parse", stages.size_of(f)):
+            for page in PdfReader(f).pages:
+                writer.add_page(page)
+    if dedupe:
+        # একই font / image / object একাধিক ইনপুটে থাকলে একবারই লেখা হয়,
+        # আর page-এর content stream গুলো deflate হয়
+        with stages.stage(trace, "dedupe"):
+            if sizes is not None and measure:
+                counter = _ByteCounter()
+                writer.write(counter)
+                sizes["before"] = counter.size
+            for page in writer.pages:
+                page.compress_content_streams()
+            writer.compress_identical_objects()
+    start = out.tell()
+    with stages.stage(trace, "write", out=out):
+        writer.write(out)
+    if sizes is not None:
+        sizes["after"] = out.tell() - start
+        if not dedupe:
+            sizes["before"] = sizes["after"]
+    return len(writer.pages)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def process_pool() -> ProcessPoolExecutor:
+    # process-এর সব job একটাই pool share করে — MAX_WORKERS টা process, প্রথম দরকারে তৈরি। প্রতি job-এ
+    # নতুন pool মানে প্রতিবার interpreter চালু আর pandas import, আর একসাথে কয়েকটা job চললে core-এর
+    # চেয়ে বেশি process। spawn: Streamlit server-এর thread চলা অবস্থায় fork করা নিরাপদ নয়
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+@contextmanager
+def pooled():
+    # shared pool-এ submit(fn, *args)। বের হওয়ার সময় (শেষ, error বা job cancel) এখনো শুরু না হওয়া কাজ
+    # বাতিল হয়; কোনো worker মরে গেলে (BrokenProcessPool) pool বাদ, পরের job নতুন pool পায়
+    global _pool
+    pool = process_pool()
+    queued = set()
+
+    def submit(fn, *args):
+        fut = pool.submit(fn, *args)
+        queued.add(fut)
+        fut.add_done_callback(queued.discard)
+        return fut
+
+    try:
+        yield submit
+    except BrokenProcessPool:
+        with _pool_lock:
+            if _pool is pool:
+                _pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    finally:
+        for fut in list(queued):
+            fut.cancel()
+
+
+def _read_excel_bytes(data: bytes, compact: bool = False, ext: str = "xlsx") -> tuple:
+    stats, mem = [], {}
+    return read_table(io.BytesIO(data), ext, stats, compact, mem), stats, mem
+
+
+def read_excel_parallel(files: list, workers: int, on_file=None, stats: list = None,
+                        compact: bool = False, mem: dict = None, trace=None) -> list:
+    # openpyxl pure Python আর GIL-এ আটকে থাকে, তাই process pool।
+    # একসাথে workers × 2-এর বেশি ফাইলের bytes pool-এ পাঠাই না (memory bounded),
+    # আর যে ক্রমেই শেষ হোক, ফলাফল files-এর ক্রমেই ফেরত দিই।
+    dfs = [None] * len(files)
+    todo = list(enumerate(files))
+    pending = {}
+    with pooled() as submit:
+        while todo or pending:
+            while todo and len(pending) < workers * 2:
+                idx, f = todo.pop(0)
+                with stages.stage(trace, "upload") as s:
+                    data = f.read()
+                    if trace is not None:
+                        s["bytes_in"] += len(data)
+                pending[submit(_read_excel_bytes, data, compact, input_ext(f, "xlsx"))] = idx
+            # parse worker process-এ; এখানে শুধু অপেক্ষার সময়টা ধরা পড়ে
+            with stages.stage(trace, "parse"):
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                dfs[pending.pop(fut)], info, sizes = fut.result()
+                if stats is not None:
+                    stats += info
+                if mem is not None:
+                    for k, v in sizes.items():
+                        mem[k] = mem.get(k, 0) + v
+                if on_file:
+                    on_file(len(files) - len(todo) - len(pending), len(files))
+    return dfs
+
+
+def merge_excel(files: list, out, on_file=None, workers: int = 1, stats: list = None,
+                compact: bool = False, mem: dict = None, out_ext: str = "xlsx", trace=None, dedup=None) -> int:
+    # dedup দিলে (dedupe.RowFilter) সব ফাইল জুড়ে duplicate row লেখার আগেই বাদ যায়
+    workers = max(1, min(workers, MAX_WORKERS))
+    with measured(mem):
+        if workers > 1 and len(files) > 1:
+            dfs = read_excel_parallel(files, workers, on_file, stats, compact, mem, trace)
+        else:
+            dfs = []
+            for i, f in enumerate(files, 1):
+                if on_file:
+                    on_file(i, len(files))
+                with stages.stage(trace, "parse", stages.size_of(f)):
+                    dfs.append(read_table(f, input_ext(f, "xlsx"), stats, compact, mem))
+        # concat না করে প্রতিটি ফাইল সরাসরি writer-এ stream করি;
+        # column গুলো concat-এর মতোই সাজাই (প্রথম ফাইলের ক্রম, নতুনগুলো পরে)
+        cols = list(dict.fromkeys(c for df in dfs for c in df.columns))
+        kinds = {c: {df[c].dtype.kind if c in df else "f" for df in dfs} for c in cols}  # না থাকলে NaN (float)
+        chunks = (chunk for df in dfs for chunk in writers.frame_chunks(df.reindex(columns=cols)))
+        with stages.stage(trace, "write", out=out):
+            return writers.write_chunks(dedupe.apply(dedup, stages.wrap(trace, "concat", chunks), trace), out, out_ext,
+                                        writers.drift_types(kinds))
+
+
+def merge_csv(files: list, out, on_file=None, streaming: bool = True, compact: bool = False, mem: dict = None,
+              out_ext: str = "csv", trace=None, dedup=None, sort_key: str = None) -> int:
+    # input csv / parquet / feather মেশানো হতে পারে; output out_ext format-এ।
+    # sort_key দিলে output সেই column-এ sort হয় (stable: সমান key-তে ফাইলের ক্রম, তারপর row-এর ক্রম);
+    # streaming হলে প্রতিটি input আগে থেকেই সেই key-তে sorted হতে হবে (merge_csv_sorted)
+    # CSV-গুলোর dialect আগেই ঠিক করি: একই export-এর পরের ফাইল আগেরটার dialect-এ শুধু যাচাই হয়
+    csvio.sniff_all([f for f in files if input_ext(f, "csv") == "csv"])
+    if streaming:
+        with measured(mem):
+            if sort_key is not None:
+                return merge_csv_sorted(files, out, sort_key, on_file, compact=compact, mem=mem, out_ext=out_ext,
+                                        trace=trace, dedup=dedup)
+            return merge_csv_stream(files, out, on_file, compact=compact, mem=mem, out_ext=out_ext, trace=trace,
+                                    dedup=dedup)
+    with measured(mem):
+        if compact:
+            # সব CSV-র sample দেখে একটাই schema, যাতে concat-এ dtype আবার বড় না হয়ে যায়
+            with stages.stage(trace, "schema"):
+                samples = [schema.sample_csv(f) for f in files if input_ext(f, "csv") == "csv"]
+                types = schema.infer(samples)
+                scale = schema.ratio(samples, types) if samples else 1.0
+        dfs = []
+        for i, f in enumerate(files, 1):
+            if on_file:
+                on_file(i, len(files))
+            ext = input_ext(f, "csv")
+            with stages.stage(trace, "parse", stages.size_of(f)):
+                if compact and ext == "csv":
+                    dfs.append(schema.read_csv(f, types, mem, scale))
+                else:
+                    dfs.append(read_table(f, ext, compact=compact, mem=mem))
+        with stages.stage(trace, "concat"):
+            merged = schema.concat(dfs) if compact else pd.concat(dfs, ignore_index=True)
+        if sort_key is not None:
+            _check_key(merged.columns, sort_key, "merged input")
+            with stages.stage(trace, "sort"):
+                merged = merged.sort_values(sort_key, kind="stable", na_position="last", ignore_index=True)
+        with stages.stage(trace, "write", out=out):
+            if dedup is not None:
+                # merged-এর উপর drop_duplicates করলে আরেকটা পুরো কপি হতো; slice ধরে hash করে লিখি
+                size = writers.ROW_GROUP_ROWS if out_ext in ("parquet", "feather") else 50_000
+                return writers.write_chunks(dedupe.apply(dedup, writers.frame_chunks(merged, size), trace),
+                                            out, out_ext)
+            write_table(merged, out, out_ext)
+        return len(merged)
+
+
+def _stream_schema(files: list, chunksize: int, trace=None) -> tuple:
+    # প্রথম pass: শুধু header আর dtype দেখি, কোনো ডেটা ধরে রাখি না
+    # (parquet / feather-এর dtype schema থেকেই আসে)।
+    # কোনো chunk-এ numeric column float হলে concat সব জায়গায় float লিখত ("2.0"),
+    # তাই দ্বিতীয় pass-এ সেই column গুলো float64 হিসেবে পড়ি — output byte-identical থাকে।
+    # (cols, floats, headers, types) ফেরত; সব ফাইলের column এক না হলে cols None। types: parquet / feather
+    # writer-এর জন্য, যেমন প্রথম 200k row-এ খালি (float) আর পরে লেখা থাকা column → string
+    headers, kinds = [], {}
+    for f in files:
+        ext = input_ext(f, "csv")
+        with stages.stage(trace, "schema", stages.size_of(f)):
+            if ext in readers.COLUMNAR_EXTS:
+                dtypes = [readers.columnar_dtypes(f, ext)]
+            else:
+                dtypes = (chunk.dtypes for chunk in csvio.chunks(f, chunksize))
+            for n, dt in enumerate(dtypes):
+                if n == 0:
+                    headers.append(list(dt.index))
+                for c, d in dt.items():
+                    kinds.setdefault(c, set()).add(d.kind)
+        f.seek(0)
+    cols = headers[0]
+    floats = {c: "float64" for c, k in kinds.items() if "f" in k and k <= {"i", "u", "f"}}
+    if any(set(h) != set(cols) for h in headers[1:]):
+        cols = None
+    return cols, floats, headers, writers.drift_types(kinds)
+
+
+def _file_chunks(f, cols: list, floats: dict, chunksize: int, trace=None):
+    # দ্বিতীয় pass: একটা ফাইলের chunk, _stream_schema-র dtype আর column ক্রমে
+    ext = input_ext(f, "csv")
+    if trace is not None:
+        trace.add("parse", bytes_in=stages.size_of(f), calls=0)
+    if ext in readers.COLUMNAR_EXTS:
+        parts = (c.astype({k: v for k, v in floats.items() if k in c}) for c in iter_chunks(f, ext, chunksize))
+    else:
+        parts = csvio.chunks(f, chunksize, dtype=floats)
+    for chunk in parts:
+        # একই column ভিন্ন ক্রমে থাকলে প্রথম ফাইলের ক্রমে সাজাই (concat-এর মতো)
+        yield chunk[cols]
+
+
+def merge_csv_stream(files: list, out, on_file=None, chunksize: int = CSV_CHUNK_ROWS,
+                     compact: bool = False, mem: dict = None, out_ext: str = "csv", trace=None, dedup=None) -> int:
+    cols, floats, _, types = _stream_schema(files, chunksize, trace)
+    if cols is None:
+        return merge_csv(files, out, on_file, streaming=False, compact=compact, mem=mem, out_ext=out_ext, trace=trace,
+                         dedup=dedup)
+
+    def chunks():
+        for i, f in enumerate(files, 1):
+            if on_file:
+                on_file(i, len(files))
+            yield from _file_chunks(f, cols, floats, chunksize, trace)
+
+    # chunk পড়া "parse", বাকিটা (serialise) "write"
+    with stages.stage(trace, "write", out=out):
+        return writers.write_chunks(dedupe.apply(dedup, stages.wrap(trace, "parse", chunks()), trace), out, out_ext,
+                                    types)
+
+
+def _check_key(columns, key: str, where: str):
+    if key not in columns:
+        raise ValueError(f"sort key column {key!r} not found in {where}")
+
+
+def _sort_token(v) -> tuple:
+    # heap-এ তুলনার জন্য: খালি key (NaN) সবার শেষে, sort_values(na_position="last")-এর মতো
+    return (1, 0) if pd.isna(v) else (0, v)
+
+
+def _cut(keys: pd.Series, token: tuple, inclusive: bool) -> int:
+    # sorted keys-এর কতগুলো row token-এর চেয়ে ছোট (inclusive হলে ছোট বা সমান)
+    valid = int(keys.notna().sum())  # sorted ফাইলে NaN গুলো শেষে
+    if token[0]:
+        return len(keys) if inclusive else valid
+    return int(keys.iloc[:valid].searchsorted(token[1], side="right" if inclusive else "left"))
+
+
+def _checked(chunks, key: str, name: str):
+    # ফাইলটা সত্যিই key-তে sorted কিনা chunk ধরে যাচাই (chunk-এর ভেতরে আর chunk-এর সীমানায়)
+    last = None
+    for chunk in chunks:
+        keys = chunk[key]
+        valid = int(keys.notna().sum())
+        if (not keys.iloc[:valid].is_monotonic_increasing or keys.iloc[valid:].notna().any()
+                or (len(keys) and last is not None and _sort_token(keys.iloc[0]) < last)):
+            raise ValueError(f"{name} is not sorted by {key!r} (ascending, blanks last); "
+                             "turn off streaming to sort in memory")
+        if len(keys):
+            last = _sort_token(keys.iloc[-1])
+        yield chunk
+
+
+def merge_csv_sorted(files: list, out, key: str, on_file=None, chunksize: int = CSV_CHUNK_ROWS,
+                     compact: bool = False, mem: dict = None, out_ext: str = "csv", trace=None, dedup=None) -> int:
+    # প্রতিটি input আগে থেকেই key-তে sorted (যেমন দিনের shard, timestamp ধরে) — k-way merge করে একটা sorted
+    # output, পুরো concat + sort_values(kind="stable") এর সাথে byte-identical।
+    # প্রতিটি ফাইলের একটা chunk buffer-এ থাকে (সব মিলিয়ে ~chunksize row), তাই memory ফাইলের সংখ্যার
+    # অনুপাতে, row-এর নয়। heap-এ প্রতিটি ফাইলের buffer-এর শেষ key (tail): সবচেয়ে ছোট tail b যে ফাইলের
+    # (সমান হলে আগের ফাইল), তার পরের chunk-এর সব key ≥ b, অন্যদেরও তাই। কাজেই সব buffer থেকে b-এর ছোট
+    # row, আর ওই ফাইল ও তার আগের ফাইলগুলোর b-সমান row এখনই লেখা যায় — row ধরে heap না করে পুরো slice
+    # একবারে stable sort করে লিখি। ওই ফাইলের buffer তখন খালি হয়, শুধু সেটাই আবার ভরি।
+    cols, floats, headers, types = _stream_schema(files, chunksize, trace)
+    for f, h in zip(files, headers):
+        _check_key(h, key, getattr(f, "name", "input"))
+    if cols is None:
+        return merge_csv(files, out, on_file, streaming=False, compact=compact, mem=mem, out_ext=out_ext, trace=trace,
+                         dedup=dedup, sort_key=key)
+    per_file = max(1_000, chunksize // len(files))
+    if on_file:
+        # সব ফাইল একসাথে পড়া হয়, তাই ফাইল ধরে নয় — progress byte ধরে (progress.Meter)
+        on_file(0, len(files))
+    sources = [_checked(_file_chunks(f, cols, floats, per_file, trace), key, getattr(f, "name", f"input {i + 1}"))
+               for i, f in enumerate(files)]
+    bufs = [None] * len(files)
+    heap = []
+    empty = []  # সব ফাইল খালি হলেও header লেখার জন্য
+
+    def refill(i: int):
+        for chunk in sources[i]:
+            if len(chunk):
+                bufs[i] = chunk
+                heapq.heappush(heap, (_sort_token(chunk[key].iloc[-1]), i))
+                return
+            empty[:] = empty or [chunk]
+        bufs[i] = None
+
+    def batches():
+        for i in range(len(files)):
+            refill(i)
+        if not heap:
+            yield from empty
+        while heap:
+            token, first = heapq.heappop(heap)
+            parts = []
+            for i, buf in enumerate(bufs):
+                if buf is None:
+                    continue
+                n = _cut(buf[key], token, inclusive=i <= first)
+                if n:
+                    parts.append(buf.iloc[:n])
+                    bufs[i] = buf.iloc[n:]
+            with stages.stage(trace, "sort"):
+                batch = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0].reset_index(drop=True)
+                batch = batch.sort_values(key, kind="stable", na_position="last", ignore_index=True)
+            yield batch
+            refill(first)  # first-এর buffer এখন খালি
+
+    with stages.stage(trace, "write", out=out):
+        return writers.write_chunks(dedupe.apply(dedup, stages.wrap(trace, "parse", batches()), trace), out, out_ext,
+                                    types)
+
+
+def excel_to_csv(f, out, stats: list = None, compact: bool = False, mem: dict = None, trace=None) -> int:
+    with measured(mem):
+        with stages.stage(trace, "parse", stages.size_of(f)):
+            df = read_table(f, "xlsx", stats, compact, mem)
+        with stages.stage(trace, "write", out=out):
+            write_table(df, out, "csv")
+        return len(df)
+
+
+def csv_to_excel(f, out, trace=None, stats: list = None, keep=None) -> int:
+    if trace is not None:
+        trace.add("parse", bytes_in=stages.size_of(f), calls=0)
+    chunks = _keep_whole(csvio.chunks(f, CSV_CHUNK_ROWS, stats=stats), keep)
+    with stages.stage(trace, "write", out=out):
+        return writers.write_xlsx(stages.wrap(trace, "parse", chunks), out)
+
+
+def stream_table(f, out, in_ext: str, out_ext: str, stats: list = None, trace=None, keep=None) -> int:
+    # chunk ধরে পড়া, chunk ধরে লেখা — একসাথে একটাই chunk memory-তে (UI-র Excel → CSV / Parquet)।
+    # convert()-এর xlsx পথ calamine-এ একবারে পড়ে, দ্রুত কিন্তু পুরো frame memory-তে
+    if trace is not None:
+        trace.add("parse", bytes_in=stages.size_of(f), calls=0)
+    chunks = _keep_whole(iter_chunks(f, in_ext, CSV_CHUNK_ROWS, stats), keep)
+    with stages.stage(trace, "write", out=out):
+        return writers.write_chunks(stages.wrap(trace, "parse", chunks), out, out_ext)
+
+
+def convert(f, out, in_ext: str, out_ext: str, stats: list = None, trace=None) -> int:
+    # csv / parquet / feather chunk ধরে stream হয় (merge_csv_stream-এর dtype pass সহ, যাতে
+    # chunk ভেদে int/float বদলে parquet schema ভেঙে না যায়); xlsx calamine-এ একবারে পড়া
+    # chunked openpyxl-এর চেয়ে অনেক দ্রুত
+    if in_ext == "xlsx":
+        with stages.stage(trace, "parse", stages.size_of(f)):
+            df = read_table(f, "xlsx", stats)
+        with stages.stage(trace, "write", out=out):
+            return writers.write_chunks(writers.frame_chunks(df, writers.ROW_GROUP_ROWS), out, out_ext)
+    return merge_csv_stream([f], out, out_ext=out_ext, trace=trace)
+
+
+def _keep_whole(chunks, keep):
+    # keep দিলে: পুরো input একটা chunk-এই এঁটে গেলে (ছোট ফাইল) শেষে keep(chunk) — UI সেটা frame cache-এ
+    # রাখে। বড় ফাইলে কিছুই জমে না
+    if keep is None:
+        yield from chunks
+        return
+    first, n = None, 0
+    for chunk in chunks:
+        n += 1
+        first = chunk if n == 1 else None
+        yield chunk
+    if n == 1:
+        keep(first)
+
+
+def iter_chunks(f, ext: str, chunksize: int, stats: list = None):
+    if ext == "xlsx":
+        chunks = readers.iter_xlsx_chunks(f, chunksize)
+        return chunks if stats is None else readers.timed_chunks(chunks, "openpyxl-ro", stats)
+    if ext in readers.COLUMNAR_EXTS:
+        return readers.iter_columnar_chunks(f, ext, chunksize)
+    return csvio.chunks(f, chunksize, stats=stats)
+
+
+def _encode_part(chunk: pd.DataFrame, ext: str) -> bytes:
+    buf = io.BytesIO()
+    write_table(chunk, buf, ext)
+    return buf.getvalue()
+
+
+@contextmanager
+def _split_zip(out, zip_policy: str, workers: int, zip_stats: list, trace, manifest: dict, inline: bool, **info):
+    # সব split mode-এর ZIP: শেষে manifest.json (প্রতিটি part-এর name, rows, bytes, sha256), আর compress-এর হিসাব
+    # trace / zip_stats-এ। inline মানে entry z.open()-এ লেখা হয়েছে, তাই compress-এর সময় encode-এর ভেতরে ছিল
+    # ZIP header / central directory লেখা আর parallel compress-এর অপেক্ষা "zip"-এ
+    with stages.stage(trace, "zip", out=out), archive.ArchiveWriter(out, zip_policy, workers) as z:
+        yield z
+        written = z.add_manifest(**info)
+    report = z.report()
+    if trace is not None:
+        for r in report:
+            if z.parallel:
+                # compress thread pool-এ চলেছে, অপেক্ষাটুকু ইতিমধ্যে "zip"-এ; এখানে শুধু thread-এর সময়
+                trace.add("zip", bytes_in=r["raw_bytes"], calls=0, worker_seconds=r["seconds"])
+            elif inline:
+                # entry-তে লেখার ভেতরেই compress হয়েছে: সেই সময়টা encode থেকে zip-এ সরাই
+                trace.carve("encode", "zip", r["seconds"], bytes_in=r["raw_bytes"])
+            else:
+                trace.add("zip", bytes_in=r["raw_bytes"], calls=0)
+    if zip_stats is not None:
+        zip_stats += report
+    if manifest is not None:
+        manifest.update(written)
+
+
+def split_chunks(chunks, out, ext: str, on_part=None, total_parts: int = None, workers: int = 1,
+                 zip_policy: str = "auto", zip_stats: list = None, trace=None, manifest: dict = None) -> int:
+    # প্রতিটি part সরাসরি খোলা ZIP entry-তে লিখি — মাঝখানে BytesIO বা getvalue() কপি নেই।
+    # কোন part store হবে আর কোনটা কোন level-এ deflate, তা zip_policy ঠিক করে (archive.py)
+    workers = max(1, min(workers, MAX_WORKERS))
+    parts = 0
+    chunks = stages.wrap(trace, "parse", chunks)
+    with _split_zip(out, zip_policy, workers, zip_stats, trace, manifest, inline=workers == 1, mode="rows") as z:
+        if workers > 1:
+            named = ((f"part_{i}.{ext}", chunk, {"rows": len(chunk)})
+                     for i, chunk in enumerate((c for c in chunks if len(c)), 1))
+            parts = _zip_parallel(named, z, ext, on_part, total_parts, workers, trace)
+        else:
+            for chunk in chunks:
+                if len(chunk) == 0:
+                    continue
+                parts += 1
+                if on_part:
+                    on_part(parts, max(parts, total_parts or 0))
+                with stages.stage(trace, "encode"), z.open(f"part_{parts}.{ext}", rows=len(chunk)) as entry:
+                    write_table(chunk, entry, ext)
+    return parts
+
+
+def _zip_parallel(named, z: archive.ArchiveWriter, ext: str, on_part, total_parts: int, workers: int,
+                  trace=None) -> int:
+    # named: (entry name, frame, manifest meta)। encode (to_excel / to_csv) CPU-bound, তাই process pool-এ;
+    # compress হয় z-এর thread pool-এ। ZIP-এ লেখা হয় submit-এর ক্রমে — কে আগে শেষ হলো তাতে কিছু যায় আসে না।
+    # একসাথে workers × 2-এর বেশি part চলমান থাকে না: queue ভরলে আগেরটা লেখা পর্যন্ত reader থামে।
+    inflight = deque()
+    parts = 0
+
+    def write_next():
+        nonlocal parts
+        name, fut, meta = inflight.popleft()
+        with stages.stage(trace, "encode"):
+            data = fut.result()
+        parts += 1
+        if on_part:
+            on_part(parts, max(parts, total_parts or 0))
+        z.add(name, data, **meta)
+
+    with pooled() as submit:
+        for name, frame, meta in named:
+            if len(inflight) >= workers * 2:
+                write_next()
+            inflight.append((name, submit(_encode_part, frame, ext), meta))
+        while inflight:
+            write_next()
+    return parts
+
+
+def split_by_key(chunks, out, key: str, ext: str, on_part=None, zip_policy: str = "auto", zip_stats: list = None,
+                 trace=None, manifest: dict = None) -> int:
+    # key column-এর প্রতিটি মানের জন্য একটা part ("region=North.csv"), মানগুলো প্রথম দেখার ক্রমে।
+    # input একবারই পড়া হয়; partition.KeyBuffer-এর buffer সীমা ছাড়ালে disk-এ যায়, আর শেষে
+    # প্রতিটি part তার frame গুলো থেকে সরাসরি ZIP entry-তে stream হয়
+    with partition.KeyBuffer(key) as buf:
+        if on_part:
+            # পড়ার সময় part সংখ্যা জানা নেই: progress byte ধরে
+            on_part(0, 1)
+        for chunk in stages.wrap(trace, "parse", chunks):
+            with stages.stage(trace, "partition"):
+                buf.add(chunk)
+        if trace is not None and buf.spilled_bytes:
+            trace.add("partition", calls=0, spilled_bytes=buf.spilled_bytes)
+        used = set()
+        with _split_zip(out, zip_policy, 1, zip_stats, trace, manifest, inline=True, mode="key", key=key) as z:
+            for i, (value, rows) in enumerate(buf.rows.items(), 1):
+                if on_part:
+                    on_part(i, len(buf.rows))
+                name = partition.part_name(key, value, ext, used)
+                with stages.stage(trace, "encode"), z.open(name, value=value, rows=rows) as entry:
+                    writers.write_chunks(buf.frames(value), entry, ext)
+        return len(buf.rows)
+
+
+def split_by_size(chunks, out, max_bytes: int, ext: str, on_part=None, total_parts: int = None, workers: int = 1,
+                  zip_policy: str = "auto", zip_stats: list = None, trace=None, manifest: dict = None) -> int:
+    # প্রতিটি part (ZIP-এর ভেতরে, uncompressed) max_bytes-এর নিচে; row-এর ক্রম বদলায় না।
+    # workers > 1 হলে শুধু compress thread pool-এ — encode-এর size দেখেই পরের part ঠিক হয়
+    workers = max(1, min(workers, MAX_WORKERS))
+
+    def encode(frame: pd.DataFrame) -> bytes:
+        with stages.stage(trace, "encode"):
+            return _encode_part(frame, ext)
+
+    parts = 0
+    with _split_zip(out, zip_policy, workers, zip_stats, trace, manifest, inline=False, mode="size",
+                    max_bytes=max_bytes) as z:
+        for data, rows in partition.by_size(stages.wrap(trace, "parse", chunks), max_bytes, encode):
+            parts += 1
+            if on_part:
+                on_part(parts, max(parts, total_parts or 0))
+            z.add(f"part_{parts}.{ext}", data, rows=rows)
+    return parts
+
+
+def _split(chunks, out, ext: str, on_part, total_parts: int, workers: int, zip_policy: str, zip_stats: list,
+           trace, by: str, max_bytes: int, manifest: dict) -> int:
+    if by is not None:
+        return split_by_key(chunks, out, by, ext, on_part, zip_policy, zip_stats, trace, manifest)
+    if max_bytes is not None:
+        return split_by_size(chunks, out, max_bytes, ext, on_part, total_parts, workers, zip_policy, zip_stats,
+                             trace, manifest)
+    return split_chunks(chunks, out, ext, on_part, total_parts, workers, zip_policy, zip_stats, trace, manifest)
+
+
+def excel_sheets_to_zip(f, out, sheets: list = None, ext: str = "csv", on_sheet=None, workers: int = 1,
+                       zip_policy: str = "auto", zip_stats: list = None, stats: list = None, trace=None,
+                       manifest: dict = None) -> int:
+    # workbook-এর সব sheet (বা sheets-এর গুলো) একেকটা ফাইল হয়ে ZIP-এ, workbook একবারই খুলে।
+    # workers > 1 হলে sheet parse চলতে চলতেই আগের sheet গুলো process pool-এ encode আর thread pool-এ
+    # compress হয়; workers == 1 হলে প্রতিটি sheet সরাসরি খোলা ZIP entry-তে লেখা
+    workers = max(1, min(workers, MAX_WORKERS))
+    if trace is not None:
+        trace.add("parse", bytes_in=stages.size_of(f), calls=0)
+    total = len(sheets) if sheets else len(readers.xlsx_sheet_names(f))
+    used = set()
+
+    def named():
+        it = readers.iter_xlsx_sheets(f, sheets, stats=stats)
+        while True:
+            with stages.stage(trace, "parse") as s:
+                item = next(it, None)
+                if item is not None and trace is not None:
+                    s["rows"] = s.get("rows", 0) + len(item[1])
+            if item is None:
+                return
+            sheet, df = item
+            yield partition.safe_name(sheet, ext, used), df, {"sheet": sheet, "rows": len(df)}
+
+    with _split_zip(out, zip_policy, workers, zip_stats, trace, manifest, inline=workers == 1, mode="sheets") as z:
+        if workers > 1:
+            return _zip_parallel(named(), z, ext, on_sheet, total, workers, trace)
+        n = 0
+        for name, df, meta in named():
+            n += 1
+            if on_sheet:
+                on_sheet(n, total)
+            with stages.stage(trace, "encode"), z.open(name, **meta) as entry:
+                write_table(df, entry, ext)
+        return n
+
+
+def split_frame(df: pd.DataFrame, out, rows_per_file: int, ext: str, on_part=None, workers: int = 1,
+                zip_policy: str = "auto", zip_stats: list = None, trace=None, by: str = None, max_bytes: int = None,
+                manifest: dict = None) -> int:
+    # by দিলে সেই column-এর মান ধরে, max_bytes দিলে part-এর byte সীমা ধরে; নাহলে rows_per_file
+    if by is not None or max_bytes is not None:
+        chunks = writers.frame_chunks(df, CSV_CHUNK_ROWS)
+        total_parts = None
+    else:
+        total_parts = (len(df) + rows_per_file - 1) // rows_per_file
+        chunks = (df.iloc[start: start + rows_per_file] for start in range(0, len(df), rows_per_file))
+    return _split(chunks, out, ext, on_part, total_parts, workers, zip_policy, zip_stats, trace, by, max_bytes,
+                  manifest)
+
+
+def split_file(f, out, rows_per_file: int, ext: str, on_part=None, total_parts: int = None,
+               stats: list = None, workers: int = 1, zip_policy: str = "auto", zip_stats: list = None,
+               part_ext: str = None, trace=None, by: str = None, max_bytes: int = None, manifest: dict = None,
+               keep=None) -> int:
+    # ফাইল chunk ধরে পড়া হয়: rows mode-এ একসাথে একটাই part memory-তে থাকে।
+    # part_ext না দিলে part গুলো input-এর format-এই (.arrow input → .feather part)
+    if trace is not None:
+        trace.add("parse", bytes_in=stages.size_of(f), calls=0)
+    chunksize = CSV_CHUNK_ROWS if by is not None or max_bytes is not None else rows_per_file
+    chunks = _keep_whole(iter_chunks(f, ext, chunksize, stats), keep)
+    part_ext = part_ext or ("feather" if ext == "arrow" else ext)
+    return _split(chunks, out, part_ext, on_part, total_parts, workers, zip_policy, zip_stats, trace, by, max_bytes,
+                  manifest)
+
+
+# ═══════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════
+
+def expand_inputs(paths: list, exts: tuple) -> list:
+    # folder দিলে ভেতরের মিল থাকা ফাইলগুলো নামের ক্রমে নিই
+    found = []
+    for p in paths:
+        if os.path.isdir(p):
+            found += sorted(os.path.join(p, n) for n in os.listdir(p) if n.lower().endswith(exts))
+        else:
+            found.append(p)
+    return found
+
+
+def parse_size(text: str) -> int:
+    # "25MB", "25M", "1.5 GiB", "500k", "1000000" → byte (1 MB = 1,000,000; MiB = 1,048,576)
+    units = {"": 1, "b": 1, "k": 10 ** 3, "kb": 10 ** 3, "kib": 1 << 10, "m": 10 ** 6, "mb": 10 ** 6, "mib": 1 << 20,
+             "g": 10 ** 9, "gb": 10 ** 9, "gib": 1 << 30}
+    m = re.fullmatch(r"\s*([0-9]*\.?[0-9]+)\s*([a-z]*)\s*", text.lower())
+    if not m or m.group(2) not in units or float(m.group(1)) * units[m.group(2)] < 1:
+        raise argparse.ArgumentTypeError(f"not a size: {text!r} (e.g. 25MB, 500k, 1GiB)")
+    return int(float(m.group(1)) * units[m.group(2)])
+
+
+def _progress(label: str, stream=sys.stderr):
+    # (meter, done): meter-টাই on_file / on_part, আর meter.track(files) দিলে ফাইলের ভেতরের byte-ও দেখায়।
+    # terminal-এ একই লাইন \r দিয়ে সেকেন্ডে progress.HZ বার বদলায়; pipe / log-এ সেকেন্ডে একটা নতুন লাইন।
+    # done() শেষ অবস্থাটা সবসময় ছাপে।
+    tty = stream.isatty()
+
+    def show(final: bool = False):
+        if not (meter.due(progress.HZ if tty else 1.0) or final):
+            return
+        s = meter.snapshot()
+        i, n = s["units"]
+        line = f"{label} {i}/{n}  {1 if final else s['fraction']:.0%}"
+        if s["total_bytes"]:
+            line += f"  {s['done_bytes'] / 1e6:.1f}/{s['total_bytes'] / 1e6:.1f} MB"
+        if s["bytes_per_sec"]:
+            line += f"  {s['bytes_per_sec'] / 1e6:.1f} MB/s"
+        if s["eta"] is not None and not final:
+            line += f"  ETA {progress.format_eta(s['eta'])}"
+        if final:
+            line += f"  in {progress.format_eta(s['elapsed'])}"
+        if tty:
+            print(f"\r{line:<72}", end="\n" if final else "", file=stream, flush=True)
+        else:
+            print(line, file=stream)
+
+    meter = progress.Meter(check=show)
+    meter.start()
+    return meter, lambda: show(True)
+
+
+def main(argv=None) -> int:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-o", "--output", required=True)
+    common.add_argument("-q", "--quiet", action="store_true", help="no progress on stderr")
+    common.add_argument("--xlsx-engine", choices=("auto",) + readers.XLSX_ENGINES,
+                        help="xlsx reader backend (default: $XLSX_ENGINE or auto)")
+    common.add_argument("--csv-engine", choices=("auto",) + csvio.CSV_ENGINES,
+                        help="CSV parser: pyarrow (multi-threaded) or pandas' C engine (default: $CSV_ENGINE or auto)")
+    common.add_argument("--trace", action="store_true",
+                        help="print a per-stage time / memory / bytes breakdown and log it as JSON ($TRACE_LOG or stderr)")
+    ap = argparse.ArgumentParser(prog="engine.py", description="Shikder Smart Tools — batch merge / convert / split")
+    sub = ap.add_subparsers(dest="tool", required=True)
+    for tool, help_ in [("pdf", "merge PDF files"),
+                        ("excel", "merge .xlsx files (output format from -o: .xlsx, .csv, .parquet, .feather)"),
+                        ("csv", "merge .csv files (output format from -o: .csv, .xlsx, .parquet, .feather)")]:
+        p = sub.add_parser(tool, help=help_, parents=[common])
+        p.add_argument("inputs", nargs="+", help="files or folders, merged in the given order")
+        if tool == "excel":
+            p.add_argument("--workers", type=int, default=1, help=f"parse files on N processes (max {MAX_WORKERS})")
+        if tool == "pdf":
+            p.add_argument("--dedupe", action="store_true",
+                           help="write identical fonts/images/objects once and compress content streams")
+        if tool == "csv":
+            p.add_argument("--no-stream", action="store_true", help="load everything and concat in memory")
+            p.add_argument("--sort-key", metavar="COL",
+                           help="sort the output by COL (stable); when streaming, every input must already be "
+                                "sorted by COL and they are k-way merged")
+    for tool, help_ in [("e2c", "convert .xlsx to .csv"), ("c2e", "convert .csv (or .parquet/.feather) to .xlsx"),
+                        ("convert", "convert between .csv, .xlsx, .parquet and .feather (formats from file names)")]:
+        p = sub.add_parser(tool, help=help_, parents=[common])
+        p.add_argument("input")
+    for tool in ("excel", "csv"):
+        sub.choices[tool].add_argument("--dedupe-rows", nargs="?", const="", metavar="COLS",
+                                       help="drop duplicate rows across all inputs (keep the first); "
+                                            "COLS=a,b compares only those columns")
+    for tool in ("excel", "csv", "e2c"):
+        sub.choices[tool].add_argument("--compact", action="store_true",
+                                       help="read with compact dtypes (category, nullable/downcast ints) and report memory")
+    p = sub.choices["e2c"]
+    p.add_argument("--sheets", nargs="?", const="", metavar="NAMES",
+                   help="convert every sheet (or only NAMES=Jan,Feb) into a ZIP with one .csv per sheet; "
+                        "the workbook is opened once. Output must end in .zip")
+    p.add_argument("--workers", type=int, default=1,
+                   help=f"with --sheets: encode and compress sheets on N workers while the next is parsed "
+                        f"(max {MAX_WORKERS})")
+    p = sub.add_parser("split", help="split a .csv or .xlsx file into a ZIP of parts", parents=[common])
+    p.add_argument("input")
+    mode = p.add_mutually_exclusive_group()
+    mode.add_argument("--rows", type=int, default=100, help="rows per file (default: 100)")
+    mode.add_argument("--by", metavar="COL", help="one file per distinct value of COL (e.g. region=North.csv)")
+    mode.add_argument("--max-size", type=parse_size, metavar="SIZE",
+                      help="start a new file before a part would exceed SIZE (e.g. 25MB; size inside the ZIP)")
+    p.add_argument("--workers", type=int, default=1, help=f"encode and compress parts on N workers (max {MAX_WORKERS})")
+    p.add_argument("--zip-policy", choices=archive.POLICIES, default="auto",
+                   help="auto: store xlsx, deflate csv; fast: like auto with level 1; deflate: everything (old behaviour)")
+    p.add_argument("--format", choices=writers.TABLE_FORMATS, help="part format (default: same as input)")
+    args = ap.parse_args(argv)
+
+    if args.tool in ("pdf", "excel", "csv"):
+        paths = expand_inputs(args.inputs, TOOL_INPUTS[args.tool])
+        if not paths:
+            ap.error("no input files found")
+    elif args.tool == "split" and args.rows < 1:
+        ap.error("--rows must be at least 1")
+    elif args.tool == "e2c" and args.sheets is not None:
+        if file_ext(args.output) != "zip":
+            ap.error("--sheets writes a ZIP: the output must end in .zip")
+        sheets = [s.strip() for s in args.sheets.split(",") if s.strip()] or None
+        with open(args.input, "rb") as fh:
+            names = readers.xlsx_sheet_names(fh)
+        missing = [s for s in sheets or [] if s not in names]
+        if missing:
+            ap.error(f"--sheets: no such sheet(s): {', '.join(missing)} (workbook has {', '.join(names)})")
+    elif args.tool == "convert":
+        if file_ext(args.input) not in ("csv", "xlsx") + readers.COLUMNAR_EXTS:
+            ap.error(f"cannot read {args.input}")
+        if file_ext(args.output) not in writers.TABLE_FORMATS:
+            ap.error(f"output must end in one of: {', '.join('.' + e for e in writers.TABLE_FORMATS)}")
+    out_ext = file_ext(args.output) if file_ext(args.output) in writers.TABLE_FORMATS else None
+
+    if args.xlsx_engine:
+        os.environ["XLSX_ENGINE"] = args.xlsx_engine
+    if args.csv_engine:
+        os.environ["CSV_ENGINE"] = args.csv_engine
+
+    stats, mem = [], {} if getattr(args, "compact", False) else None
+    trace = stages.Trace(args.tool) if args.trace else None
+    dedup = None
+    with ExitStack() as stack:
+        out = stack.enter_context(open(args.output, "wb"))
+        if getattr(args, "dedupe_rows", None) is not None:
+            keys = [k.strip() for k in args.dedupe_rows.split(",") if k.strip()]
+            known = set()
+            for p in paths if keys else []:
+                with open(p, "rb") as fh:
+                    known.update(readers.table_columns(fh, file_ext(p)))
+            missing = [k for k in keys if k not in known]
+            if missing:
+                ap.error(f"--dedupe-rows: no such column(s): {', '.join(missing)}")
+            dedup = stack.enter_context(dedupe.RowFilter(keys))
+        if trace is not None:
+            stack.enter_context(trace)
+        if args.tool in ("pdf", "excel", "csv"):
+            files = [stack.enter_context(open(p, "rb")) for p in paths]
+            on_file, done = (None, None) if args.quiet else _progress("reading")
+            if on_file is not None:
+                files = on_file.track(files)
+            if args.tool == "pdf":
+                sizes = {}
+                n = merge_pdfs(files, out, on_file, args.dedupe, sizes, trace, measure=not args.quiet)
+                if done:
+                    done()
+                print(f"{len(files)} PDFs merged, {n} pages → {args.output}")
+                if args.dedupe and not args.quiet:
+                    print(f"output without dedupe: {sizes['before']:,} → with: {sizes['after']:,} bytes "
+                          f"(input total {sizes['inputs']:,})", file=sys.stderr)
+            elif args.tool == "excel":
+                n = merge_excel(files, out, on_file, args.workers, stats, args.compact, mem, out_ext or "xlsx", trace,
+                                dedup)
+                if done:
+                    done()
+                print(f"{len(files)} files merged, {n} rows → {args.output}")
+            else:
+                n = merge_csv(files, out, on_file, not args.no_stream, args.compact, mem, out_ext or "csv", trace,
+                              dedup, args.sort_key)
+                if done:
+                    done()
+                print(f"{len(files)} files merged, {n} rows → {args.output}")
+        else:
+            f = stack.enter_context(open(args.input, "rb"))
+            if args.tool == "e2c" and args.sheets is not None:
+                on_sheet, done = (None, None) if args.quiet else _progress("sheet")
+                if on_sheet is not None:
+                    f = on_sheet.track([f])[0]
+                manifest = {}
+                n = excel_sheets_to_zip(f, out, sheets, "csv", on_sheet, args.workers, stats=stats, trace=trace,
+                                        manifest=manifest)
+                if done:
+                    done()
+                print(f"{n} sheets → {args.output}")
+                if not args.quiet:
+                    for p in manifest["parts"]:
+                        print(f"{p['sheet']}: {p['rows']:,} rows → {p['name']}", file=sys.stderr)
+            elif args.tool == "e2c":
+                n = excel_to_csv(f, out, stats, args.compact, mem, trace)
+                print(f"{n} rows → {args.output}")
+            elif args.tool == "c2e":
+                ext = file_ext(args.input)
+                n = csv_to_excel(f, out, trace) if ext == "csv" else convert(f, out, ext, "xlsx", trace=trace)
+                print(f"{n} rows → {args.output}")
+            elif args.tool == "convert":
+                n = convert(f, out, file_ext(args.input), out_ext, stats, trace)
+                print(f"{n} rows → {args.output}")
+            else:
+                on_part, done = (None, None) if args.quiet else _progress("writing part")
+                total_parts = None
+                if on_part is not None:
+                    if args.by is None and args.max_size is None:
+                        # metadata / newline গুনে আন্দাজ, যাতে progress-এ "i / N" দেখা যায়
+                        total_parts = -(-readers.probe(f, file_ext(args.input))[0] // args.rows)
+                    f = on_part.track([f])[0]
+                zip_stats, manifest = [], {}
+                n = split_file(f, out, args.rows, file_ext(args.input), on_part, total_parts, stats=stats,
+                               workers=args.workers, zip_policy=args.zip_policy, zip_stats=zip_stats,
+                               part_ext=args.format, trace=trace, by=args.by, max_bytes=args.max_size,
+                               manifest=manifest)
+                if done:
+                    done()
+                print(f"{n} parts → {args.output}")
+                if not args.quiet:
+                    big = max(manifest["parts"], key=lambda p: p["bytes"], default=None)
+                    if big is not None:
+                        print(f"manifest.json: {n} parts, {sum(p['rows'] for p in manifest['parts']):,} rows, "
+                              f"largest {big['name']} {big['bytes']:,} bytes", file=sys.stderr)
+                    for r in zip_stats:
+                        print(f"zip {r['choice']}: {r['entries']} entries, {r['raw_bytes']:,} → {r['zip_bytes']:,} bytes "
+                              f"(saved {r['saved_bytes']:,}) in {r['seconds']:.3f} s", file=sys.stderr)
+    if dedup is not None and not args.quiet:
+        r = dedup.report()
+        spilled = f", {r['spilled_runs']} run(s) / {r['spilled_bytes']:,} bytes spilled to disk" if r["spilled_runs"] else ""
+        print(f"dedupe: {r['dropped']:,} of {r['rows']:,} rows dropped{spilled}", file=sys.stderr)
+    if not args.quiet:
+        # sniff-এর ফল মনে রাখা আছে, তাই এখানে আর detect হয় না; শুধু সাধারণ (utf-8, ",") নয় এমনগুলো দেখাই
+        for p in paths if args.tool in ("pdf", "excel", "csv") else [args.input]:
+            if file_ext(p) == "csv":
+                with open(p, "rb") as fh:
+                    d = csvio.sniff(fh)
+                if not d.is_default:
+                    print(f"csv dialect: {p}: {d.describe()}", file=sys.stderr)
+    if stats and not args.quiet:
+        print(f"read: {readers.throughput(stats)}", file=sys.stderr)
+    if mem and not args.quiet:
+        frames = f"{mem['frames_before']:,} → {mem['frames']:,}" if "frames_before" in mem else f"{mem.get('frames', 0):,}"
+        print(f"memory: peak {mem['peak']:,} bytes, frames {frames} bytes", file=sys.stderr)
+    if trace is not None:
+        for line in stages.summary(trace):
+            print(f"stage: {line}", file=sys.stderr)
+        trace.log(output=args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
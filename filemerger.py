@@ -1,25 +1,32 @@
 import streamlit as st
-from pypdf import PdfReader, PdfWriter
-import pandas as pd
-import io
-import zipfile
+import uuid
+from contextlib import nullcontext
 from datetime import datetime
 
+import archive
+import cache
+import guide
+import jobs
+import progress
+import spill
+import styles
+
+# dedupe / engine / readers / stages / writers pandas, pyarrow আর openpyxl টেনে আনে (cold start-এ ~1 s) —
+# তাই এগুলো নিচে শুধু কোনো tool খুললে import হয়; dashboard আর theme / language বদলানোয় লাগে না
+
 st.set_page_config(page_title="Shikder Smart Tools", layout="wide", initial_sidebar_state="collapsed")
 
 # ---------- SESSION STATE ----------
 for key, default in [
     ("tool", None), ("file_order", []), ("file_keys", []),
     ("history", []), ("theme", "dark"), ("lang", "en"),
+    ("upload_hashes", {}), ("outputs", {}), ("jobs", {}), ("sid", uuid.uuid4().hex),
+    ("headers", {}),
 ]:
     st.session_state.setdefault(key, default)
 
 # ---------- THEMES ----------
-THEMES = {
-    "dark":  {"bg": "#0e1117", "primary": "#00f7ff", "secondary": "#9ca3af", "card": "#141923", "guide": "#0d1f2d", "icon": "🌙", "next": "light"},
-    "light": {"bg": "#f8f9fa", "primary": "#00a8cc", "secondary": "#444444", "card": "#ffffff",  "guide": "#e4f4fb", "icon": "☀️", "next": "ocean"},
-    "ocean": {"bg": "#0a1929", "primary": "#00e5ff", "secondary": "#8ab4f8", "card": "#1a2942", "guide": "#0d2137", "icon": "🌊", "next": "dark"},
-}
+THEMES = styles.THEMES
 t = THEMES[st.session_state.theme]
 L = st.session_state.lang  # "en" or "bn"
 
@@ -33,346 +40,8 @@ TOOL_NAMES = {
     "split": "⚙ File Splitter",
 }
 
-# ---------- BILINGUAL GUIDE CONTENT ----------
-GUIDE = {
-    "pdf": {
-        "en": {
-            "what": "PDF Merger combines multiple PDF files into one single document — preserving all pages, formatting, and content exactly as they are.",
-            "why":  "Perfect for combining reports, invoices, scanned documents, or contracts into one clean file. No more sending 10 attachments!",
-            "how":  ["Upload two or more PDF files using the uploader.",
-                     "Use ⬆ / ⬇ buttons to arrange the order you want pages to appear.",
-                     "Click 'Merge PDFs' and wait for the process to complete.",
-                     "Download your merged PDF with one click."],
-            "tip":  "💡 The order in the list = the order of pages in the final PDF.",
-        },
-        "bn": {
-            "what": "PDF Merger একাধিক PDF ফাইলকে একটি single document-এ merge করে — সব পেজ, ফরম্যাটিং এবং কন্টেন্ট হুবহু রেখে।",
-            "why":  "রিপোর্ট, ইনভয়েস, স্ক্যান করা ডকুমেন্ট বা contract একটি ফাইলে আনতে পারফেক্ট। ১০টা attachment আলাদা পাঠানো আর লাগবে না!",
-            "how":  ["Uploader দিয়ে দুই বা তার বেশি PDF ফাইল আপলোড করুন।",
-                     "⬆ / ⬇ বাটন দিয়ে ফাইলের ক্রম সাজান।",
-                     "'Merge PDFs' বাটনে ক্লিক করুন এবং শেষ হওয়া পর্যন্ত অপেক্ষা করুন।",
-                     "একটি ক্লিকে merged PDF ডাউনলোড করুন।"],
-            "tip":  "💡 তালিকার ক্রম = final PDF-এর পেজ ক্রম।",
-        },
-    },
-    "excel": {
-        "en": {
-            "what": "Excel Merger stacks multiple .xlsx files into one unified spreadsheet — combining all rows from every file into a single sheet.",
-            "why":  "Ideal for consolidating monthly sales data, multi-region reports, team submissions, or any data split across multiple Excel files.",
-            "how":  ["Upload two or more .xlsx files.",
-                     "Reorder them if needed — top file's data appears first.",
-                     "Click 'Merge Excel' to combine all files.",
-                     "Download the merged .xlsx file."],
-            "tip":  "💡 All files must have the same column headers for a clean merge. Mismatched columns create extra empty cells.",
-        },
-        "bn": {
-            "what": "Excel Merger একাধিক .xlsx ফাইলের সব row একটি single spreadsheet-এ একত্রিত করে।",
-            "why":  "মাসিক sales data, multi-region রিপোর্ট, বা যেকোনো ডেটা যা একাধিক Excel ফাইলে ছড়ানো — সব এক করতে আদর্শ।",
-            "how":  ["দুই বা তার বেশি .xlsx ফাইল আপলোড করুন।",
-                     "প্রয়োজনে ক্রম পরিবর্তন করুন — প্রথম ফাইলের ডেটা সবার আগে আসবে।",
-                     "'Merge Excel' বাটনে ক্লিক করুন।",
-                     "Merged .xlsx ফাইল ডাউনলোড করুন।"],
-            "tip":  "💡 সুন্দরভাবে merge হতে সব ফাইলের column header একই থাকতে হবে।",
-        },
-    },
-    "csv": {
-        "en": {
-            "what": "CSV Merger combines multiple CSV files into one single CSV — appending all rows together in sequence.",
-            "why":  "Great for combining CRM exports, database dumps, web scraping results, or bulk data split across many CSV files.",
-            "how":  ["Upload two or more .csv files.",
-                     "Arrange the order using ⬆ / ⬇ if needed.",
-                     "Click 'Merge CSVs' to combine.",
-                     "Download your unified CSV file."],
-            "tip":  "💡 CSVs should have matching column names. Duplicate header rows from individual files are automatically removed.",
-        },
-        "bn": {
-            "what": "CSV Merger একাধিক CSV ফাইলের সব row একটি single CSV ফাইলে একত্রিত করে — একটার পর একটা সাজিয়ে।",
-            "why":  "CRM export, database dump, web scraping result বা যেকোনো bulk ডেটা যা একাধিক CSV-তে বিভক্ত — সব এক করতে দারুণ।",
-            "how":  ["দুই বা তার বেশি .csv ফাইল আপলোড করুন।",
-                     "প্রয়োজনে ⬆ / ⬇ দিয়ে ক্রম সাজান।",
-                     "'Merge CSVs' বাটনে ক্লিক করুন।",
-                     "Unified CSV ফাইল ডাউনলোড করুন।"],
-            "tip":  "💡 CSV গুলোর column নাম মিলতে হবে। আলাদা ফাইলের duplicate header row স্বয়ংক্রিয়ভাবে সরে যায়।",
-        },
-    },
-    "e2c": {
-        "en": {
-            "what": "Excel to CSV Converter transforms your .xlsx spreadsheet into a lightweight, universally compatible .csv text file.",
-            "why":  "CSV files are smaller, faster to load, and work with almost every tool — databases, Python, Google Sheets, and APIs. Use when you need raw data without Excel formatting.",
-            "how":  ["Upload a single .xlsx Excel file.",
-                     "Check the row and column count preview.",
-                     "Click 'Convert to CSV'.",
-                     "Download your .csv file instantly."],
-            "tip":  "💡 Only the first sheet of the Excel file is converted. Make sure your data is on Sheet 1.",
-        },
-        "bn": {
-            "what": "Excel to CSV Converter আপনার .xlsx spreadsheet-কে lightweight, universally compatible .csv text ফাইলে রূপান্তর করে।",
-            "why":  "CSV ফাইল ছোট, দ্রুত লোড হয় এবং প্রায় সব tool-এ কাজ করে — database, Python, Google Sheets, API ইত্যাদি।",
-            "how":  ["একটি .xlsx Excel ফাইল আপলোড করুন।",
-                     "Row এবং column সংখ্যা preview দেখুন।",
-                     "'Convert to CSV' বাটনে ক্লিক করুন।",
-                     "তাৎক্ষণিকভাবে .csv ফাইল ডাউনলোড করুন।"],
-            "tip":  "💡 শুধুমাত্র Excel ফাইলের প্রথম sheet convert হবে। নিশ্চিত করুন ডেটা Sheet 1-এ আছে।",
-        },
-    },
-    "c2e": {
-        "en": {
-            "what": "CSV to Excel Converter turns your plain .csv file into a fully formatted .xlsx Excel spreadsheet, ready for analysis or sharing.",
-            "why":  "Excel format is better for sharing with non-technical users, applying formulas, conditional formatting, charts, and professional presentation.",
-            "how":  ["Upload a single .csv file.",
-                     "Check the row and column preview.",
-                     "Click 'Convert to Excel'.",
-                     "Download the .xlsx file — open it in Excel or Google Sheets."],
-            "tip":  "💡 UTF-8 encoding is used. Special characters (Bengali, Arabic, Chinese) are preserved correctly.",
-        },
-        "bn": {
-            "what": "CSV to Excel Converter আপনার plain .csv ফাইলকে একটি fully formatted .xlsx Excel spreadsheet-এ রূপান্তর করে।",
-            "why":  "Excel format non-technical user-দের সাথে share করতে, formula, chart এবং professional presentation-এর জন্য উপযুক্ত।",
-            "how":  ["একটি .csv ফাইল আপলোড করুন।",
-                     "Row এবং column preview চেক করুন।",
-                     "'Convert to Excel' বাটনে ক্লিক করুন।",
-                     ".xlsx ফাইল ডাউনলোড করুন এবং Excel বা Google Sheets-এ খুলুন।"],
-            "tip":  "💡 Tool টি UTF-8 encoding ব্যবহার করে। বাংলা সহ যেকোনো special character সঠিকভাবে preserve হবে।",
-        },
-    },
-    "split": {
-        "en": {
-            "what": "File Splitter breaks a large CSV or Excel file into multiple smaller files — each with a set number of rows — packaged into a ZIP.",
-            "why":  "Essential when uploading to platforms with row limits, sending data chunks to team members, batch processing large files, or meeting API import limits.",
-            "how":  ["Upload a .csv or .xlsx file.",
-                     "Set how many rows per output file (e.g. 100, 500, 1000).",
-                     "The tool shows how many files will be created.",
-                     "Click 'Split Files' — download a ZIP with all parts."],
-            "tip":  "💡 The header row is automatically included in every split file. Files are named part_1, part_2, part_3...",
-        },
-        "bn": {
-            "what": "File Splitter একটি বড় CSV বা Excel ফাইলকে ছোট ছোট ফাইলে ভাগ করে — প্রতিটিতে নির্ধারিত সংখ্যক row — এবং সব ZIP-এ প্যাক করে।",
-            "why":  "Platform-এ row limit থাকলে, team member-দের chunk পাঠাতে, বড় ফাইল batch-এ process করতে বা API import limit মানতে অপরিহার্য।",
-            "how":  [".csv অথবা .xlsx ফাইল আপলোড করুন।",
-                     "প্রতি output ফাইলে কত row চান তা সেট করুন (যেমন ১০০, ৫০০, ১০০০)।",
-                     "Tool টি দেখাবে কতটি ফাইল তৈরি হবে।",
-                     "'Split Files' ক্লিক করুন — সব part সহ একটি ZIP ডাউনলোড হবে।"],
-            "tip":  "💡 Header row স্বয়ংক্রিয়ভাবে প্রতিটি split ফাইলে যোগ হয়। ফাইলগুলো part_1, part_2, part_3... নামে সংরক্ষিত হয়।",
-        },
-    },
-}
-
 # ---------- CSS ----------
-st.markdown(f"""
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700;800&display=swap');
-
-* {{
-    font-family: 'Inter', sans-serif;
-    transition: background 0.3s, color 0.3s;
-    margin: 0; padding: 0;
-    box-sizing: border-box;
-}}
-body {{ background: {t['bg']}; }}
-.main {{ padding: 0 !important; }}
-.block-container {{ padding: 1rem 2rem !important; max-width: 100% !important; }}
-
-/* ── Tool Cards ── */
-.tool-card {{
-    background: {t['card']};
-    padding: 1.5rem;
-    border-radius: 15px;
-    text-align: center;
-    border: 1px solid {t['primary']}33;
-    transition: transform 0.3s, box-shadow 0.3s;
-    height: 100%;
-    min-height: 180px;
-    display: flex;
-    flex-direction: column;
-    justify-content: space-between;
-    align-items: center;
-}}
-.tool-card:hover {{
-    transform: translateY(-5px);
-    box-shadow: 0 10px 30px {t['primary']}44;
-}}
-.tool-icon {{
-    font-size: 3rem;
-    transition: transform 0.5s cubic-bezier(0.34,1.56,0.64,1);
-    margin-bottom: 0.5rem;
-    display: inline-block;
-}}
-.tool-card:hover .tool-icon {{ transform: rotate(360deg) scale(1.15); }}
-.tool-name {{
-    color: {t['primary']};
-    font-size: 1.05rem;
-    font-weight: 600;
-    margin: 0.5rem 0;
-}}
-
-/* ── Title ── */
-.title {{
-    text-align: center;
-    font-size: 2.5rem;
-    font-weight: 800;
-    background: linear-gradient(135deg, {t['primary']}, #ff00ff);
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-    animation: glow 2s infinite alternate;
-    margin-bottom: 0.4rem;
-}}
-@keyframes glow {{
-    from {{ filter: drop-shadow(0 0 5px {t['primary']}88); }}
-    to   {{ filter: drop-shadow(0 0 22px #ff00ff88); }}
-}}
-
-/* ── Guide Panel ── */
-.guide-panel {{
-    background: {t['guide']};
-    border: 1px solid {t['primary']}44;
-    border-radius: 14px;
-    padding: 1.3rem 1.6rem;
-    margin-bottom: 1.2rem;
-    animation: fadeSlide 0.4s ease;
-}}
-@keyframes fadeSlide {{
-    from {{ opacity: 0; transform: translateY(-10px); }}
-    to   {{ opacity: 1; transform: translateY(0); }}
-}}
-.guide-section {{ margin-bottom: 1rem; }}
-.guide-label {{
-    color: {t['primary']};
-    font-weight: 700;
-    font-size: 0.8rem;
-    letter-spacing: 0.08em;
-    text-transform: uppercase;
-    margin-bottom: 0.35rem;
-}}
-.guide-text {{
-    color: {t['secondary']};
-    font-size: 0.92rem;
-    line-height: 1.65;
-}}
-.guide-step {{
-    color: {t['secondary']};
-    font-size: 0.9rem;
-    line-height: 1.8;
-    padding-left: 0.3rem;
-}}
-.step-num {{
-    color: {t['primary']};
-    font-weight: 700;
-    margin-right: 0.45rem;
-    font-size: 0.95rem;
-}}
-.guide-tip {{
-    background: {t['primary']}15;
-    border-left: 3px solid {t['primary']};
-    padding: 0.6rem 1rem;
-    border-radius: 0 8px 8px 0;
-    color: {t['secondary']};
-    font-size: 0.87rem;
-    margin-top: 0.5rem;
-    line-height: 1.5;
-}}
-
-/* ── Processing Animation ── */
-.proc-wrap {{
-    display: flex;
-    flex-direction: column;
-    align-items: center;
-    padding: 1.8rem 1rem;
-    animation: fadeSlide 0.3s ease;
-}}
-.proc-ring {{
-    width: 56px;
-    height: 56px;
-    border: 4px solid {t['primary']}33;
-    border-top-color: {t['primary']};
-    border-radius: 50%;
-    animation: spin 0.75s linear infinite;
-    margin-bottom: 0.9rem;
-}}
-@keyframes spin {{ to {{ transform: rotate(360deg); }} }}
-.proc-label {{
-    color: {t['primary']};
-    font-size: 1rem;
-    font-weight: 600;
-    animation: blink 1.2s ease-in-out infinite;
-}}
-@keyframes blink {{ 0%,100% {{ opacity:1; }} 50% {{ opacity:0.45; }} }}
-.proc-counter {{
-    color: {t['secondary']};
-    font-size: 0.85rem;
-    margin-top: 0.3rem;
-}}
-.prog-outer {{
-    width: 220px;
-    height: 5px;
-    background: {t['primary']}22;
-    border-radius: 10px;
-    margin-top: 0.8rem;
-    overflow: hidden;
-}}
-.prog-inner {{
-    height: 100%;
-    background: linear-gradient(90deg, {t['primary']}, #ff00ff);
-    border-radius: 10px;
-    transition: width 0.2s ease;
-}}
-
-/* ── Done Animation ── */
-.done-wrap {{
-    text-align: center;
-    padding: 1.2rem;
-    animation: popIn 0.4s cubic-bezier(0.34,1.56,0.64,1);
-}}
-@keyframes popIn {{
-    from {{ transform: scale(0.6); opacity: 0; }}
-    to   {{ transform: scale(1);   opacity: 1; }}
-}}
-.done-icon {{ font-size: 2.8rem; }}
-.done-text {{
-    color: {t['primary']};
-    font-size: 1.05rem;
-    font-weight: 700;
-    margin-top: 0.5rem;
-}}
-
-/* ── File list ── */
-.history-item {{
-    background: {t['card']};
-    padding: 10px 14px;
-    margin: 6px 0;
-    border-radius: 8px;
-    border-left: 3px solid {t['primary']};
-    font-size: 0.88rem;
-}}
-
-/* ── Footer ── */
-.custom-footer {{
-    text-align: center;
-    padding: 18px;
-    color: {t['secondary']};
-    font-size: 13px;
-    margin-top: 1rem;
-}}
-.highlight-dev  {{ color: #00ff99; font-weight: 700; }}
-.highlight-spon {{ color: #ff0066; font-weight: 700; }}
-
-/* ── Divider ── */
-.fancy-divider {{
-    height: 2px;
-    background: linear-gradient(90deg, {t['primary']}55, transparent);
-    border-radius: 2px;
-    margin: 0.8rem 0 1rem 0;
-}}
-
-#MainMenu, footer, header {{ visibility: hidden; }}
-[data-testid="stSidebar"] {{ display: none; }}
-
-@media (max-width: 768px) {{
-    .title {{ font-size: 1.8rem; }}
-    .tool-icon {{ font-size: 2.5rem; }}
-    .tool-card {{ min-height: 150px; padding: 1rem; }}
-}}
-</style>
-""", unsafe_allow_html=True)
+st.markdown(styles.css(st.session_state.theme), unsafe_allow_html=True)
 
 
 # ═══════════════════════════════════════════════════════
@@ -389,10 +58,261 @@ def file_size(b: int) -> str:
     return f"{b:.1f} TB"
 
 
-def add_history(tool: str, files: list, output: str, count: int):
+def upload_hash(f) -> str:
+    # একই upload-এর hash একবারই গুনি (file_id প্রতিটি upload-এ আলাদা)
+    hashes = st.session_state.upload_hashes
+    if f.file_id not in hashes:
+        hashes[f.file_id] = cache.content_hash(f)
+    return hashes[f.file_id]
+
+
+def upload_probe(f, ext: str) -> tuple:
+    # (row, column, exact) metadata / newline গুনে, upload প্রতি একবার — পুরো parse button চাপার পর job-এ
+    headers = st.session_state.headers
+    if (f.file_id, "probe") not in headers:
+        headers[(f.file_id, "probe")] = readers.probe(f, ext)
+    return headers[(f.file_id, "probe")]
+
+
+def shape_info(n_rows: int, n_cols: int, exact: bool = True) -> str:
+    # exact না হলে (quote-এর ভেতরে newline, xlsx-এর metadata থেকে গোনা) "~"
+    n = f"{n_rows:,}" if exact else f"~{n_rows:,}"
+    return f"📊 {n} rows × {n_cols} columns" if L == "en" else f"📊 {n} row × {n_cols} column"
+
+
+def cached_frame(key: tuple, trace):
+    # job-এর ভেতরে (worker thread, st.* নয়); key = (upload hash, ext, compact)। একই upload আগে
+    # পড়া হয়ে থাকলে frame cache থেকে — option বদলে আবার চালালে parse হয় না। না থাকলে None:
+    # job তখন ফাইলটা chunk ধরে stream করে, পুরো frame কখনো memory-তে নেয় না
+    df = cache.frames.get(key)
+    if df is not None:
+        trace.add("parse", calls=0, frame_cache=True)
+    return df
+
+
+def frame_keeper(key: tuple):
+    # stream-এর keep callback: পুরো ফাইল একটা chunk-এই এঁটে গেলে (ছোট upload) সেটাই frame cache-এ
+    def keep(df):
+        if key[2]:
+            import schema
+            df = schema.compact(df)
+        cache.frames.put(key, df)
+    return keep
+
+
+def show_parse(r: dict):
+    # job-এর parse-এর ফল (result cache থেকে এলে parse-ই হয়নি)
+    if r.get("cached"):
+        return
+    if r.get("frame_cache"):
+        st.caption("⚡ Loaded from cache" if L == "en" else "⚡ Cache থেকে লোড হয়েছে")
+    if r.get("read"):
+        st.caption(f"📈 {r['read']}")
+    show_memory(r.get("mem"))
+
+
+def format_select(key: str, options: tuple) -> str:
+    lbl = "📦 Output format" if L == "en" else "📦 Output ফরম্যাট"
+    return st.selectbox(lbl, options, key=f"fmt_{key}", format_func=lambda e: f".{e}")
+
+
+def compact_toggle(key: str) -> bool:
+    lbl = "🧮 Compact dtypes (less memory)" if L == "en" else "🧮 Compact dtype (কম memory)"
+    return st.checkbox(lbl, key=f"compact_{key}",
+                       help="category / nullable & downcast integers — blank-containing integer columns stay integers")
+
+
+def upload_columns(files: list, default_ext: str) -> list:
+    # সব upload-এর column (প্রথম দেখার ক্রমে)। header একবারই পড়ি (upload প্রতি), প্রতিটি rerun-এ xlsx খুলতে হয় না
+    headers = st.session_state.headers
+    cols = []
+    for f in files:
+        if f.file_id not in headers:
+            headers[f.file_id] = readers.table_columns(f, engine.input_ext(f, default_ext))
+        cols += headers[f.file_id]
+    return list(dict.fromkeys(cols))
+
+
+def upload_sheets(f) -> list:
+    # workbook-এর sheet নাম, upload প্রতি একবার (শুধু workbook.xml পড়া, sheet parse হয় না)
+    headers = st.session_state.headers
+    if (f.file_id, "sheets") not in headers:
+        headers[(f.file_id, "sheets")] = readers.xlsx_sheet_names(f)
+    return headers[(f.file_id, "sheets")]
+
+
+def dedupe_keys(key: str, files: list, default_ext: str):
+    # None → dedupe বন্ধ; [] → পুরো row মিলিয়ে; নাহলে শুধু বাছাই করা column মিললেই duplicate
+    lbl = "🧹 Remove duplicate rows across files" if L == "en" else "🧹 সব ফাইল জুড়ে duplicate row বাদ দিন"
+    if not st.checkbox(lbl, key=f"dedupe_{key}", help="keeps the first copy; memory stays bounded (spills to disk)"):
+        return None
+    lbl = "Compare only these columns (empty = whole row)" if L == "en" else "শুধু এই column গুলো মিলাও (খালি = পুরো row)"
+    return st.multiselect(lbl, upload_columns(files, default_ext), key=f"dedupe_keys_{key}")
+
+
+def sort_key_select(key: str, files: list, default_ext: str, streaming: bool):
+    # None → ফাইলের ক্রমেই জোড়া; নাহলে output এই column-এ sorted
+    lbl = "↕ Sort output by column" if L == "en" else "↕ Output এই column ধরে sort করুন"
+    if not st.checkbox(lbl, key=f"sort_{key}"):
+        return None
+    if streaming:
+        help_ = ("Each file must already be sorted by this column (e.g. daily shards by timestamp) — they are merged "
+                 "in one pass without loading everything.")
+    else:
+        help_ = "Everything is loaded and sorted in memory."
+    return st.selectbox("Key column", upload_columns(files, default_ext),
+                        key=f"sort_key_{key}", help=help_)
+
+
+def show_dedupe(report: dict):
+    if not report:
+        return
+    if L == "en":
+        text = f"🧹 {report['dropped']:,} duplicate rows dropped of {report['rows']:,}"
+    else:
+        text = f"🧹 {report['rows']:,} row-এর মধ্যে {report['dropped']:,}টি duplicate বাদ"
+    if report["keys"]:
+        text += f" · key: {', '.join(map(str, report['keys']))}"
+    if report["spilled_runs"]:
+        text += f" · 💾 {file_size(report['spilled_bytes'])} spilled"
+    st.caption(text)
+
+
+def show_memory(mem: dict):
+    if not mem:
+        return
+    text = f"🧮 peak {file_size(mem['peak'])}"
+    if "frames_before" in mem:
+        text += f" · frames {file_size(mem['frames_before'])} → {file_size(mem['frames'])}"
+    st.caption(text)
+
+
+def new_output(tool_key: str) -> spill.SpillBuffer:
+    # job budget ছাড়ালে output disk-এ spill হয়। Buffer session_state-এ থাকে যাতে
+    # download click পর্যন্ত বেঁচে থাকে; একই tool আবার চালালে আগেরটা মুছে যায় — তবে আগের job
+    # (বাতিল হলেও) শেষ হওয়ার পর, কারণ তার thread তখনো ওই buffer-এ লিখতে পারে।
+    # session শেষ হলে garbage collect হয়ে spill file-ও মুছে যায়
+    old = st.session_state.outputs.pop(tool_key, None)
+    if old is not None:
+        job = st.session_state.jobs.get(tool_key)
+        if job is not None:
+            job.after(old.close)
+        else:
+            old.close()
+    out = spill.SpillBuffer()
+    st.session_state.outputs[tool_key] = out
+    return out
+
+
+def offer_download(label: str, out: spill.SpillBuffer, name: str, mime: str):
+    if out.spilled:
+        st.caption(f"💾 {file_size(out.size)} — " + ("streamed from disk" if L == "en" else "disk থেকে stream হবে"))
+    st.download_button(label, out.download_data(), name, mime=mime)
+
+
+def run_job(tool_key: str, label: str, work, files: list, options: dict):
+    # work(progress, out, trace) → result dict; worker thread-এ চলে, তাই ভেতরে st.* ডাকা যাবে না।
+    # progress একটা progress.Meter: engine-এর on_file / on_part হিসেবে দিন, আর progress.track(files)
+    # দিয়ে input মুড়ে দিলে ফাইলের ভেতরের byte-ও গোনা হয়।
+    # একই tool-এর আগের job চলতে থাকলে বাতিল করে নতুনটা queue-তে দিই।
+    # ক্রমসহ input hash + option একই হলে আগের output result cache থেকে আসে।
+    # trace: upload (hash করতে পুরো upload পড়া) থেকে download পর্যন্ত প্রতিটি stage-এর হিসাব
+    old = st.session_state.jobs.get(tool_key)
+    if old is not None and old.active:
+        jobs.runner.cancel(old)
+    out = new_output(tool_key)
+    trace = stages.Trace(tool_key, session=st.session_state.sid, options=options)
+    with trace.stage("upload", sum(f.size for f in files)):
+        key = cache.result_key(tool_key, [upload_hash(f) for f in files], options)
+
+    def cached_work(progress):
+        with trace:
+            with trace.stage("cache", out=out):
+                result = cache.results.get(key, out)
+            if result is not None:
+                result["cached"] = True
+                return result
+            result = work(progress, out, trace)
+            with trace.stage("cache"):
+                cache.results.put(key, out, result)
+            return result
+
+    st.session_state.jobs[tool_key] = jobs.runner.submit(st.session_state.sid, label, cached_work, trace)
+
+
+def show_job(tool_key: str, finish):
+    # job চলার সময় fragment সেকেন্ডে progress.HZ বার শুধু progress অংশটা rerun করে — engine যত ঘন
+    # ঘন callback দিক না কেন, browser-এ এর বেশি update যায় না। শেষ হলে পুরো app একবার rerun হয়,
+    # তারপর finish(loader, result, out) ফলাফল আর download দেখায়
+    job = st.session_state.jobs.get(tool_key)
+    if job is None:
+        return
+    polling = job.active
+
+    @st.fragment(run_every=1 / progress.HZ if polling else None)
+    def job_panel():
+        loader = st.empty()
+        if job.active:
+            if job.state == "queued":
+                ahead = jobs.runner.position(job)
+                lbl = f"Queued — {ahead} job(s) ahead" if L == "en" else f"অপেক্ষায় — আগে {ahead}টি job"
+                show_processing(loader, 0, 1, lbl)
+            else:
+                snap = job.meter.snapshot(job.trace.rows_done() if job.trace else 0,
+                                          st.session_state.outputs[tool_key].size)
+                i, n = snap["units"]
+                # চলমান অবস্থায় 100% না দেখাই: শেষ ফাইল পড়া হলেও লেখা বাকি থাকতে পারে
+                show_processing(loader, i, n, job.label, min(99, int(snap["fraction"] * 100)), progress_detail(snap))
+            if st.button("✖ Cancel" if L == "en" else "✖ বাতিল", key=f"cancel_{tool_key}"):
+                jobs.runner.cancel(job)
+                st.rerun()
+            return
+        if polling:
+            st.rerun()
+        out = st.session_state.outputs[tool_key]
+        if job.state == "done":
+            cached = job.result.get("cached", False)
+            finish(loader, job.result, out)
+            if cached:
+                st.caption("⚡ Result reused from cache" if L == "en" else "⚡ আগের ফলাফল cache থেকে")
+            if not job.recorded:
+                add_history(*job.result["history"], cached=cached)
+                # download browser-এ হয়: এখানে শুধু কত byte, আর disk থেকে stream হবে কিনা
+                job.trace.add("download", bytes_out=out.size, calls=0, spilled=out.spilled)
+        elif job.state == "failed":
+            st.error(f"❌ Error: {job.error}")
+        else:
+            st.warning("⏹ Cancelled" if L == "en" else "⏹ বাতিল হয়েছে")
+        if not job.recorded:
+            job.trace.log(job=job.id, state=job.state, cached=job.state == "done" and job.result.get("cached", False),
+                          error=repr(job.error) if job.error else None)
+            job.recorded = True
+        show_diagnostics(job.trace)
+
+    job_panel()
+
+
+def show_diagnostics(trace: "stages.Trace"):
+    d = trace.to_dict()
+    with st.expander("🩺 Diagnostics" if L == "en" else "🩺 Diagnostics (ধাপে ধাপে সময় ও memory)"):
+        total = d["total_seconds"] or 1
+        st.table([{
+            "stage": r["stage"],
+            "time": f"{r['seconds']:.3f} s",
+            "share": f"{r['seconds'] / total:.0%}",
+            "peak memory": "—" if r["peak_bytes"] is None else f"+{file_size(r['peak_bytes'])}",
+            "in": file_size(r["bytes_in"]) if r["bytes_in"] else "—",
+            "out": file_size(r["bytes_out"]) if r["bytes_out"] else "—",
+        } for r in d["stages"]])
+        peak = f" · peak +{file_size(d['peak_bytes'])}" if d["peak_bytes"] is not None else ""
+        st.caption(f"⏱ {d['total_seconds']:.3f} s{peak}")
+        st.json(d, expanded=False)
+
+
+def add_history(tool: str, files: list, output: str, count: int, cached: bool = False):
     st.session_state.history.insert(0, {
         "time": datetime.now().strftime("%H:%M"),
-        "tool": tool, "output": output, "count": count,
+        "tool": tool, "output": output, "count": count, "cached": cached,
     })
     st.session_state.history = st.session_state.history[:5]
 
@@ -410,10 +330,17 @@ def show_files(files: list, reorder: bool = True) -> list:
         st.session_state.file_keys = current_keys
 
     ordered = [files[i] for i in st.session_state.file_order]
+    dialect = None
     for idx, f in enumerate(ordered):
         c1, c2, c3 = st.columns([3, 2, 1])
         c1.markdown(f'<div style="color:{t["primary"]};font-size:13px">📄 {f.name}</div>', unsafe_allow_html=True)
-        c2.markdown(f'<div style="color:{t["secondary"]};font-size:13px">{file_size(f.size)}</div>', unsafe_allow_html=True)
+        size = file_size(f.size)
+        if engine.file_ext(f.name) == "csv":
+            # ধরা dialect মনে থাকে, job-এ আর detect হয় না; সাধারণ utf-8 / "," হলে কিছু দেখাই না
+            dialect = csvio.sniff(f, dialect)
+            if not dialect.is_default:
+                size += f" · {dialect.describe()}"
+        c2.markdown(f'<div style="color:{t["secondary"]};font-size:13px">{size}</div>', unsafe_allow_html=True)
         if reorder and len(files) > 1:
             with c3:
                 s1, s2 = st.columns(2)
@@ -437,42 +364,36 @@ def show_files(files: list, reorder: bool = True) -> list:
 
 
 def show_guide(tool_key: str):
-    g = GUIDE[tool_key][L]
-    labels = {
-        "en": {"what": "🔍 What is this?",       "why": "🎯 Why use it?",              "how": "📋 How to use?"},
-        "bn": {"what": "🔍 এটা কী?",              "why": "🎯 কেন ব্যবহার করবেন?",      "how": "📋 কীভাবে ব্যবহার করবেন?"},
-    }
-    lb = labels[L]
-    steps_html = "".join(
-        f'<div class="guide-step"><span class="step-num">{i}.</span>{step}</div>'
-        for i, step in enumerate(g["how"], 1)
-    )
-    st.markdown(f"""
-    <div class="guide-panel">
-        <div class="guide-section">
-            <div class="guide-label">{lb['what']}</div>
-            <div class="guide-text">{g['what']}</div>
-        </div>
-        <div class="guide-section">
-            <div class="guide-label">{lb['why']}</div>
-            <div class="guide-text">{g['why']}</div>
-        </div>
-        <div class="guide-section">
-            <div class="guide-label">{lb['how']}</div>
-            {steps_html}
-        </div>
-        <div class="guide-tip">{g['tip']}</div>
-    </div>
-    """, unsafe_allow_html=True)
-
-
-def show_processing(loader, i: int, total: int, label: str):
-    pct = int(i / total * 100)
+    st.markdown(guide.html(tool_key, L), unsafe_allow_html=True)
+
+
+def progress_detail(snap: dict) -> str:
+    # "12.0 MB / 40.0 MB · 120,000 rows · → 3.1 MB · 8.0 MB/s · ETA 4 s"
+    parts = [f"pass {snap['pass']}"] if snap["pass"] > 1 else []
+    if snap["total_bytes"]:
+        parts.append(f"{file_size(snap['done_bytes'])} / {file_size(snap['total_bytes'])}")
+    if snap["rows"]:
+        parts.append(f"{snap['rows']:,} rows" if L == "en" else f"{snap['rows']:,} row")
+    if snap["written"]:
+        parts.append(f"→ {file_size(snap['written'])}")
+    if snap["bytes_per_sec"]:
+        parts.append(f"{file_size(snap['bytes_per_sec'])}/s")
+    elif snap["rows_per_sec"]:
+        parts.append(f"{snap['rows_per_sec']:,.0f} rows/s")
+    if snap["eta"] is not None:
+        parts.append(f"ETA {progress.format_eta(snap['eta'])}" if L == "en" else f"বাকি ~{progress.format_eta(snap['eta'])}")
+    return " &nbsp;·&nbsp; ".join(parts)
+
+
+def show_processing(loader, i: int, total: int, label: str, pct: int = None, detail: str = ""):
+    pct = int(i / total * 100) if pct is None else pct
+    detail = f'<div class="proc-counter">{detail}</div>' if detail else ""
     loader.markdown(f"""
     <div class="proc-wrap">
         <div class="proc-ring"></div>
         <div class="proc-label">{label}</div>
         <div class="proc-counter">{i} / {total} &nbsp;·&nbsp; {pct}%</div>
+        {detail}
         <div class="prog-outer">
             <div class="prog-inner" style="width:{pct}%"></div>
         </div>
@@ -576,7 +497,8 @@ if st.session_state.tool is None:
             st.markdown(
                 f'<div class="history-item" style="color:{t["secondary"]}">'
                 f'<span style="color:{t["primary"]};font-weight:600">[{h["time"]}] {h["tool"]}</span>'
-                f' — {h["count"]} file(s) → {h["output"]}</div>',
+                f' — {h["count"]} file(s) → {h["output"]}'
+                f'{" ⚡ cached" if h.get("cached") else ""}</div>',
                 unsafe_allow_html=True
             )
 
@@ -591,6 +513,13 @@ if st.session_state.tool is None:
 # TOOL PAGES
 # ═══════════════════════════════════════════════════════
 else:
+    import csvio
+    import dedupe
+    import engine
+    import readers
+    import stages
+    import writers
+
     top_bar_tool()
     st.markdown('<div style="margin-bottom:0.6rem"></div>', unsafe_allow_html=True)
 
@@ -603,17 +532,17 @@ else:
     # ── Upload labels ────────────────────────────────────
     ul = {
         "en": {"pdf":   "Upload PDF files (2 or more)",
-               "excel": "Upload Excel files (.xlsx, 2 or more)",
-               "csv":   "Upload CSV files (2 or more)",
+               "excel": "Upload Excel files (.xlsx, 2 or more — .parquet / .feather also work)",
+               "csv":   "Upload CSV files (2 or more — .parquet / .feather also work)",
                "e2c":   "Upload your Excel file (.xlsx)",
-               "c2e":   "Upload your CSV file",
-               "split": "Upload CSV or Excel file to split"},
+               "c2e":   "Upload your CSV (or .parquet / .feather) file",
+               "split": "Upload CSV, Excel, Parquet or Feather file to split"},
         "bn": {"pdf":   "PDF ফাইল আপলোড করুন (২টি বা বেশি)",
-               "excel": "Excel ফাইল আপলোড করুন (.xlsx, ২টি বা বেশি)",
-               "csv":   "CSV ফাইল আপলোড করুন (২টি বা বেশি)",
+               "excel": "Excel ফাইল আপলোড করুন (.xlsx, ২টি বা বেশি — .parquet / .feather-ও চলবে)",
+               "csv":   "CSV ফাইল আপলোড করুন (২টি বা বেশি — .parquet / .feather-ও চলবে)",
                "e2c":   "আপনার Excel ফাইল আপলোড করুন (.xlsx)",
-               "c2e":   "আপনার CSV ফাইল আপলোড করুন",
-               "split": "Split করার জন্য CSV বা Excel ফাইল আপলোড করুন"},
+               "c2e":   "আপনার CSV (বা .parquet / .feather) ফাইল আপলোড করুন",
+               "split": "Split করার জন্য CSV, Excel, Parquet বা Feather ফাইল আপলোড করুন"},
     }
 
     # ════════ PDF MERGER ════════════════════════════════
@@ -621,166 +550,292 @@ else:
         files = st.file_uploader(ul[L]["pdf"], type="pdf", accept_multiple_files=True)
         if files:
             ordered = show_files(files)
+            dd_lbl = "🧬 Deduplicate shared fonts & images (smaller file)" if L == "en" else "🧬 একই font ও image একবার রাখুন (ছোট ফাইল)"
+            # বড় merge-এ dedupe (compress_identical_objects) নিজেই সময় নেয়, তাই চাইলে তবেই
+            dedupe = st.checkbox(dd_lbl, value=False)
             btn = "🔗 Merge PDFs" if L == "en" else "🔗 PDF Merge করুন"
             if st.button(btn, type="primary"):
-                loader = st.empty()
-                writer = PdfWriter()
-                try:
-                    for i, f in enumerate(ordered, 1):
-                        lbl = "Merging PDFs..." if L == "en" else "PDF merge হচ্ছে..."
-                        show_processing(loader, i, len(ordered), lbl)
-                        for page in PdfReader(f).pages:
-                            writer.add_page(page)
-                    out = io.BytesIO()
-                    writer.write(out)
-                    out.seek(0)
-                    msg = f"{len(ordered)} PDFs merged successfully!" if L == "en" else f"{len(ordered)}টি PDF সফলভাবে merge হয়েছে!"
-                    show_done(loader, msg)
-                    add_history("PDF Merger", [f.name for f in ordered], "merged.pdf", len(ordered))
-                    dl = "⬇️ Download merged.pdf" if L == "en" else "⬇️ merged.pdf ডাউনলোড করুন"
-                    st.download_button(dl, out, "merged.pdf", mime="application/pdf")
-                except Exception as e:
-                    loader.empty()
-                    st.error(f"❌ Error: {e}")
+                def work(progress, out, trace):
+                    sizes = {}
+                    engine.merge_pdfs(progress.track(ordered), out, progress, dedupe, sizes, trace)
+                    return {"count": len(ordered), "dedupe": dedupe, "sizes": sizes,
+                            "history": ("PDF Merger", [f.name for f in ordered], "merged.pdf", len(ordered))}
+                run_job("pdf", "Merging PDFs..." if L == "en" else "PDF merge হচ্ছে...", work, ordered, {"dedupe": dedupe})
+
+            def finish(loader, r, out):
+                msg = f"{r['count']} PDFs merged successfully!" if L == "en" else f"{r['count']}টি PDF সফলভাবে merge হয়েছে!"
+                show_done(loader, msg)
+                if r["dedupe"]:
+                    # dedupe ছাড়া output কত হতো তা মাপতে পুরো PDF আবার serialise করতে হয়; তাই ইনপুটের মোট size
+                    s = r["sizes"]
+                    if L == "en":
+                        st.caption(f"🧬 input total {file_size(s['inputs'])} · merged PDF {file_size(s['after'])}")
+                    else:
+                        st.caption(f"🧬 ইনপুট মোট {file_size(s['inputs'])} · merge করা PDF {file_size(s['after'])}")
+                dl = "⬇️ Download merged.pdf" if L == "en" else "⬇️ merged.pdf ডাউনলোড করুন"
+                offer_download(dl, out, "merged.pdf", "application/pdf")
+            show_job("pdf", finish)
 
     # ════════ EXCEL MERGER ══════════════════════════════
     elif tool == "excel":
-        files = st.file_uploader(ul[L]["excel"], type="xlsx", accept_multiple_files=True)
+        files = st.file_uploader(ul[L]["excel"], type=["xlsx", "parquet", "feather", "arrow"], accept_multiple_files=True)
         if files:
             ordered = show_files(files)
+            par_lbl = f"⚡ Parallel parsing ({engine.MAX_WORKERS} cores)" if L == "en" else f"⚡ Parallel parsing ({engine.MAX_WORKERS}টি core)"
+            workers = engine.MAX_WORKERS if st.checkbox(par_lbl, value=len(ordered) > 2) else 1
+            compact = compact_toggle("excel")
+            keys = dedupe_keys("excel", ordered, "xlsx")
+            out_ext = format_select("excel", writers.TABLE_FORMATS[1::-1] + writers.TABLE_FORMATS[2:])
             btn = "🔗 Merge Excel" if L == "en" else "🔗 Excel Merge করুন"
             if st.button(btn, type="primary"):
-                loader = st.empty()
-                try:
-                    dfs = []
-                    for i, f in enumerate(ordered, 1):
-                        lbl = "Reading files..." if L == "en" else "ফাইল পড়া হচ্ছে..."
-                        show_processing(loader, i, len(ordered), lbl)
-                        dfs.append(pd.read_excel(f, engine="openpyxl"))
-                    merged = pd.concat(dfs, ignore_index=True)
-                    out = io.BytesIO()
-                    merged.to_excel(out, index=False, engine="openpyxl")
-                    out.seek(0)
-                    msg = f"Merged! Total {len(merged)} rows." if L == "en" else f"Merge সম্পন্ন! মোট {len(merged)} row।"
-                    show_done(loader, msg)
-                    add_history("Excel Merger", [f.name for f in ordered], "merged.xlsx", len(ordered))
-                    dl = "⬇️ Download merged.xlsx" if L == "en" else "⬇️ merged.xlsx ডাউনলোড করুন"
-                    st.download_button(dl, out, "merged.xlsx",
-                                       mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
-                except Exception as e:
-                    loader.empty()
-                    st.error(f"❌ Error: {e}")
+                def work(progress, out, trace):
+                    stats, mem = [], {} if compact else None
+                    with dedupe.RowFilter(keys) if keys is not None else nullcontext() as dedup:
+                        total_rows = engine.merge_excel(progress.track(ordered), out, progress, workers, stats, compact, mem,
+                                                        out_ext, trace, dedup)
+                    return {"rows": total_rows, "stats": stats, "mem": mem, "ext": out_ext,
+                            "dedupe": dedup.report() if dedup is not None else None,
+                            "history": ("Excel Merger", [f.name for f in ordered], f"merged.{out_ext}", len(ordered))}
+                run_job("excel", "Reading files..." if L == "en" else "ফাইল পড়া হচ্ছে...", work, ordered,
+                        {"compact": compact, "format": out_ext, "dedupe": keys})
+
+            def finish(loader, r, out):
+                msg = f"Merged! Total {r['rows']} rows." if L == "en" else f"Merge সম্পন্ন! মোট {r['rows']} row।"
+                show_done(loader, msg)
+                if r["stats"]:
+                    st.caption(f"📈 {readers.throughput(r['stats'])}")
+                show_dedupe(r.get("dedupe"))
+                show_memory(r["mem"])
+                name = f"merged.{r['ext']}"
+                dl = f"⬇️ Download {name}" if L == "en" else f"⬇️ {name} ডাউনলোড করুন"
+                offer_download(dl, out, name, writers.MIME_TYPES[r["ext"]])
+            show_job("excel", finish)
 
     # ════════ CSV MERGER ════════════════════════════════
     elif tool == "csv":
-        files = st.file_uploader(ul[L]["csv"], type="csv", accept_multiple_files=True)
+        files = st.file_uploader(ul[L]["csv"], type=["csv", "parquet", "feather", "arrow"], accept_multiple_files=True)
         if files:
             ordered = show_files(files)
+            stream_lbl = "🌊 Streaming mode (low memory)" if L == "en" else "🌊 Streaming mode (কম memory)"
+            streaming = st.checkbox(stream_lbl, value=True)
+            # streaming mode কোনো frame ধরে রাখে না, তাই compact শুধু in-memory merge-এ
+            compact = False if streaming else compact_toggle("csv")
+            sort_key = sort_key_select("csv", ordered, "csv", streaming)
+            keys = dedupe_keys("csv", ordered, "csv")
+            out_ext = format_select("csv", writers.TABLE_FORMATS)
             btn = "🔗 Merge CSVs" if L == "en" else "🔗 CSV Merge করুন"
             if st.button(btn, type="primary"):
-                loader = st.empty()
-                try:
-                    dfs = []
-                    for i, f in enumerate(ordered, 1):
-                        lbl = "Reading files..." if L == "en" else "ফাইল পড়া হচ্ছে..."
-                        show_processing(loader, i, len(ordered), lbl)
-                        dfs.append(pd.read_csv(f))
-                    merged = pd.concat(dfs, ignore_index=True)
-                    out = io.BytesIO()
-                    merged.to_csv(out, index=False)
-                    out.seek(0)
-                    msg = f"Merged! Total {len(merged)} rows." if L == "en" else f"Merge সম্পন্ন! মোট {len(merged)} row।"
-                    show_done(loader, msg)
-                    add_history("CSV Merger", [f.name for f in ordered], "merged.csv", len(ordered))
-                    dl = "⬇️ Download merged.csv" if L == "en" else "⬇️ merged.csv ডাউনলোড করুন"
-                    st.download_button(dl, out, "merged.csv", mime="text/csv")
-                except Exception as e:
-                    loader.empty()
-                    st.error(f"❌ Error: {e}")
+                def work(progress, out, trace):
+                    mem = {} if compact else None
+                    with dedupe.RowFilter(keys) if keys is not None else nullcontext() as dedup:
+                        total_rows = engine.merge_csv(progress.track(ordered), out, progress, streaming, compact, mem,
+                                                      out_ext, trace, dedup, sort_key)
+                    return {"rows": total_rows, "mem": mem, "ext": out_ext,
+                            "dedupe": dedup.report() if dedup is not None else None,
+                            "history": ("CSV Merger", [f.name for f in ordered], f"merged.{out_ext}", len(ordered))}
+                run_job("csv", "Reading files..." if L == "en" else "ফাইল পড়া হচ্ছে...", work, ordered,
+                        {"streaming": streaming, "compact": compact, "format": out_ext, "dedupe": keys,
+                         "sort_key": sort_key})
+
+            def finish(loader, r, out):
+                msg = f"Merged! Total {r['rows']} rows." if L == "en" else f"Merge সম্পন্ন! মোট {r['rows']} row।"
+                show_done(loader, msg)
+                show_dedupe(r.get("dedupe"))
+                show_memory(r["mem"])
+                name = f"merged.{r['ext']}"
+                dl = f"⬇️ Download {name}" if L == "en" else f"⬇️ {name} ডাউনলোড করুন"
+                offer_download(dl, out, name, writers.MIME_TYPES[r["ext"]])
+            show_job("csv", finish)
 
     # ════════ EXCEL → CSV ═══════════════════════════════
     elif tool == "e2c":
         f = st.file_uploader(ul[L]["e2c"], type="xlsx")
         if f:
             show_files([f], reorder=False)
-            df = pd.read_excel(f, engine="openpyxl")
-            info = f"📊 {len(df)} rows × {len(df.columns)} columns" if L == "en" else f"📊 {len(df)} row × {len(df.columns)} column"
+            names = upload_sheets(f)
+            many_lbl = "📚 Convert several sheets (ZIP)" if L == "en" else "📚 একাধিক sheet রূপান্তর করুন (ZIP)"
+            many = len(names) > 1 and st.checkbox(many_lbl, key="e2c_sheets",
+                                                  help="the workbook is opened once; one file per sheet")
+            if many:
+                pick_lbl = "Sheets" if L == "en" else "Sheet গুলো"
+                sheets = st.multiselect(pick_lbl, names, default=names, key="e2c_sheet_pick")
+                compact = False
+                info = (f"📚 {len(sheets)} of {len(names)} sheets → {len(sheets)} file(s)" if L == "en"
+                        else f"📚 {len(names)}টির মধ্যে {len(sheets)}টি sheet → {len(sheets)}টি ফাইল")
+            else:
+                compact = compact_toggle("e2c")
+                info = shape_info(*upload_probe(f, "xlsx"))
             st.info(info)
-            btn = "🔄 Convert to CSV" if L == "en" else "🔄 CSV তে রূপান্তর করুন"
-            if st.button(btn, type="primary"):
-                loader = st.empty()
-                show_processing(loader, 1, 1, "Converting..." if L == "en" else "রূপান্তর হচ্ছে...")
-                out = io.BytesIO()
-                df.to_csv(out, index=False)
-                out.seek(0)
-                msg = "Converted to CSV successfully!" if L == "en" else "CSV তে রূপান্তর সম্পন্ন!"
-                show_done(loader, msg)
-                add_history("Excel→CSV", [f.name], "converted.csv", 1)
-                dl = "⬇️ Download converted.csv" if L == "en" else "⬇️ converted.csv ডাউনলোড করুন"
-                st.download_button(dl, out, "converted.csv", mime="text/csv")
+            out_ext = format_select("e2c", ("csv", "parquet", "feather"))
+            if many:
+                par_lbl = f"⚡ Parallel encoding ({engine.MAX_WORKERS} cores)" if L == "en" else f"⚡ Parallel encoding ({engine.MAX_WORKERS}টি core)"
+                workers = engine.MAX_WORKERS if st.checkbox(par_lbl, value=len(sheets) > 4, key="e2c_par") else 1
+            fmt = {"csv": "CSV", "parquet": "Parquet", "feather": "Feather"}[out_ext]
+            btn = f"🔄 Convert to {fmt}" if L == "en" else f"🔄 {fmt} এ রূপান্তর করুন"
+            if st.button(btn, type="primary", disabled=many and not sheets):
+                if many:
+                    def work(progress, out, trace):
+                        zip_stats, manifest = [], {}
+                        n = engine.excel_sheets_to_zip(progress.track([f])[0], out, sheets, out_ext, progress, workers,
+                                                       zip_stats=zip_stats, trace=trace, manifest=manifest)
+                        return {"ext": "zip", "parts": n, "part_ext": out_ext, "zip_stats": zip_stats,
+                                "manifest": manifest["parts"], "history": ("Excel→CSV", [f.name], "sheets.zip", n)}
+                else:
+                    key = (upload_hash(f), "xlsx", compact)
+
+                    def work(progress, out, trace):
+                        stats, mem = [], {} if compact else None
+                        df = cached_frame(key, trace)
+                        hit = df is not None
+                        with engine.measured(mem):
+                            if hit:
+                                with stages.stage(trace, "write", out=out):
+                                    engine.write_table(df, out, out_ext)
+                            else:
+                                engine.stream_table(progress.track([f])[0], out, "xlsx", out_ext, stats, trace,
+                                                    frame_keeper(key))
+                        progress(1, 1)
+                        return {"ext": out_ext, "read": readers.throughput(stats) if stats else None, "mem": mem,
+                                "frame_cache": hit, "history": ("Excel→CSV", [f.name], f"converted.{out_ext}", 1)}
+                run_job("e2c", "Converting..." if L == "en" else "রূপান্তর হচ্ছে...", work, [f],
+                        {"compact": compact, "format": out_ext, "sheets": sheets if many else None})
+
+            def finish(loader, r, out):
+                if r["ext"] == "zip":
+                    show_done(loader, f"{r['parts']} sheets converted!" if L == "en" else f"{r['parts']}টি sheet রূপান্তর সম্পন্ন!")
+                    with st.expander(f"🧾 manifest.json ({len(r['manifest'])} sheets)"):
+                        st.dataframe(r["manifest"], hide_index=True, use_container_width=True)
+                    dl = "⬇️ Download sheets.zip" if L == "en" else "⬇️ sheets.zip ডাউনলোড করুন"
+                    offer_download(dl, out, "sheets.zip", "application/zip")
+                    return
+                show_done(loader, "Converted successfully!" if L == "en" else "রূপান্তর সম্পন্ন!")
+                show_parse(r)
+                name = f"converted.{r['ext']}"
+                dl = f"⬇️ Download {name}" if L == "en" else f"⬇️ {name} ডাউনলোড করুন"
+                offer_download(dl, out, name, writers.MIME_TYPES[r["ext"]])
+            show_job("e2c", finish)
 
     # ════════ CSV → EXCEL ═══════════════════════════════
     elif tool == "c2e":
-        f = st.file_uploader(ul[L]["c2e"], type="csv")
+        f = st.file_uploader(ul[L]["c2e"], type=["csv", "parquet", "feather", "arrow"])
         if f:
             show_files([f], reorder=False)
-            df = pd.read_csv(f)
-            info = f"📊 {len(df)} rows × {len(df.columns)} columns" if L == "en" else f"📊 {len(df)} row × {len(df.columns)} column"
-            st.info(info)
+            ext = engine.file_ext(f.name)
+            columnar = ext in readers.COLUMNAR_EXTS
+            # metadata / newline গুনে row/column সংখ্যা; parse (বা columnar-এর batch stream) job-এর ভেতরে
+            compact = not columnar and compact_toggle("c2e")
+            st.info(shape_info(*upload_probe(f, "csv" if not columnar else ext)))
             btn = "🔄 Convert to Excel" if L == "en" else "🔄 Excel এ রূপান্তর করুন"
             if st.button(btn, type="primary"):
-                loader = st.empty()
-                show_processing(loader, 1, 1, "Converting..." if L == "en" else "রূপান্তর হচ্ছে...")
-                out = io.BytesIO()
-                df.to_excel(out, index=False, engine="openpyxl")
-                out.seek(0)
-                msg = "Converted to Excel successfully!" if L == "en" else "Excel এ রূপান্তর সম্পন্ন!"
-                show_done(loader, msg)
-                add_history("CSV→Excel", [f.name], "converted.xlsx", 1)
+                key = (upload_hash(f), "csv", compact)
+
+                def work(progress, out, trace):
+                    stats, mem = [], {} if compact else None
+                    df = None if columnar else cached_frame(key, trace)
+                    hit = df is not None
+                    if columnar:
+                        engine.convert(progress.track([f])[0], out, ext, "xlsx", trace=trace)
+                    elif hit:
+                        with stages.stage(trace, "write", out=out):
+                            engine.write_table(df, out, "xlsx")
+                    else:
+                        with engine.measured(mem):
+                            engine.csv_to_excel(progress.track([f])[0], out, trace, stats, frame_keeper(key))
+                    progress(1, 1)
+                    return {"read": readers.throughput(stats) if stats else None, "mem": mem, "frame_cache": hit,
+                            "history": ("CSV→Excel", [f.name], "converted.xlsx", 1)}
+                run_job("c2e", "Converting..." if L == "en" else "রূপান্তর হচ্ছে...", work, [f], {"compact": compact})
+
+            def finish(loader, r, out):
+                show_done(loader, "Converted to Excel successfully!" if L == "en" else "Excel এ রূপান্তর সম্পন্ন!")
+                show_parse(r)
                 dl = "⬇️ Download converted.xlsx" if L == "en" else "⬇️ converted.xlsx ডাউনলোড করুন"
-                st.download_button(dl, out, "converted.xlsx",
-                                   mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+                offer_download(dl, out, "converted.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+            show_job("c2e", finish)
 
     # ════════ FILE SPLITTER ══════════════════════════════
     elif tool == "split":
-        f = st.file_uploader(ul[L]["split"], type=["csv", "xlsx"])
+        f = st.file_uploader(ul[L]["split"], type=["csv", "xlsx", "parquet", "feather", "arrow"])
         if f:
             show_files([f], reorder=False)
-            is_xlsx = f.name.endswith(".xlsx")
-            df = pd.read_excel(f, engine="openpyxl") if is_xlsx else pd.read_csv(f)
-            info = f"📊 {len(df)} rows × {len(df.columns)} columns" if L == "en" else f"📊 {len(df)} row × {len(df.columns)} column"
-            st.info(info)
-
-            rows_lbl = "Rows per file" if L == "en" else "প্রতি ফাইলে কত row"
-            rows_per_file = st.number_input(rows_lbl, min_value=1, value=100, step=50)
-            rows_per_file = max(1, int(rows_per_file))
-            total_parts = (len(df) + rows_per_file - 1) // rows_per_file
-            part_info = f"📦 Will create **{total_parts}** file(s)" if L == "en" else f"📦 মোট **{total_parts}**টি ফাইল তৈরি হবে"
-            st.info(part_info)
+            ext = engine.file_ext(f.name)
+            columnar = ext in readers.COLUMNAR_EXTS
+            # পুরো ফাইল load না করে metadata / newline গুনে row সংখ্যা; columnar split row group ধরে stream হয়,
+            # বাকিগুলো button চাপার পর job-এর ভেতরে parse
+            compact = not columnar and compact_toggle("split")
+            n_rows, n_cols, exact = upload_probe(f, ext)
+            st.info(shape_info(n_rows, n_cols, exact))
+
+            mode_lbl = {
+                "en": {"rows": "Rows per file", "key": "One file per value of a column", "size": "Max file size"},
+                "bn": {"rows": "প্রতি ফাইলে কত row", "key": "একটা column-এর প্রতিটি মানে একটা ফাইল",
+                       "size": "ফাইলের সর্বোচ্চ সাইজ"},
+            }
+            mode = st.radio("✂ Split by" if L == "en" else "✂ কীভাবে ভাগ", ("rows", "key", "size"), horizontal=True,
+                            format_func=lambda m: mode_lbl[L][m])
+            rows_per_file, by, max_bytes, total_parts = 100, None, None, None
+            if mode == "rows":
+                rows_per_file = st.number_input(mode_lbl[L]["rows"], min_value=1, value=100, step=50)
+                rows_per_file = max(1, int(rows_per_file))
+                total_parts = (n_rows + rows_per_file - 1) // rows_per_file
+                n = f"{total_parts}" if exact else f"~{total_parts}"
+                part_info = f"📦 Will create **{n}** file(s)" if L == "en" else f"📦 মোট **{n}**টি ফাইল তৈরি হবে"
+                st.info(part_info)
+            elif mode == "key":
+                by = st.selectbox("Key column", upload_columns([f], ext),
+                                  help="e.g. region → region=North.csv, region=South.csv, …")
+            else:
+                mb = st.number_input("MB per file" if L == "en" else "প্রতি ফাইলে MB", min_value=0.1, value=25.0, step=5.0,
+                                     help="each part stays under this size inside the ZIP (e.g. an upload limit)")
+                max_bytes = int(mb * 1e6)
+            same = "feather" if ext == "arrow" else ext
+            part_ext = format_select("split", (same,) + tuple(e for e in writers.TABLE_FORMATS if e != same))
+            par_lbl = f"⚡ Parallel encoding ({engine.MAX_WORKERS} cores)" if L == "en" else f"⚡ Parallel encoding ({engine.MAX_WORKERS}টি core)"
+            # শুধু xlsx part-এর encode (openpyxl) এত ভারী যে process-এ পাঠানোর খরচ পোষায়
+            workers = engine.MAX_WORKERS if mode == "rows" and st.checkbox(par_lbl, value=part_ext == "xlsx") else 1
+            zip_lbl = {
+                "en": {"auto": "Auto — store xlsx, compress csv", "fast": "Fast — like auto, lighter compression",
+                       "deflate": "Compress everything", "store": "No compression"},
+                "bn": {"auto": "Auto — xlsx store, csv compress", "fast": "Fast — auto-র মতো, হালকা compression",
+                       "deflate": "সব compress করুন", "store": "Compression ছাড়া"},
+            }
+            zip_policy = st.selectbox("🗜 ZIP compression", archive.POLICIES, format_func=lambda p: zip_lbl[L][p])
 
             btn = "🚀 Split Files" if L == "en" else "🚀 ফাইল Split করুন"
             if st.button(btn, type="primary"):
-                loader = st.empty()
-                zb = io.BytesIO()
-                ext = "xlsx" if is_xlsx else "csv"
-                try:
-                    with zipfile.ZipFile(zb, "w", zipfile.ZIP_DEFLATED) as z:
-                        for i, start in enumerate(range(0, len(df), rows_per_file), 1):
-                            lbl = "Splitting files..." if L == "en" else "ফাইল split হচ্ছে..."
-                            show_processing(loader, i, total_parts, lbl)
-                            chunk = df.iloc[start: start + rows_per_file]
-                            out = io.BytesIO()
-                            if is_xlsx:
-                                chunk.to_excel(out, index=False, engine="openpyxl")
-                            else:
-                                chunk.to_csv(out, index=False)
-                            z.writestr(f"part_{i}.{ext}", out.getvalue())
-                    zb.seek(0)
-                    msg = f"{total_parts} files created successfully!" if L == "en" else f"{total_parts}টি ফাইল সফলভাবে তৈরি হয়েছে!"
-                    show_done(loader, msg)
-                    add_history("Splitter", [f.name], "split_files.zip", total_parts)
-                    dl = "⬇️ Download ZIP" if L == "en" else "⬇️ ZIP ডাউনলোড করুন"
-                    st.download_button(dl, zb, "split_files.zip", mime="application/zip")
-                except Exception as e:
-                    loader.empty()
-                    st.error(f"❌ Error: {e}")
\ No newline at end of file
+                key = (upload_hash(f), ext, compact)
+
+                def work(progress, out, trace):
+                    zip_stats, manifest, stats, mem = [], {}, [], {} if compact else None
+                    df = None if columnar else cached_frame(key, trace)
+                    hit = df is not None
+                    if hit:
+                        n = engine.split_frame(df, out, rows_per_file, part_ext, progress, workers, zip_policy, zip_stats,
+                                               trace, by, max_bytes, manifest)
+                    else:
+                        # chunk ধরে: rows mode-এ একসাথে একটাই part memory-তে
+                        with engine.measured(mem):
+                            n = engine.split_file(progress.track([f])[0], out, rows_per_file, ext, progress, total_parts,
+                                                  stats, workers, zip_policy, zip_stats, part_ext, trace, by, max_bytes,
+                                                  manifest, None if columnar else frame_keeper(key))
+                    return {"parts": n, "ext": part_ext, "zip_stats": zip_stats, "manifest": manifest["parts"],
+                            "read": readers.throughput(stats) if stats else None, "mem": mem, "frame_cache": hit,
+                            "history": ("Splitter", [f.name], "split_files.zip", n)}
+                run_job("split", "Splitting files..." if L == "en" else "ফাইল split হচ্ছে...", work, [f],
+                        {"rows_per_file": rows_per_file, "by": by, "max_bytes": max_bytes, "zip_policy": zip_policy,
+                         "compact": compact, "format": part_ext})
+
+            def finish(loader, r, out):
+                msg = f"{r['parts']} files created successfully!" if L == "en" else f"{r['parts']}টি ফাইল সফলভাবে তৈরি হয়েছে!"
+                show_done(loader, msg)
+                show_parse(r)
+                for z in r["zip_stats"]:
+                    saved = "saved" if L == "en" else "বাঁচল"
+                    st.caption(f"🗜 {z['choice']}: {z['entries']} × {r['ext']} · {file_size(z['raw_bytes'])} → "
+                               f"{file_size(z['zip_bytes'])} ({saved} {file_size(z['saved_bytes'])}) · {z['seconds']:.2f} s")
+                if r.get("manifest"):
+                    with st.expander(f"🧾 manifest.json ({len(r['manifest'])} parts)"):
+                        st.dataframe(r["manifest"], hide_index=True, use_container_width=True)
+                dl = "⬇️ Download ZIP" if L == "en" else "⬇️ ZIP ডাউনলোড করুন"
+                offer_download(dl, out, "split_files.zip", "application/zip")
+            show_job("split", finish)
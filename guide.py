@@ -0,0 +1,158 @@
+# guide.py — প্রতিটি tool-এর bilingual guide panel
+# HTML tool আর language প্রতি একবার render হয়ে cache-এ থাকে (theme শুধু CSS-এ, তাই এখানে লাগে না)।
+from functools import lru_cache
+
+GUIDE = {
+    "pdf": {
+        "en": {
+            "what": "PDF Merger combines multiple PDF files into one single document — preserving all pages, formatting, and content exactly as they are.",
+            "why":  "Perfect for combining reports, invoices, scanned documents, or contracts into one clean file. No more sending 10 attachments!",
+            "how":  ["Upload two or more PDF files using the uploader.",
+                     "Use ⬆ / ⬇ buttons to arrange the order you want pages to appear.",
+                     "Click 'Merge PDFs' and wait for the process to complete.",
+                     "Download your merged PDF with one click."],
+            "tip":  "💡 The order in the list = the order of pages in the final PDF.",
+        },
+        "bn": {
+            "what": "PDF Merger একাধিক PDF ফাইলকে একটি single document-এ merge করে — সব পেজ, ফরম্যাটিং এবং কন্টেন্ট হুবহু রেখে।",
+            "why":  "রিপোর্ট, ইনভয়েস, স্ক্যান করা ডকুমেন্ট বা contract একটি ফাইলে আনতে পারফেক্ট। ১০টা attachment আলাদা পাঠানো আর লাগবে না!",
+            "how":  ["Uploader দিয়ে দুই বা তার বেশি PDF ফাইল আপলোড করুন।",
+                     "⬆ / ⬇ বাটন দিয়ে ফাইলের ক্রম সাজান।",
+                     "'Merge PDFs' বাটনে ক্লিক করুন এবং শেষ হওয়া পর্যন্ত অপেক্ষা করুন।",
+                     "একটি ক্লিকে merged PDF ডাউনলোড করুন।"],
+            "tip":  "💡 তালিকার ক্রম = final PDF-এর পেজ ক্রম।",
+        },
+    },
+    "excel": {
+        "en": {
+            "what": "Excel Merger stacks multiple .xlsx files into one unified spreadsheet — combining all rows from every file into a single sheet.",
+            "why":  "Ideal for consolidating monthly sales data, multi-region reports, team submissions, or any data split across multiple Excel files.",
+            "how":  ["Upload two or more .xlsx files.",
+                     "Reorder them if needed — top file's data appears first.",
+                     "Click 'Merge Excel' to combine all files.",
+                     "Download the merged .xlsx file."],
+            "tip":  "💡 All files must have the same column headers for a clean merge. Mismatched columns create extra empty cells.",
+        },
+        "bn": {
+            "what": "Excel Merger একাধিক .xlsx ফাইলের সব row একটি single spreadsheet-এ একত্রিত করে।",
+            "why":  "মাসিক sales data, multi-region রিপোর্ট, বা যেকোনো ডেটা যা একাধিক Excel ফাইলে ছড়ানো — সব এক করতে আদর্শ।",
+            "how":  ["দুই বা তার বেশি .xlsx ফাইল আপলোড করুন।",
+                     "প্রয়োজনে ক্রম পরিবর্তন করুন — প্রথম ফাইলের ডেটা সবার আগে আসবে।",
+                     "'Merge Excel' বাটনে ক্লিক করুন।",
+                     "Merged .xlsx ফাইল ডাউনলোড করুন।"],
+            "tip":  "💡 সুন্দরভাবে merge হতে সব ফাইলের column header একই থাকতে হবে।",
+        },
+    },
+    "csv": {
+        "en": {
+            "what": "CSV Merger combines multiple CSV files into one single CSV — appending all rows together in sequence.",
+            "why":  "Great for combining CRM exports, database dumps, web scraping results, or bulk data split across many CSV files.",
+            "how":  ["Upload two or more .csv files.",
+                     "Arrange the order using ⬆ / ⬇ if needed.",
+                     "Click 'Merge CSVs' to combine.",
+                     "Download your unified CSV file."],
+            "tip":  "💡 CSVs should have matching column names. Duplicate header rows from individual files are automatically removed; tick \"Remove duplicate rows\" to also drop repeated data rows (whole row or chosen key columns).",
+        },
+        "bn": {
+            "what": "CSV Merger একাধিক CSV ফাইলের সব row একটি single CSV ফাইলে একত্রিত করে — একটার পর একটা সাজিয়ে।",
+            "why":  "CRM export, database dump, web scraping result বা যেকোনো bulk ডেটা যা একাধিক CSV-তে বিভক্ত — সব এক করতে দারুণ।",
+            "how":  ["দুই বা তার বেশি .csv ফাইল আপলোড করুন।",
+                     "প্রয়োজনে ⬆ / ⬇ দিয়ে ক্রম সাজান।",
+                     "'Merge CSVs' বাটনে ক্লিক করুন।",
+                     "Unified CSV ফাইল ডাউনলোড করুন।"],
+            "tip":  "💡 CSV গুলোর column নাম মিলতে হবে। আলাদা ফাইলের duplicate header row স্বয়ংক্রিয়ভাবে সরে যায়; \"duplicate row বাদ দিন\" দিলে একই data row (পুরো row বা বাছাই করা key column) ও বাদ যায়।",
+        },
+    },
+    "e2c": {
+        "en": {
+            "what": "Excel to CSV Converter transforms your .xlsx spreadsheet into a lightweight, universally compatible .csv text file.",
+            "why":  "CSV files are smaller, faster to load, and work with almost every tool — databases, Python, Google Sheets, and APIs. Use when you need raw data without Excel formatting.",
+            "how":  ["Upload a single .xlsx Excel file.",
+                     "Check the row and column count preview.",
+                     "Click 'Convert to CSV'.",
+                     "Download your .csv file instantly."],
+            "tip":  "💡 By default the first sheet is converted. For a workbook with several sheets, tick 'Convert several sheets' to get every sheet (or the ones you pick) as separate files in one ZIP — the workbook is read only once.",
+        },
+        "bn": {
+            "what": "Excel to CSV Converter আপনার .xlsx spreadsheet-কে lightweight, universally compatible .csv text ফাইলে রূপান্তর করে।",
+            "why":  "CSV ফাইল ছোট, দ্রুত লোড হয় এবং প্রায় সব tool-এ কাজ করে — database, Python, Google Sheets, API ইত্যাদি।",
+            "how":  ["একটি .xlsx Excel ফাইল আপলোড করুন।",
+                     "Row এবং column সংখ্যা preview দেখুন।",
+                     "'Convert to CSV' বাটনে ক্লিক করুন।",
+                     "তাৎক্ষণিকভাবে .csv ফাইল ডাউনলোড করুন।"],
+            "tip":  "💡 সাধারণভাবে প্রথম sheet convert হয়। একাধিক sheet থাকলে 'একাধিক sheet রূপান্তর করুন' বাছলে সব sheet (বা বাছাই করা গুলো) আলাদা ফাইল হয়ে একটা ZIP-এ আসবে — workbook একবারই পড়া হয়।",
+        },
+    },
+    "c2e": {
+        "en": {
+            "what": "CSV to Excel Converter turns your plain .csv file into a fully formatted .xlsx Excel spreadsheet, ready for analysis or sharing.",
+            "why":  "Excel format is better for sharing with non-technical users, applying formulas, conditional formatting, charts, and professional presentation.",
+            "how":  ["Upload a single .csv file.",
+                     "Check the row and column preview.",
+                     "Click 'Convert to Excel'.",
+                     "Download the .xlsx file — open it in Excel or Google Sheets."],
+            "tip":  "💡 UTF-8 encoding is used. Special characters (Bengali, Arabic, Chinese) are preserved correctly.",
+        },
+        "bn": {
+            "what": "CSV to Excel Converter আপনার plain .csv ফাইলকে একটি fully formatted .xlsx Excel spreadsheet-এ রূপান্তর করে।",
+            "why":  "Excel format non-technical user-দের সাথে share করতে, formula, chart এবং professional presentation-এর জন্য উপযুক্ত।",
+            "how":  ["একটি .csv ফাইল আপলোড করুন।",
+                     "Row এবং column preview চেক করুন।",
+                     "'Convert to Excel' বাটনে ক্লিক করুন।",
+                     ".xlsx ফাইল ডাউনলোড করুন এবং Excel বা Google Sheets-এ খুলুন।"],
+            "tip":  "💡 Tool টি UTF-8 encoding ব্যবহার করে। বাংলা সহ যেকোনো special character সঠিকভাবে preserve হবে।",
+        },
+    },
+    "split": {
+        "en": {
+            "what": "File Splitter breaks a large CSV or Excel file into multiple smaller files — each with a set number of rows — packaged into a ZIP.",
+            "why":  "Essential when uploading to platforms with row limits, sending data chunks to team members, batch processing large files, or meeting API import limits.",
+            "how":  ["Upload a .csv or .xlsx file.",
+                     "Set how many rows per output file (e.g. 100, 500, 1000).",
+                     "The tool shows how many files will be created.",
+                     "Click 'Split Files' — download a ZIP with all parts."],
+            "tip":  "💡 The header row is automatically included in every split file. Files are named part_1, part_2, part_3... — or split by a column (region=North.csv, …) or by a maximum file size; manifest.json in the ZIP lists rows, bytes and a checksum for every part.",
+        },
+        "bn": {
+            "what": "File Splitter একটি বড় CSV বা Excel ফাইলকে ছোট ছোট ফাইলে ভাগ করে — প্রতিটিতে নির্ধারিত সংখ্যক row — এবং সব ZIP-এ প্যাক করে।",
+            "why":  "Platform-এ row limit থাকলে, team member-দের chunk পাঠাতে, বড় ফাইল batch-এ process করতে বা API import limit মানতে অপরিহার্য।",
+            "how":  [".csv অথবা .xlsx ফাইল আপলোড করুন।",
+                     "প্রতি output ফাইলে কত row চান তা সেট করুন (যেমন ১০০, ৫০০, ১০০০)।",
+                     "Tool টি দেখাবে কতটি ফাইল তৈরি হবে।",
+                     "'Split Files' ক্লিক করুন — সব part সহ একটি ZIP ডাউনলোড হবে।"],
+            "tip":  "💡 Header row স্বয়ংক্রিয়ভাবে প্রতিটি split ফাইলে যোগ হয়। ফাইলগুলো part_1, part_2, part_3... নামে সংরক্ষিত হয় — অথবা একটা column ধরে (region=North.csv, …) বা সর্বোচ্চ ফাইল সাইজ ধরে ভাগ করুন; ZIP-এর manifest.json-এ প্রতিটি part-এর row, byte আর checksum থাকে।",
+        },
+    },
+}
+
+LABELS = {
+    "en": {"what": "🔍 What is this?",       "why": "🎯 Why use it?",              "how": "📋 How to use?"},
+    "bn": {"what": "🔍 এটা কী?",              "why": "🎯 কেন ব্যবহার করবেন?",      "how": "📋 কীভাবে ব্যবহার করবেন?"},
+}
+
+
+@lru_cache(maxsize=None)
+def html(tool_key: str, lang: str) -> str:
+    g = GUIDE[tool_key][lang]
+    lb = LABELS[lang]
+    steps_html = "".join(
+        f'<div class="guide-step"><span class="step-num">{i}.</span>{step}</div>'
+        for i, step in enumerate(g["how"], 1)
+    )
+    return f"""
+    <div class="guide-panel">
+        <div class="guide-section">
+            <div class="guide-label">{lb['what']}</div>
+            <div class="guide-text">{g['what']}</div>
+        </div>
+        <div class="guide-section">
+            <div class="guide-label">{lb['why']}</div>
+            <div class="guide-text">{g['why']}</div>
+        </div>
+        <div class="guide-section">
+            <div class="guide-label">{lb['how']}</div>
+            {steps_html}
+        </div>
+        <div class="guide-tip">{g['tip']}</div>
+    </div>
+    """
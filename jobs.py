@@ -0,0 +1,171 @@
+# jobs.py — background job executor
+# Merge / convert / split আর button handler-এর ভেতরে চলে না: job হিসেবে queue-তে যায়,
+# আলাদা worker thread-এ চলে, আর rerun হলেও বেঁচে থাকে (Job object session_state-এ থাকে)।
+# Pool module-level, তাই process-এর সব session একই JOB_WORKERS টা slot share করে।
+# Fair share: এক session একসাথে JOB_PER_SESSION-এর বেশি job চালাতে পারে না, আর খালি slot
+# পেলে session গুলো পালা করে (round-robin) পরের queued job পায়।
+# Cancel cooperative: job-এর progress callback পরের বার ডাকা হলেই Cancelled ওঠে।
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+
+import progress
+
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "2"))
+JOB_PER_SESSION = int(os.environ.get("JOB_PER_SESSION", "1"))
+
+ACTIVE = ("queued", "running")
+
+
+class Cancelled(Exception):
+    pass
+
+
+class Job:
+    _ids = itertools.count(1)
+
+    def __init__(self, session: str, label: str, fn, trace=None):
+        self.id = next(Job._ids)
+        self.session, self.label, self.fn = session, label, fn
+        self.trace = trace  # stages.Trace — diagnostics panel আর JSON log-এর জন্য
+        self.state = "queued"
+        self.meter = progress.Meter(check=self._check)
+        self.result = self.error = None
+        self.submitted = time.time()
+        self.started = self.finished = None
+        self.recorded = False  # UI history-তে একবারই যোগ হয়
+        self._cancel = threading.Event()
+        self._after = []  # job শেষ হলে (done / failed / cancelled) যা ডাকতে হবে
+        self._after_lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self.state in ACTIVE
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def progress(self) -> tuple:
+        return self.meter.units
+
+    def _check(self):
+        if self._cancel.is_set():
+            raise Cancelled()
+
+    def report(self, i: int, total: int):
+        # engine-এর on_file / on_part callback — meter(i, total)-এর মতোই
+        self.meter(i, total)
+
+    def cancel(self):
+        self._cancel.set()
+
+    def after(self, fn):
+        # job শেষ হলে fn() — যেমন বাতিল job-এর output buffer বন্ধ করা, যাতে worker thread
+        # তখনো লিখতে থাকলে বন্ধ buffer-এ না লেখে। আগেই শেষ হয়ে গেলে এখনই ডাকা হয়
+        with self._after_lock:
+            if self.finished is None:
+                self._after.append(fn)
+                return
+        fn()
+
+    def _finish(self, state: str):
+        with self._after_lock:
+            self.state, self.finished = state, time.time()
+            fns, self._after = self._after, []
+        for fn in fns:
+            fn()
+
+
+class JobRunner:
+    def __init__(self, workers: int = JOB_WORKERS, per_session: int = JOB_PER_SESSION):
+        self.workers = max(1, workers)
+        self.per_session = max(1, per_session)
+        self._queues = OrderedDict()  # session → deque[Job]; ক্রমটাই round-robin-এর পালা
+        self._running = {}  # session → চলমান job সংখ্যা
+        self._lock = threading.Lock()
+
+    def submit(self, session: str, label: str, fn, trace=None) -> Job:
+        # fn(meter) → result; meter(i, total) engine callback-এর মতো, meter.track(files) ফাইলের ভেতরের byte গোনে
+        job = Job(session, label, fn, trace)
+        with self._lock:
+            if session not in self._queues:
+                # নতুন session লাইনের সামনে: যারা এইমাত্র পালা পেয়েছে তাদের আগে
+                self._queues[session] = deque()
+                self._queues.move_to_end(session, last=False)
+            self._queues[session].append(job)
+            self._dispatch()
+        return job
+
+    def cancel(self, job: Job):
+        job.cancel()
+        with self._lock:
+            q = self._queues.get(job.session)
+            if q is not None and job in q:
+                # এখনো শুরু হয়নি: সরাসরি queue থেকে সরাই
+                q.remove(job)
+            else:
+                return
+        job._finish("cancelled")
+
+    def position(self, job: Job) -> int:
+        # queue-তে job-এর আগে মোট কয়টা job আছে (সব session মিলিয়ে, মোটামুটি হিসাব)
+        with self._lock:
+            q = self._queues.get(job.session, ())
+            if job not in q:
+                return 0
+            mine = list(q).index(job)
+            others = sum(min(len(o), mine + 1) for s, o in self._queues.items() if s != job.session)
+            return mine + others
+
+    @property
+    def running(self) -> int:
+        return sum(self._running.values())
+
+    def _dispatch(self):
+        # lock ধরা অবস্থায় ডাকা হয়
+        while self.running < self.workers:
+            job = self._next()
+            if job is None:
+                return
+            self._running[job.session] = self._running.get(job.session, 0) + 1
+            job.state, job.started = "running", time.time()
+            threading.Thread(target=self._run, args=(job,), name=f"job-{job.id}", daemon=True).start()
+
+    def _next(self):
+        for session in list(self._queues):
+            q = self._queues[session]
+            if not q:
+                del self._queues[session]
+                continue
+            if self._running.get(session, 0) >= self.per_session:
+                continue
+            # এই session পালা পেল: পরের বার অন্যরা আগে
+            self._queues.move_to_end(session)
+            return q.popleft()
+        return None
+
+    def _run(self, job: Job):
+        state = "failed"
+        try:
+            job.meter.start()
+            job.result = job.fn(job.meter)
+            state = "done"
+        except Cancelled:
+            state = "cancelled"
+        except Exception as e:
+            # cancel-এর পরে ওঠা যেকোনো error (যেমন মাঝপথে থামা writer-এর) failure না
+            job.error, state = e, "cancelled" if job.cancelled else "failed"
+        finally:
+            job._finish(state)
+            with self._lock:
+                self._running[job.session] -= 1
+                if not self._running[job.session]:
+                    del self._running[job.session]
+                self._dispatch()
+
+
+runner = JobRunner()
@@ -0,0 +1,193 @@
+# partition.py — splitter-এর part ভাগের দুই নিয়ম, দুটোই input-এর উপর একটাই streaming pass:
+#   by key  → একটা column-এর প্রতিটি মানের জন্য একটা ফাইল (যেমন region=North.csv)। প্রতিটি মানের row
+#             buffer-এ জমে; সব buffer মিলিয়ে PARTITION_BUFFER_MB ছাড়ালে সবচেয়ে বড়গুলো একটা spill
+#             file-এ pickle হয়ে যায়। শেষে প্রতিটি key-এর frame গুলো (আগে disk-এর, পরে memory-র) ক্রমে
+#             ফেরত আসে, তাই row-এর ক্রম input-এর মতোই থাকে।
+#   by size → প্রতিটি part encode করার পর max_bytes-এর নিচে (যেমন upload API-র 25 MB সীমা)।
+#             আগের part থেকে byte/row আন্দাজ করে row নিই, বেশি হলে কমিয়ে আবার encode করি।
+import os
+import pickle
+import re
+import tempfile
+import weakref
+
+import pandas as pd
+
+from spill import SPILL_DIR
+
+PARTITION_BUFFER_MB = int(os.environ.get("PARTITION_BUFFER_MB", "64"))
+MAX_PARTITIONS = int(os.environ.get("MAX_PARTITIONS", "10000"))  # এর বেশি আলাদা মান হলে সম্ভবত ভুল column
+
+_UNSAFE = re.compile(r"[^\w.=\-]+")
+
+
+def safe_name(stem: str, ext: str, used: set) -> str:
+    # ZIP entry-র নাম: ফাইলের নামে চলে না এমন অক্ষর "_", একই নাম হলে "_2", "_3" ...
+    stem = _UNSAFE.sub("_", stem).strip(".")[:120] or "_"
+    name, n = f"{stem}.{ext}", 1
+    while name in used:
+        n += 1
+        name = f"{stem}_{n}.{ext}"
+    used.add(name)
+    return name
+
+
+def part_name(key: str, value, ext: str, used: set) -> str:
+    # hive-style নাম: "region=North.csv"
+    text = "__empty__" if value is None or pd.isna(value) else _UNSAFE.sub("_", str(value)).strip("._") or "_"
+    return safe_name(f"{_UNSAFE.sub('_', str(key))}={text}", ext, used)
+
+
+def _cleanup(state: dict):
+    if state["file"] is not None:
+        state["file"].close()
+        state["file"] = None
+    if state["path"] is not None:
+        try:
+            os.remove(state["path"])
+        except OSError:
+            pass
+        state["path"] = None
+
+
+class KeyBuffer:
+    def __init__(self, key: str, limit_mb: int = PARTITION_BUFFER_MB, max_parts: int = MAX_PARTITIONS):
+        self.key = key
+        self.limit = limit_mb << 20
+        self.max_parts = max_parts
+        self.rows = {}  # মান → row সংখ্যা (প্রথম দেখার ক্রমে)
+        self.spilled_bytes = 0
+        self._mem = {}  # মান → [frame, ...]
+        self._mem_bytes = {}  # মান → আন্দাজি byte
+        self._disk = {}  # মান → [spill file offset, ...]
+        self._state = {"path": None, "file": None}
+        self._finalizer = weakref.finalize(self, _cleanup, self._state)
+
+    @property
+    def buffered(self) -> int:
+        return sum(self._mem_bytes.values())
+
+    def add(self, chunk: pd.DataFrame):
+        if self.key not in chunk.columns:
+            raise ValueError(f"split key column {self.key!r} not found")
+        if not len(chunk):
+            return
+        # deep memory_usage প্রতিটি string ছোঁয়, তাই chunk-এ একবার মেপে row প্রতি গড় ধরি
+        per_row = chunk.memory_usage(deep=True).sum() / len(chunk)
+        for value, part in chunk.groupby(self.key, sort=False, dropna=False):
+            value = None if pd.isna(value) else value  # প্রতিটি chunk-এর NaN আলাদা object, dict-এ মিলত না
+            if value not in self.rows:
+                if len(self.rows) >= self.max_parts:
+                    raise ValueError(f"more than {self.max_parts:,} distinct values in {self.key!r}; "
+                                     "split by a column with fewer values")
+                self.rows[value] = 0
+                self._mem[value], self._mem_bytes[value] = [], 0
+            self.rows[value] += len(part)
+            self._mem[value].append(part)
+            self._mem_bytes[value] += int(per_row * len(part))
+        if self.buffered > self.limit:
+            self._spill()
+
+    def _spill(self):
+        # সবচেয়ে বড় buffer থেকে শুরু করে অর্ধেক সীমার নিচে না নামা পর্যন্ত disk-এ
+        if self._state["file"] is None:
+            os.makedirs(SPILL_DIR, exist_ok=True)
+            fd, path = tempfile.mkstemp(prefix="split-", dir=SPILL_DIR)
+            self._state["path"], self._state["file"] = path, os.fdopen(fd, "w+b")
+        fh = self._state["file"]
+        for value in sorted(self._mem_bytes, key=self._mem_bytes.get, reverse=True):
+            if self.buffered <= self.limit // 2:
+                break
+            if not self._mem[value]:
+                continue
+            fh.seek(0, 2)
+            self._disk.setdefault(value, []).append(fh.tell())
+            frames = self._mem[value]
+            pickle.dump(pd.concat(frames) if len(frames) > 1 else frames[0], fh, pickle.HIGHEST_PROTOCOL)
+            self.spilled_bytes += fh.tell() - self._disk[value][-1]
+            self._mem[value], self._mem_bytes[value] = [], 0
+
+    def frames(self, value):
+        # একটা key-এর সব row, input-এর ক্রমে: আগে disk-এ যাওয়া অংশ, তারপর memory-তে থাকা
+        fh = self._state["file"]
+        for offset in self._disk.get(value, []):
+            fh.seek(offset)
+            yield pickle.load(fh)
+        yield from self._mem[value]
+        self._mem[value] = []
+
+    def close(self):
+        self._mem, self._disk = {}, {}
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def by_size(chunks, max_bytes: int, encode):
+    # encode(frame) → bytes। (data, rows) ফেরত, প্রতিটি data ≤ max_bytes — শুধু একটা row-ই সীমার চেয়ে বড় হলে
+    # সেই row একা একটা part। Memory-তে থাকে সর্বোচ্চ একটা part আর একটা chunk।
+    pending, pending_rows = [], 0
+    per_row = None
+
+    def head(n: int) -> pd.DataFrame:
+        out, got = [], 0
+        for fr in pending:
+            if got >= n:
+                break
+            out.append(fr.iloc[:n - got])
+            got += len(out[-1])
+        return pd.concat(out) if len(out) > 1 else out[0]
+
+    def drop(n: int):
+        nonlocal pending_rows
+        pending_rows -= n
+        while n:
+            if len(pending[0]) <= n:
+                n -= len(pending.pop(0))
+            else:
+                pending[0] = pending[0].iloc[n:]
+                n = 0
+
+    def fit():
+        # (data, rows): আন্দাজ থেকে শুরু; বড় হলে অনুপাতে কমাই, অনেক ছোট হলে (আর row বাকি থাকলে) একবার বাড়াই
+        nonlocal per_row
+        n = min(pending_rows, max(1, int(max_bytes / per_row * 0.97)))
+        best = None
+        grown = False
+        while True:
+            data = encode(head(n))
+            if len(data) <= max_bytes or n == 1:
+                best = (data, n)
+                if grown or n == pending_rows or len(data) >= max_bytes * 0.9:
+                    break
+                grown = True
+                bigger = min(pending_rows, int(n * max_bytes / len(data) * 0.97))
+                if bigger <= n:
+                    break
+                n = bigger
+            elif best is not None:
+                break
+            else:
+                n = max(1, min(n - 1, int(n * max_bytes / len(data) * 0.97)))
+        data, n = best
+        per_row = len(data) / n
+        drop(n)
+        return data, n
+
+    for chunk in chunks:
+        if not len(chunk):
+            continue
+        pending.append(chunk)
+        pending_rows += len(chunk)
+        if per_row is None:
+            sample = chunk.iloc[:1000]
+            per_row = max(1.0, len(encode(sample)) / len(sample))
+        while pending_rows * per_row >= max_bytes:
+            yield fit()
+    while pending_rows:
+        yield fit()
@@ -0,0 +1,175 @@
+# progress.py — job-এর progress: কোন file / part চলছে, ফাইলের ভেতরে কত byte পড়া হলো, throughput আর ETA
+# Meter নিজেই engine-এর on_file / on_part callback (meter(i, total)), আর track() দিয়ে input ফাইলগুলোকে
+# Reader-এ মুড়ে দিলে pandas / pyarrow / pypdf যত byte পড়ে তা গোনা হয় — তাই একটা বড় ফাইলও 0% → 100%
+# লাফ না দিয়ে ভেতরের অগ্রগতি দেখায়। Job thread শুধু কয়েকটা সংখ্যা বদলায়; হিসাব (rate, ETA) আর
+# দেখানো হয় UI-তে, সর্বোচ্চ HZ বার প্রতি সেকেন্ডে।
+import io
+import os
+import time
+
+HZ = float(os.environ.get("PROGRESS_HZ", "10"))  # UI / CLI প্রতি সেকেন্ডে সর্বোচ্চ কতবার progress দেখাবে
+
+
+class Reader(io.BufferedIOBase):
+    # input file-এর উপর পাতলা wrapper: পড়া byte গোনে, বাকি সব (name, size, file_id ...) আসল ফাইলের।
+    # EOF পর্যন্ত পড়ার পর seek(0) মানে নতুন pass (যেমন CSV merge-এর dtype pass-এর পর) — গণনা নতুন করে।
+    # pypdf / zip reader-রা মাঝপথে বারবার seek করে, সেগুলোতে গণনা থামে না।
+    def __init__(self, f, meter: "Meter", size: int):
+        super().__init__()
+        self._f, self._meter, self.size = f, meter, size
+        self.read_bytes = 0  # শেষ rewind-এর পর
+        self.passes = 1  # কততম বার ফাইলটা পড়া হচ্ছে
+
+    def __getattr__(self, name):
+        # fileno ইচ্ছা করে দিই না: pyarrow fd পেলে সরাসরি পড়ত, গোনা হতো না
+        if name == "_f":
+            raise AttributeError(name)
+        return getattr(self._f, name)
+
+    @property
+    def fraction(self) -> float:
+        return min(1.0, self.read_bytes / self.size) if self.size else 1.0
+
+    def _count(self, n: int):
+        self.read_bytes += n
+        self._meter.bytes_read += n
+        self._meter.check()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, n: int = -1) -> bytes:
+        b = self._f.read(n)
+        self._count(len(b))
+        return b
+
+    def read1(self, n: int = -1) -> bytes:
+        return self.read(n)
+
+    def readinto(self, b) -> int:
+        n = self._f.readinto(b)
+        self._count(n or 0)
+        return n
+
+    def readline(self, limit: int = -1) -> bytes:
+        b = self._f.readline(limit)
+        self._count(len(b))
+        return b
+
+    def seek(self, pos: int, whence: int = 0) -> int:
+        if pos == 0 and whence == 0 and self.read_bytes >= self.size and self._f.tell() >= self.size:
+            self.read_bytes = 0
+            self.passes += 1
+        return self._f.seek(pos, whence)
+
+    def tell(self) -> int:
+        return self._f.tell()
+
+    def close(self):
+        # upload-টা পরের rerun-এও লাগে, তাই শুধু wrapper বন্ধ
+        super().close()
+
+
+class Meter:
+    def __init__(self, check=None):
+        self.units = (0, 1)  # (i, total) — file বা part
+        self.bytes_read = 0  # সব pass মিলিয়ে মোট পড়া byte (throughput-এর জন্য)
+        self.started = None
+        self._check = check
+        self._readers = []
+        self._last = 0.0
+
+    def __call__(self, i: int, total: int):
+        self.check()
+        self.units = (i, total)
+
+    def check(self):
+        # job cancel হলে এখান থেকেই Cancelled ওঠে — বড় ফাইল পড়ার মাঝখানেও
+        if self._check is not None:
+            self._check()
+
+    def start(self):
+        self.started = time.monotonic()
+
+    def track(self, files: list) -> list:
+        # files-এর ক্রমেই Reader ফেরত; merge-এ on_file(i) মানে i-তম ফাইল।
+        # stages → schema → pandas, তাই import এখানে (jobs.py dashboard-এও import হয়)
+        from stages import size_of
+
+        readers = [Reader(f, self, size_of(f)) for f in files]
+        self._readers += readers
+        return readers
+
+    # ---------- UI / CLI দিক ----------
+    def due(self, hz: float = HZ) -> bool:
+        # throttle: শেষবারের পর 1/hz সেকেন্ড না গেলে False
+        now = time.monotonic()
+        if now - self._last < 1.0 / hz:
+            return False
+        self._last = now
+        return True
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started if self.started is not None else 0.0
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(r.size for r in self._readers)
+
+    @property
+    def done_bytes(self) -> int:
+        return sum(min(r.read_bytes, r.size) for r in self._readers)
+
+    def fraction(self) -> float:
+        i, n = self.units
+        readers = self._readers
+        if readers and n == len(readers) and i == 0:
+            # সব ফাইল একসাথে পড়া হচ্ছে (sorted merge): ফাইল ধরে নয়, মোট byte ধরে
+            return self.done_bytes / self.total_bytes if self.total_bytes else 0.0
+        if readers and n == len(readers) and 0 < i <= n:
+            # merge: আগের ফাইলগুলো শেষ, এখনকারটা যতটুকু পড়া হয়েছে
+            return (i - 1 + readers[i - 1].fraction) / n
+        if n > 1 or len(readers) != 1:
+            return i / n if n else 0.0
+        # একটাই ফাইল, একটাই unit: ফাইলের ভেতরে কতদূর
+        return max(readers[0].fraction, i / n if n else 0.0)
+
+    def eta(self):
+        # fraction চলতি pass-এর; দুই pass-এর পথে (CSV merge) প্রথম pass-এর ETA তাই কম দেখায়
+        f = self.fraction()
+        if not 0 < f < 1 or self.elapsed < 0.5:
+            return None
+        return self.elapsed * (1 - f) / f
+
+    def snapshot(self, rows: int = 0, written: int = 0) -> dict:
+        secs = self.elapsed
+        # প্রথম কয়েকশো ms-এর rate শুধু buffer ভরার গতি, দেখানোর মতো নয়
+        rated = secs >= 0.25
+        return {
+            "units": self.units,
+            "fraction": self.fraction(),
+            "done_bytes": self.done_bytes,
+            "total_bytes": self.total_bytes,
+            "rows": rows,
+            "pass": max((r.passes for r in self._readers), default=1),
+            "written": written,
+            "bytes_per_sec": self.bytes_read / secs if rated else 0.0,
+            "rows_per_sec": rows / secs if rated else 0.0,
+            "elapsed": secs,
+            "eta": self.eta(),
+        }
+
+
+def format_eta(seconds) -> str:
+    if seconds is None:
+        return "—"
+    seconds = int(seconds + 0.5)
+    if seconds < 60:
+        return f"{seconds} s"
+    if seconds < 3600:
+        return f"{seconds // 60} m {seconds % 60:02d} s"
+    return f"{seconds // 3600} h {seconds % 3600 // 60:02d} m"
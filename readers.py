@@ -0,0 +1,370 @@
+# readers.py — xlsx পড়ার pluggable backend, আর Parquet / Feather (Arrow IPC) reader
+# "calamine"    → Rust-এ লেখা python-calamine (install থাকলে সবচেয়ে দ্রুত)
+# "openpyxl-ro" → openpyxl read-only + values_only: cell object তৈরি না করে সরাসরি value stream
+# "openpyxl"    → pandas-এর নিজস্ব openpyxl reader (শেষ fallback)
+# "auto" এগুলোর মধ্যে যেটা পাওয়া যায় সেটা নেয়; কোনোটা fail করলে পরেরটায় চলে যায়।
+# Columnar ফাইল record batch / row group ধরে পড়া হয়, পুরো ফাইল কখনো একসাথে memory-তে আসে না।
+import importlib.util
+import os
+import posixpath
+import re
+import time
+import zipfile
+from xml.etree import ElementTree
+
+import numpy as np
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+import csvio
+
+XLSX_ENGINES = ("calamine", "openpyxl-ro", "openpyxl")
+COLUMNAR_EXTS = ("parquet", "feather", "arrow")  # feather v2 আর .arrow একই Arrow IPC file format
+
+_DIMENSION = re.compile(rb'<(?:\w+:)?dimension\s+ref="\$?([A-Z]+)\$?(\d+)(?::\$?([A-Z]+)\$?(\d+))?"')
+_ROW_TAG = re.compile(rb"<(?:\w+:)?row[\s>]")
+_FIRST_ROW = re.compile(rb"<(?:\w+:)?row[\s>].*?</(?:\w+:)?row>", re.S)
+_CELL_REF = re.compile(rb'<(?:\w+:)?c\s[^>]*?r="\$?([A-Z]+)')
+_CELL_TAG = re.compile(rb"<(?:\w+:)?c[\s>/]")
+
+
+def has_calamine() -> bool:
+    return importlib.util.find_spec("python_calamine") is not None
+
+
+def xlsx_engine_order(engine: str = None) -> list:
+    # engine না দিলে XLSX_ENGINE env var (CLI --xlsx-engine এটাই সেট করে, worker process-ও পায়)
+    engine = engine or os.environ.get("XLSX_ENGINE", "auto")
+    if engine == "auto":
+        order = list(XLSX_ENGINES)
+    elif engine in XLSX_ENGINES:
+        # যেটা চাওয়া হয়েছে সেটা আগে, তারপর বাকিগুলো fallback হিসেবে
+        order = [engine] + [e for e in XLSX_ENGINES if e != engine]
+    else:
+        raise ValueError(f"unknown xlsx engine: {engine!r} (choose from auto, {', '.join(XLSX_ENGINES)})")
+    if not has_calamine():
+        order.remove("calamine")
+    return order
+
+
+# ---------- openpyxl read-only ----------
+def _convert(v, errors: frozenset):
+    # pandas-এর openpyxl reader যা করে তাই: খালি → "", 3.0 → 3, #N/A ইত্যাদি → NaN
+    if v is None:
+        return ""
+    if isinstance(v, float) and v.is_integer():
+        return int(v)
+    if isinstance(v, str) and v in errors:
+        return np.nan
+    return v
+
+
+def _sheet_rows(ws):
+    from openpyxl.cell.cell import ERROR_CODES
+
+    errors = frozenset(ERROR_CODES)
+    ws.reset_dimensions()  # কিছু writer ভুল <dimension> লেখে
+    for row in ws.iter_rows(values_only=True):
+        row = [_convert(v, errors) for v in row]
+        while row and row[-1] == "":
+            row.pop()
+        yield row
+
+
+def iter_xlsx_rows(f):
+    from openpyxl import load_workbook
+
+    wb = load_workbook(f, read_only=True, data_only=True, keep_links=False)
+    try:
+        yield from _sheet_rows(wb.worksheets[0])
+    finally:
+        wb.close()
+
+
+def rows_to_frame(header: list, rows: list) -> pd.DataFrame:
+    width = max([len(header)] + [len(r) for r in rows])
+    data = [r + [""] * (width - len(r)) for r in [header] + rows]
+    return TextParser(data, header=0, skip_blank_lines=False).read()
+
+
+def iter_xlsx_chunks(f, chunksize: int):
+    # একবারে chunksize row-এর বেশি memory-তে রাখি না; শেষের খালি row গুলো বাদ যায়
+    rows = iter_xlsx_rows(f)
+    header = next(rows, None)
+    if header is None:
+        return
+    buf, blank, emitted = [], [], False
+    for row in rows:
+        if not row:
+            blank.append(row)
+            continue
+        buf += blank + [row]
+        blank = []
+        if len(buf) >= chunksize:
+            yield rows_to_frame(header, buf)
+            buf, emitted = [], True
+    if buf or not emitted:
+        yield rows_to_frame(header, buf)
+
+
+def _rows_frame(rows) -> pd.DataFrame:
+    rows = list(rows)
+    while rows and not rows[-1]:
+        rows.pop()
+    if not rows:
+        return pd.DataFrame()
+    return rows_to_frame(rows[0], rows[1:])
+
+
+def _read_openpyxl_ro(f) -> pd.DataFrame:
+    return _rows_frame(iter_xlsx_rows(f))
+
+
+# ---------- একাধিক sheet ----------
+def xlsx_sheet_names(f) -> list:
+    # শুধু workbook.xml পড়া; sheet-এর data ছোঁয়া হয় না। f-এর অবস্থান বদলায় না
+    pos = f.tell()
+    try:
+        if has_calamine():
+            from python_calamine import CalamineWorkbook
+            return list(CalamineWorkbook.from_filelike(f).sheet_names)
+        from openpyxl import load_workbook
+        wb = load_workbook(f, read_only=True, keep_links=False)
+        try:
+            return list(wb.sheetnames)
+        finally:
+            wb.close()
+    finally:
+        f.seek(pos)
+
+
+def _open_sheets(f, name: str):
+    # (sheet নাম, parse(sheet) → DataFrame, close)। Workbook একবারই খোলা: ZIP-এর central directory আর
+    # shared strings একবার, তারপর প্রতিটি sheet-এর XML শুধু নিজের বেলায়
+    if name == "openpyxl-ro":
+        from openpyxl import load_workbook
+        wb = load_workbook(f, read_only=True, data_only=True, keep_links=False)
+        return wb.sheetnames, lambda sheet: _rows_frame(_sheet_rows(wb[sheet])), wb.close
+    book = pd.ExcelFile(f, engine=name)
+    return book.sheet_names, book.parse, book.close
+
+
+def iter_xlsx_sheets(f, sheets: list = None, engine: str = None, stats: list = None):
+    # (sheet নাম, DataFrame) — sheets না দিলে workbook-এর সব sheet তার ক্রমে, দিলে সেই ক্রমে।
+    # একসাথে একটাই sheet-এর frame memory-তে (caller লিখে ফেলার পর পরেরটা parse হয়)।
+    # read_xlsx-এর মতোই engine খোলা না গেলে পরেরটায় যাই; parse শুরু হয়ে গেলে আর বদলাই না
+    order = xlsx_engine_order(engine)
+    for i, name in enumerate(order):
+        try:
+            names, parse, close = _open_sheets(f, name)
+            break
+        except Exception:
+            if i == len(order) - 1:
+                raise
+            f.seek(0)
+    try:
+        missing = [s for s in sheets or [] if s not in names]
+        if missing:
+            raise ValueError(f"no such sheet(s): {', '.join(map(repr, missing))} (workbook has {', '.join(names)})")
+        for sheet in sheets or names:
+            t0 = time.perf_counter()
+            df = parse(sheet)
+            if stats is not None:
+                stats.append({"engine": name, "rows": len(df), "seconds": time.perf_counter() - t0})
+            yield sheet, df
+    finally:
+        close()
+
+
+# ---------- xlsx metadata ----------
+def _first_sheet_path(z: zipfile.ZipFile) -> str:
+    # workbook.xml-এর প্রথম <sheet>-এর r:id → workbook.xml.rels-এ তার XML ফাইল (pandas যেটা sheet 0 ধরে)
+    wb = ElementTree.fromstring(z.read("xl/workbook.xml"))
+    sheet = next(e for e in wb.iter() if e.tag.endswith("}sheet"))
+    rid = next(v for k, v in sheet.attrib.items() if k.endswith("}id"))
+    rels = ElementTree.fromstring(z.read("xl/_rels/workbook.xml.rels"))
+    target = next(e.get("Target") for e in rels if e.get("Id") == rid)
+    return target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join("xl", target))
+
+
+def _col_number(letters: bytes) -> int:
+    n = 0
+    for c in letters:
+        n = n * 26 + c - 64
+    return n
+
+
+def _row_width(row: bytes) -> int:
+    # একটা <row>-এর cell: r="C1" থাকলে সবচেয়ে ডানের column, নাহলে <c> গুনে
+    refs = _CELL_REF.findall(row)
+    return max(map(_col_number, refs)) if refs else len(_CELL_TAG.findall(row))
+
+
+def xlsx_shape(f) -> tuple:
+    # (row, column, exact) — প্রথম sheet-এর <dimension ref="A1:E5001"> থেকে, cell parse ছাড়া।
+    # dimension না থাকলে sheet XML-এ <row> tag গুনি (decompress হয়, parse হয় না), column প্রথম row থেকে।
+    # শেষের খালি (শুধু format করা) row reader বাদ দেয় কিন্তু dimension আর <row> গোনায় ধরা থাকে, তাই দুই
+    # পথেই exact=False (10 row-এর sheet-এ A500-এ শুধু bold থাকলে dimension বলে 499)। f-এর অবস্থান বদলায় না
+    pos = f.tell()
+    try:
+        with zipfile.ZipFile(f) as z, z.open(_first_sheet_path(z)) as xml:
+            data = xml.read(64 << 10)
+            m = _DIMENSION.search(data.split(b"sheetData", 1)[0])
+            if m and m.group(3):
+                top, bottom = int(m.group(2)), int(m.group(4))
+                return bottom - top, _col_number(m.group(3)) - _col_number(m.group(1)) + 1, False
+            first = _FIRST_ROW.search(data)
+            width = _row_width(first.group(0)) if first else 0
+            rows = 0
+            while True:
+                block = xml.read(1 << 20)
+                # শেষ "<"-এর পরের অংশ পরের block-এর সাথে গুনি, যাতে দুই block-এ কাটা tag হারায় না বা দুবার না আসে
+                cut = data.rfind(b"<") if block else len(data)
+                rows += len(_ROW_TAG.findall(data, 0, cut if cut >= 0 else len(data)))
+                if not block:
+                    break
+                data = data[cut:] + block if cut >= 0 else block
+    finally:
+        f.seek(pos)
+    return max(0, rows - 1), width, False
+
+
+# ---------- parquet / feather ----------
+def _open_arrow(f, ext: str):
+    if ext == "parquet":
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(f)
+    import pyarrow.ipc as ipc
+    return ipc.open_file(f)
+
+
+def columnar_shape(f, ext: str) -> tuple:
+    # শুধু footer / metadata পড়ে (rows, columns) — ডেটা নয়
+    pos = f.tell()
+    try:
+        src = _open_arrow(f, ext)
+        if ext == "parquet":
+            return src.metadata.num_rows, len(src.schema_arrow)
+        return src.count_rows(), len(src.schema)
+    finally:
+        f.seek(pos)
+
+
+def columnar_dtypes(f, ext: str) -> pd.Series:
+    # schema থেকে pandas dtype (খালি table convert করে), ডেটা পড়া ছাড়াই
+    pos = f.tell()
+    try:
+        src = _open_arrow(f, ext)
+        arrow_schema = src.schema_arrow if ext == "parquet" else src.schema
+        return arrow_schema.empty_table().to_pandas().dtypes
+    finally:
+        f.seek(pos)
+
+
+def _arrow_batches(f, ext: str, batch_rows: int):
+    src = _open_arrow(f, ext)
+    if ext == "parquet":
+        yield src.schema_arrow
+        yield from src.iter_batches(batch_size=batch_rows)
+    else:
+        yield src.schema
+        for i in range(src.num_record_batches):
+            yield src.get_batch(i)
+
+
+def iter_columnar_chunks(f, ext: str, chunksize: int):
+    # batch গুলো যে মাপেই আসুক, ঠিক chunksize row-এর DataFrame বানিয়ে দিই (splitter-এর part সঠিক হয়)
+    import pyarrow as pa
+
+    batches = _arrow_batches(f, ext, chunksize)
+    arrow_schema = next(batches)
+    pending, rows, emitted = [], 0, False
+    for batch in batches:
+        pending.append(batch)
+        rows += batch.num_rows
+        while rows >= chunksize:
+            table = pa.Table.from_batches(pending, arrow_schema)
+            yield table.slice(0, chunksize).to_pandas()
+            rest = table.slice(chunksize)
+            pending, rows, emitted = rest.to_batches(), rest.num_rows, True
+    if rows or not emitted:
+        yield pa.Table.from_batches(pending, arrow_schema).to_pandas()
+
+
+def read_columnar(f, ext: str) -> pd.DataFrame:
+    if ext == "parquet":
+        return pd.read_parquet(f)
+    return pd.read_feather(f)
+
+
+# ---------- public ----------
+def table_columns(f, ext: str) -> list:
+    # শুধু header (column-এর নাম) — UI-র key বাছাই আর CLI-র যাচাইয়ের জন্য; f-এর অবস্থান বদলায় না
+    pos = f.tell()
+    try:
+        if ext in COLUMNAR_EXTS:
+            return list(columnar_dtypes(f, ext).index)
+        if ext == "xlsx":
+            rows = iter_xlsx_rows(f)
+            try:
+                return [str(v) for v in next(rows, [])]
+            finally:
+                rows.close()
+        return csvio.columns(f)
+    finally:
+        f.seek(pos)
+
+
+def probe(f, ext: str) -> tuple:
+    # (row, column, exact) — UI-র "N rows × M columns"-এর জন্য শুধু metadata / newline গোনা, parse নয়:
+    # columnar-এর footer, xlsx-এর <dimension>, CSV-র newline (mmap-এ)। f-এর অবস্থান বদলায় না
+    if ext in COLUMNAR_EXTS:
+        return (*columnar_shape(f, ext), True)
+    if ext == "xlsx":
+        return xlsx_shape(f)
+    d = csvio.sniff(f)
+    rows, exact = csvio.count_rows(f, d)
+    return rows, len(csvio.columns(f, d)), exact
+
+
+def read_xlsx(f, engine: str = None, stats: list = None) -> pd.DataFrame:
+    order = xlsx_engine_order(engine)
+    for i, name in enumerate(order):
+        t0 = time.perf_counter()
+        try:
+            if name == "openpyxl-ro":
+                df = _read_openpyxl_ro(f)
+            else:
+                df = pd.read_excel(f, engine=name)
+        except Exception:
+            if i == len(order) - 1:
+                raise
+            f.seek(0)
+            continue
+        if stats is not None:
+            stats.append({"engine": name, "rows": len(df), "seconds": time.perf_counter() - t0})
+        return df
+
+
+def timed_chunks(chunks, engine: str, stats: list):
+    # chunk iterator-এর ভেতরে (অর্থাৎ parse-এ) যতটুকু সময় গেল শুধু সেটুকু গুনি,
+    # caller-এর লেখার সময় বাদ; শেষে stats-এ একটা entry যোগ হয়
+    rows, secs = 0, 0.0
+    it = iter(chunks)
+    while True:
+        t0 = time.perf_counter()
+        chunk = next(it, None)
+        secs += time.perf_counter() - t0
+        if chunk is None:
+            break
+        rows += len(chunk)
+        yield chunk
+    stats.append({"engine": engine, "rows": rows, "seconds": secs})
+
+
+def throughput(stats: list) -> str:
+    rows = sum(s["rows"] for s in stats)
+    secs = sum(s["seconds"] for s in stats)
+    engines = ", ".join(sorted({s["engine"] for s in stats}))
+    rate = rows / secs if secs > 0 else 0
+    return f"{rows:,} rows in {secs:.2f} s · {rate:,.0f} rows/sec ({engines})"
@@ -0,0 +1,181 @@
+# schema.py — compact dtype stage
+# Default dtype-এ পড়লে text column গুলো object/str, আর কোনো ফাইলে একটা ঘর খালি থাকলেই
+# int column float64 হয়ে যায়। এখানে সব input-এর header + প্রথম কিছু row দেখে একটা schema ঠিক করি:
+#   কম unique মানের text      → category
+#   বাকি text (object হলে)     → Arrow string (pyarrow থাকলে)
+#   খালি ঘরসহ পূর্ণসংখ্যা        → nullable Int64 ("3.0" না, "3")
+#   পূর্ণসংখ্যা column          → পড়ার পর সবচেয়ে ছোট int-এ downcast
+# CSV-তে schema read_csv-এর dtype হিসেবেই যায়; xlsx parse হওয়ার সাথে সাথে প্রয়োগ হয়।
+# Float কখনো float32 করি না — output-এর লেখা বদলে যেত।
+import importlib.util
+import os
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+import pandas as pd
+
+import csvio
+
+SAMPLE_ROWS = 10_000
+CATEGORY_RATIO = 0.5  # unique / non-null এর চেয়ে কম হলে category
+
+
+def _string_dtype():
+    if importlib.util.find_spec("pyarrow") is not None:
+        return pd.StringDtype("pyarrow")
+    return None
+
+
+def sample_csv(f, nrows: int = SAMPLE_ROWS) -> pd.DataFrame:
+    pos = f.tell()
+    try:
+        return csvio.read(f, nrows=nrows)
+    finally:
+        f.seek(pos)
+
+
+def infer(samples: list) -> dict:
+    # column → dtype; শুধু যেগুলো default থেকে বদলাবে
+    types = {}
+    cols = dict.fromkeys(c for s in samples for c in s.columns)
+    for c in cols:
+        col = pd.concat([s[c] for s in samples if c in s.columns], ignore_index=True)
+        values = col.dropna()
+        if values.empty or pd.api.types.is_bool_dtype(col):
+            continue
+        if pd.api.types.is_float_dtype(col):
+            if col.isna().any() and (values % 1 == 0).all():
+                types[c] = "Int64"
+        elif pd.api.types.infer_dtype(values, skipna=True) == "string":
+            # প্রতিটি sample আলাদা করে দেখি: একই id গুলো সব ফাইলে থাকলে union-এ কম unique দেখাত
+            parts = [s[c].dropna() for s in samples if c in s.columns]
+            if all(p.nunique() <= len(p) * CATEGORY_RATIO for p in parts):
+                types[c] = "category"
+            elif col.dtype == object and _string_dtype() is not None:
+                types[c] = _string_dtype()
+    return types
+
+
+def apply(df: pd.DataFrame, types: dict) -> pd.DataFrame:
+    # sample-এ যা দেখিনি এমন মান থাকলে (যেমন Int64 column-এ 1.5) সেই column আগের মতোই থাকে
+    for c, dtype in types.items():
+        if c in df.columns:
+            try:
+                df[c] = df[c].astype(dtype)
+            except (ValueError, TypeError, OverflowError):
+                pass
+    return downcast(df)
+
+
+def downcast(df: pd.DataFrame) -> pd.DataFrame:
+    for c in df.columns:
+        if pd.api.types.is_integer_dtype(df[c]):
+            df[c] = pd.to_numeric(df[c], downcast="integer")
+    return df
+
+
+def _count(mem: dict, before: int, after: int):
+    if mem is not None:
+        mem["frames_before"] = mem.get("frames_before", 0) + before
+        mem["frames"] = mem.get("frames", 0) + after
+
+
+def ratio(samples: list, types: dict) -> float:
+    # default dtype-এ frame কত গুণ বড় হতো — sample-এ দুইভাবেই মেপে দেখি
+    small = frame_bytes([apply(s.copy(), types) for s in samples])
+    return frame_bytes(samples) / small if small else 1.0
+
+
+def read_csv(f, types: dict, mem: dict = None, scale: float = 1.0, **kwargs) -> pd.DataFrame:
+    # schema সরাসরি read_csv-এ যায়, তাই default dtype-এর বড় frame কখনো তৈরিই হয় না;
+    # mem-এ "আগে" অংশটা তাই sample থেকে পাওয়া scale দিয়ে আন্দাজ
+    # category / nullable dtype pyarrow-এ যায় না, তাই এই পথ সবসময় C engine
+    try:
+        df = downcast(csvio.read(f, engine="c", dtype=types, **kwargs))
+    except (ValueError, TypeError, OverflowError):
+        f.seek(0)
+        df = apply(csvio.read(f, engine="c", **kwargs), types)
+    if mem is not None:
+        after = frame_bytes([df])
+        _count(mem, int(after * scale), after)
+    return df
+
+
+def compact(df: pd.DataFrame, mem: dict = None) -> pd.DataFrame:
+    # ইতিমধ্যে parse হওয়া frame (xlsx): নিজের প্রথম SAMPLE_ROWS row থেকেই schema
+    before = frame_bytes([df]) if mem is not None else 0
+    df = apply(df, infer([df.head(SAMPLE_ROWS)]))
+    if mem is not None:
+        _count(mem, before, frame_bytes([df]))
+    return df
+
+
+def concat(frames: list) -> pd.DataFrame:
+    # প্রতিটি ফাইলের category আলাদা হলে pd.concat সেটাকে object বানিয়ে ফেলে,
+    # তাই আগে সব ফাইলের category এক করি
+    cols = list(dict.fromkeys(c for df in frames for c in df.columns))
+    frames = [df.reindex(columns=cols) for df in frames]
+    for c in cols:
+        parts = [df[c] for df in frames]
+        cats = [p for p in parts if isinstance(p.dtype, pd.CategoricalDtype)]
+        if not cats or any(p.notna().any() for p in parts if not isinstance(p.dtype, pd.CategoricalDtype)):
+            continue
+        union = pd.CategoricalDtype(pd.Index(dict.fromkeys(v for p in cats for v in p.cat.categories)))
+        for df in frames:
+            df[c] = df[c].astype(union)
+    return pd.concat(frames, ignore_index=True)
+
+
+def frame_bytes(frames: list) -> int:
+    return int(sum(df.memory_usage(deep=True).sum() for df in frames))
+
+
+# ---------- peak memory ----------
+# Linux-এ আলাদা thread প্রতি POLL_SECONDS-এ /proc/self/statm থেকে RSS পড়ে সর্বোচ্চটা রাখে —
+# প্রায় খরচহীন, কিন্তু পুরো process-এর (অন্য session-এর কাজও এতে ঢোকে)।
+# অন্য OS-এ tracemalloc: শুধু Python/numpy allocation, আর কাজ কয়েক গুণ ধীর হয়।
+POLL_SECONDS = 0.02
+_PAGE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss() -> int:
+    with open("/proc/self/statm") as fh:
+        return int(fh.read().split()[1]) * _PAGE
+
+
+def has_proc() -> bool:
+    try:
+        rss()
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+@contextmanager
+def measure(mem: dict):
+    # mem["peak"] = কাজ শুরুর সময়ের চেয়ে সর্বোচ্চ কত byte বেশি লাগল
+    if not has_proc():
+        tracemalloc.start()
+        try:
+            yield mem
+        finally:
+            mem["peak"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        return
+    base = top = rss()
+    done = threading.Event()
+
+    def poll():
+        nonlocal top
+        while not done.wait(POLL_SECONDS):
+            top = max(top, rss())
+
+    t = threading.Thread(target=poll, daemon=True)
+    t.start()
+    try:
+        yield mem
+    finally:
+        done.set()
+        t.join()
+        mem["peak"] = max(top, rss()) - base
@@ -0,0 +1,170 @@
+# spill.py — memory budget আর spill-to-disk output buffer
+# প্রতিটি job-এর output প্রথমে memory-তে (BytesIO) লেখা হয়। job-এর নিজের সীমা (JOB_MEMORY_MB)
+# বা পুরো process-এর সীমা (PROCESS_MEMORY_MB, সব session মিলিয়ে) ছাড়ালে বাকিটা
+# SPILL_DIR-এর temp file-এ চলে যায়। Buffer বন্ধ হলে বা garbage collect হলে (যেমন session শেষে
+# session_state মুছে গেলে) file মুছে যায় আর reserve করা memory ফেরত আসে।
+import io
+import os
+import tempfile
+import threading
+import time
+import weakref
+
+JOB_MEMORY_MB = int(os.environ.get("JOB_MEMORY_MB", "256"))
+PROCESS_MEMORY_MB = int(os.environ.get("PROCESS_MEMORY_MB", "1024"))
+SPILL_DIR = os.environ.get("SPILL_DIR") or os.path.join(tempfile.gettempdir(), "shikder-spill")
+SPILL_TTL = int(os.environ.get("SPILL_TTL", str(6 * 3600)))  # crash-এর পর পড়ে থাকা file কত সেকেন্ড পর মুছব
+
+
+class Budget:
+    # process-wide হিসাব: কোন buffer কত byte memory-তে রেখেছে
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def reserve(self, n: int) -> bool:
+        with self._lock:
+            if self.used + n > self.max_bytes:
+                return False
+            self.used += n
+            return True
+
+    def release(self, n: int):
+        with self._lock:
+            self.used = max(0, self.used - n)
+
+
+budget = Budget(PROCESS_MEMORY_MB << 20)
+
+
+def _cleanup(state: dict, budget: Budget):
+    budget.release(state["reserved"])
+    state["reserved"] = 0
+    if state["file"] is not None:
+        state["file"].close()
+    if state["path"] is not None:
+        try:
+            os.remove(state["path"])
+        except OSError:
+            pass
+        state["path"] = None
+
+
+def sweep(max_age: int = SPILL_TTL):
+    # আগের process crash করলে যেসব spill file রয়ে গেছে সেগুলো মুছি
+    if not os.path.isdir(SPILL_DIR):
+        return
+    cutoff = time.time() - max_age
+    for name in os.listdir(SPILL_DIR):
+        path = os.path.join(SPILL_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+class SpillBuffer(io.BufferedIOBase):
+    def __init__(self, limit_mb: int = JOB_MEMORY_MB, budget: Budget = budget):
+        super().__init__()
+        self.limit = limit_mb << 20
+        self._budget = budget
+        self._f = io.BytesIO()
+        self._size = 0
+        self._state = {"reserved": 0, "path": None, "file": None}
+        self._lock = threading.Lock()  # job thread-এর write আর UI thread-এর close একসাথে না চলে
+        self._finalizer = weakref.finalize(self, _cleanup, self._state, budget)
+
+    @property
+    def spilled(self) -> bool:
+        return self._state["path"] is not None
+
+    @property
+    def path(self):
+        return self._state["path"]
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _spill(self):
+        os.makedirs(SPILL_DIR, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix="job-", dir=SPILL_DIR)
+        disk = os.fdopen(fd, "w+b")
+        self._state["path"], self._state["file"] = path, disk
+        pos = self._f.tell()
+        disk.write(self._f.getbuffer())
+        disk.seek(pos)
+        self._f = disk
+        self._budget.release(self._state["reserved"])
+        self._state["reserved"] = 0
+
+    # ---------- io interface ----------
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        with self._lock:
+            # বন্ধ হওয়ার পর reserve করলে তা আর কখনো release হতো না
+            if self.closed:
+                raise ValueError("write to closed SpillBuffer")
+            end = self._f.tell() + len(b)
+            if not self.spilled and end > self._state["reserved"]:
+                grow = end - self._state["reserved"]
+                if end > self.limit or not self._budget.reserve(grow):
+                    self._spill()
+                else:
+                    self._state["reserved"] = end
+            n = self._f.write(b)
+            self._size = max(self._size, end)
+            return n
+
+    def read(self, n: int = -1) -> bytes:
+        return self._f.read(n)
+
+    def read1(self, n: int = -1) -> bytes:
+        return self._f.read(n)
+
+    def readinto(self, b) -> int:
+        return self._f.readinto(b)
+
+    def seek(self, pos: int, whence: int = 0) -> int:
+        return self._f.seek(pos, whence)
+
+    def tell(self) -> int:
+        return self._f.tell()
+
+    def flush(self):
+        if not self._f.closed:
+            self._f.flush()
+
+    def close(self):
+        with self._lock:
+            if not self.closed:
+                self._finalizer()
+                self._f.close()  # memory-তে থাকলে BytesIO-র byte গুলোও ছেড়ে দিই
+                super().close()
+
+    def download_data(self):
+        # st.download_button-এর জন্য: memory-তে থাকলে buffer নিজেই,
+        # disk-এ থাকলে callable — click করলে তবেই file পড়া হয় (handle সাথে সাথে বন্ধ)
+        if self.spilled:
+            self.flush()
+            path = self.path
+
+            def data() -> bytes:
+                with open(path, "rb") as fh:
+                    return fh.read()
+            return data
+        self._f.seek(0)
+        return self._f
+
+
+sweep()
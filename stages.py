@@ -0,0 +1,208 @@
+# stages.py — প্রতিটি tool-এর ধাপভিত্তিক (stage) সময়, memory আর byte হিসাব
+# একটা Trace এক job-এর পুরো পথ ধরে: upload → parse → concat → write → zip → download।
+#   * সময় exclusive: ভেতরের stage চলার সময় বাইরেরটার ঘড়ি থামে, তাই সব stage যোগ করলে মোট সময় হয়
+#   * memory: Trace চালু থাকলে একটা thread schema.POLL_SECONDS পর পর RSS পড়ে, আর সেই মুহূর্তে যে
+#     stage চলছে তার peak হিসেবে রাখে (trace শুরুর RSS-এর চেয়ে কত বেশি)। Linux ছাড়া memory নেই।
+#   * byte: কোন stage কত byte পড়ল / লিখল
+# শেষে log() একটা JSON লাইন লেখে (logger "shikder.stages") — TRACE_LOG দিলে সেই ফাইলে, না দিলে stderr-এ।
+# engine-এর function গুলো trace=None নিলে কিছুই মাপে না (stage() / wrap() তখন no-op)।
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+
+import schema
+
+TRACE_LOG = os.environ.get("TRACE_LOG", "")  # JSON lines ফাইলের path; খালি হলে stderr
+
+ORDER = ("upload", "schema", "parse", "concat", "sort", "dedupe", "partition", "encode", "write", "zip", "cache", "download")
+
+log_ = logging.getLogger("shikder.stages")
+log_.setLevel(logging.INFO)
+log_.propagate = False
+log_.addHandler(logging.FileHandler(TRACE_LOG) if TRACE_LOG else logging.StreamHandler(sys.stderr))
+
+
+def size_of(f) -> int:
+    # UploadedFile-এর size আছে; open() করা ফাইলের জন্য fstat, BytesIO-র জন্য শেষ পর্যন্ত seek
+    if getattr(f, "size", None) is not None:
+        return f.size
+    try:
+        return os.fstat(f.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        pos = f.tell()
+        end = f.seek(0, 2)
+        f.seek(pos)
+        return end
+
+
+def _tell(out):
+    try:
+        return out.tell() if out is not None else None
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class Trace:
+    def __init__(self, tool: str, **meta):
+        self.tool = tool
+        self.meta = meta
+        self.stages = {}  # নাম → {"seconds", "calls", "bytes_in", "bytes_out", "peak_bytes", ...}
+        self.total = None
+        self.peak = None
+        self._stack = []
+        self._t = None
+        self._base = None
+        self._done = None
+
+    def _get(self, name: str) -> dict:
+        return self.stages.setdefault(name, {"seconds": 0.0, "calls": 0, "bytes_in": 0, "bytes_out": 0,
+                                             "peak_bytes": None})
+
+    def _charge(self):
+        # এখন পর্যন্ত সময়টা stack-এর উপরের stage-এর ঘাড়ে
+        now = time.perf_counter()
+        if self._stack and self._t is not None:
+            self._get(self._stack[-1])["seconds"] += now - self._t
+        self._t = now
+
+    @contextmanager
+    def stage(self, name: str, bytes_in: int = 0, out=None):
+        # out দিলে stage-এর শুরু আর শেষের out.tell()-এর পার্থক্য bytes_out-এ যায়
+        s = self._get(name)
+        s["calls"] += 1
+        s["bytes_in"] += bytes_in
+        pos = _tell(out)
+        self._charge()
+        self._stack.append(name)
+        try:
+            yield s
+        finally:
+            self._charge()
+            self._stack.pop()
+            end = _tell(out) if pos is not None else None
+            if end is not None:
+                s["bytes_out"] += end - pos
+
+    def wrap(self, name: str, iterable):
+        # generator থেকে প্রতিটি chunk আনার সময়টা name stage-এ; chunk-এর row-ও গোনা হয়
+        it = iter(iterable)
+        while True:
+            with self.stage(name) as s:
+                try:
+                    item = next(it)
+                except StopIteration:
+                    return
+                if hasattr(item, "shape"):
+                    s["rows"] = s.get("rows", 0) + len(item)
+            yield item
+
+    def add(self, name: str, seconds: float = 0.0, bytes_in: int = 0, bytes_out: int = 0, calls: int = 1, **extra):
+        # বাইরে মাপা কিছু (worker process-এর সময়, ZIP report) যোগ করি; extra-র সংখ্যা গুলো যোগ হয়
+        s = self._get(name)
+        s["calls"] += calls
+        s["seconds"] += seconds
+        s["bytes_in"] += bytes_in
+        s["bytes_out"] += bytes_out
+        for k, v in extra.items():
+            s[k] = s.get(k, 0) + v if isinstance(v, (int, float)) and not isinstance(v, bool) else v
+
+    def carve(self, src: str, dst: str, seconds: float, **counters):
+        # src stage-এর ভেতরেই যে সময় dst-এর কাজে গেছে (যেমন part লেখার ভেতরের compress) সেটা সরাই
+        s = self._get(src)
+        moved = min(seconds, s["seconds"])
+        s["seconds"] -= moved
+        self.add(dst, moved, calls=0, **counters)
+
+    # ---------- memory poller ----------
+    def _poll(self):
+        while not self._done.wait(schema.POLL_SECONDS):
+            self._sample()
+
+    def _sample(self):
+        try:
+            used = schema.rss() - self._base
+        except (OSError, ValueError):
+            return
+        self.peak = max(self.peak or 0, used)
+        try:
+            name = self._stack[-1]
+        except IndexError:  # job thread এইমাত্র শেষ stage থেকে বের হলো
+            return
+        s = self._get(name)
+        s["peak_bytes"] = max(s["peak_bytes"] or 0, used)
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        self._t = self._start
+        if schema.has_proc():
+            self._base = schema.rss()
+            self._done = threading.Event()
+            self._poller = threading.Thread(target=self._poll, daemon=True)
+            self._poller.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._done is not None:
+            self._done.set()
+            self._poller.join()
+            self._sample()
+            self._done = None
+        self._charge()
+        self.total = (self.total or 0.0) + time.perf_counter() - self._start
+        return False
+
+    def rows_done(self) -> int:
+        # job চলার সময় progress-এর জন্য: এ পর্যন্ত কোনো stage-এ সবচেয়ে বেশি কত row পার হয়েছে
+        return max((s.get("rows", 0) for s in list(self.stages.values())), default=0)
+
+    # ---------- report ----------
+    def rows(self) -> list:
+        # ORDER-এর ক্রমে, অজানা stage গুলো শেষে
+        names = sorted(self.stages, key=lambda n: (ORDER.index(n) if n in ORDER else len(ORDER), n))
+        return [{"stage": n, **{k: (round(v, 4) if isinstance(v, float) else v) for k, v in self.stages[n].items()}}
+                for n in names]
+
+    def to_dict(self) -> dict:
+        staged = sum(s["seconds"] for s in self.stages.values())
+        # upload / UI-তে আগে হওয়া parse trace চালুর বাইরে মাপা, তাই মোট অন্তত stage গুলোর যোগফল
+        total = max(self.total or 0.0, staged)
+        return {
+            "tool": self.tool,
+            "total_seconds": round(total, 4),
+            "other_seconds": round(max(0.0, total - staged), 4),
+            "peak_bytes": self.peak,
+            "stages": self.rows(),
+            **self.meta,
+        }
+
+    def log(self, **fields):
+        record = {"event": "stages", "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+                  **self.to_dict(), **fields}
+        log_.info(json.dumps(record, default=str))
+        return record
+
+
+def stage(trace, name: str, bytes_in: int = 0, out=None):
+    return trace.stage(name, bytes_in, out) if trace is not None else nullcontext()
+
+
+def wrap(trace, name: str, iterable):
+    return trace.wrap(name, iterable) if trace is not None else iterable
+
+
+def summary(trace: Trace) -> list:
+    # CLI-র জন্য মানুষের পড়ার মতো লাইন
+    d = trace.to_dict()
+    lines = []
+    for r in d["stages"]:
+        pct = r["seconds"] / d["total_seconds"] * 100 if d["total_seconds"] else 0
+        peak = f"  peak +{r['peak_bytes']:,} B" if r["peak_bytes"] is not None else ""
+        io_ = f"  in {r['bytes_in']:,} B  out {r['bytes_out']:,} B" if r["bytes_in"] or r["bytes_out"] else ""
+        lines.append(f"{r['stage']:<9} {r['seconds']:>8.3f} s {pct:5.1f}%  ×{r['calls']}{peak}{io_}")
+    lines.append(f"{'total':<9} {d['total_seconds']:>8.3f} s (unstaged {d['other_seconds']:.3f} s)")
+    return lines
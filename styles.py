@@ -0,0 +1,230 @@
+# styles.py — theme রঙ আর পুরো page-এর CSS
+# CSS f-string প্রায় ২৫০ লাইনের; প্রতি rerun-এ (theme / language বদলালেও) নতুন করে বানানোর দরকার নেই —
+# theme প্রতি একবার render হয়ে process-এ থেকে যায়।
+from functools import lru_cache
+
+THEMES = {
+    "dark":  {"bg": "#0e1117", "primary": "#00f7ff", "secondary": "#9ca3af", "card": "#141923", "guide": "#0d1f2d", "icon": "🌙", "next": "light"},
+    "light": {"bg": "#f8f9fa", "primary": "#00a8cc", "secondary": "#444444", "card": "#ffffff",  "guide": "#e4f4fb", "icon": "☀️", "next": "ocean"},
+    "ocean": {"bg": "#0a1929", "primary": "#00e5ff", "secondary": "#8ab4f8", "card": "#1a2942", "guide": "#0d2137", "icon": "🌊", "next": "dark"},
+}
+
+
+@lru_cache(maxsize=None)
+def css(theme: str) -> str:
+    t = THEMES[theme]
+    return f"""
+<style>
+@import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700;800&display=swap');
+
+* {{
+    font-family: 'Inter', sans-serif;
+    transition: background 0.3s, color 0.3s;
+    margin: 0; padding: 0;
+    box-sizing: border-box;
+}}
+body {{ background: {t['bg']}; }}
+.main {{ padding: 0 !important; }}
+.block-container {{ padding: 1rem 2rem !important; max-width: 100% !important; }}
+
+/* ── Tool Cards ── */
+.tool-card {{
+    background: {t['card']};
+    padding: 1.5rem;
+    border-radius: 15px;
+    text-align: center;
+    border: 1px solid {t['primary']}33;
+    transition: transform 0.3s, box-shadow 0.3s;
+    height: 100%;
+    min-height: 180px;
+    display: flex;
+    flex-direction: column;
+    justify-content: space-between;
+    align-items: center;
+}}
+.tool-card:hover {{
+    transform: translateY(-5px);
+    box-shadow: 0 10px 30px {t['primary']}44;
+}}
+.tool-icon {{
+    font-size: 3rem;
+    transition: transform 0.5s cubic-bezier(0.34,1.56,0.64,1);
+    margin-bottom: 0.5rem;
+    display: inline-block;
+}}
+.tool-card:hover .tool-icon {{ transform: rotate(360deg) scale(1.15); }}
+.tool-name {{
+    color: {t['primary']};
+    font-size: 1.05rem;
+    font-weight: 600;
+    margin: 0.5rem 0;
+}}
+
+/* ── Title ── */
+.title {{
+    text-align: center;
+    font-size: 2.5rem;
+    font-weight: 800;
+    background: linear-gradient(135deg, {t['primary']}, #ff00ff);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    animation: glow 2s infinite alternate;
+    margin-bottom: 0.4rem;
+}}
+@keyframes glow {{
+    from {{ filter: drop-shadow(0 0 5px {t['primary']}88); }}
+    to   {{ filter: drop-shadow(0 0 22px #ff00ff88); }}
+}}
+
+/* ── Guide Panel ── */
+.guide-panel {{
+    background: {t['guide']};
+    border: 1px solid {t['primary']}44;
+    border-radius: 14px;
+    padding: 1.3rem 1.6rem;
+    margin-bottom: 1.2rem;
+    animation: fadeSlide 0.4s ease;
+}}
+@keyframes fadeSlide {{
+    from {{ opacity: 0; transform: translateY(-10px); }}
+    to   {{ opacity: 1; transform: translateY(0); }}
+}}
+.guide-section {{ margin-bottom: 1rem; }}
+.guide-label {{
+    color: {t['primary']};
+    font-weight: 700;
+    font-size: 0.8rem;
+    letter-spacing: 0.08em;
+    text-transform: uppercase;
+    margin-bottom: 0.35rem;
+}}
+.guide-text {{
+    color: {t['secondary']};
+    font-size: 0.92rem;
+    line-height: 1.65;
+}}
+.guide-step {{
+    color: {t['secondary']};
+    font-size: 0.9rem;
+    line-height: 1.8;
+    padding-left: 0.3rem;
+}}
+.step-num {{
+    color: {t['primary']};
+    font-weight: 700;
+    margin-right: 0.45rem;
+    font-size: 0.95rem;
+}}
+.guide-tip {{
+    background: {t['primary']}15;
+    border-left: 3px solid {t['primary']};
+    padding: 0.6rem 1rem;
+    border-radius: 0 8px 8px 0;
+    color: {t['secondary']};
+    font-size: 0.87rem;
+    margin-top: 0.5rem;
+    line-height: 1.5;
+}}
+
+/* ── Processing Animation ── */
+.proc-wrap {{
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    padding: 1.8rem 1rem;
+    animation: fadeSlide 0.3s ease;
+}}
+.proc-ring {{
+    width: 56px;
+    height: 56px;
+    border: 4px solid {t['primary']}33;
+    border-top-color: {t['primary']};
+    border-radius: 50%;
+    animation: spin 0.75s linear infinite;
+    margin-bottom: 0.9rem;
+}}
+@keyframes spin {{ to {{ transform: rotate(360deg); }} }}
+.proc-label {{
+    color: {t['primary']};
+    font-size: 1rem;
+    font-weight: 600;
+    animation: blink 1.2s ease-in-out infinite;
+}}
+@keyframes blink {{ 0%,100% {{ opacity:1; }} 50% {{ opacity:0.45; }} }}
+.proc-counter {{
+    color: {t['secondary']};
+    font-size: 0.85rem;
+    margin-top: 0.3rem;
+}}
+.prog-outer {{
+    width: 220px;
+    height: 5px;
+    background: {t['primary']}22;
+    border-radius: 10px;
+    margin-top: 0.8rem;
+    overflow: hidden;
+}}
+.prog-inner {{
+    height: 100%;
+    background: linear-gradient(90deg, {t['primary']}, #ff00ff);
+    border-radius: 10px;
+    transition: width 0.2s ease;
+}}
+
+/* ── Done Animation ── */
+.done-wrap {{
+    text-align: center;
+    padding: 1.2rem;
+    animation: popIn 0.4s cubic-bezier(0.34,1.56,0.64,1);
+}}
+@keyframes popIn {{
+    from {{ transform: scale(0.6); opacity: 0; }}
+    to   {{ transform: scale(1);   opacity: 1; }}
+}}
+.done-icon {{ font-size: 2.8rem; }}
+.done-text {{
+    color: {t['primary']};
+    font-size: 1.05rem;
+    font-weight: 700;
+    margin-top: 0.5rem;
+}}
+
+/* ── File list ── */
+.history-item {{
+    background: {t['card']};
+    padding: 10px 14px;
+    margin: 6px 0;
+    border-radius: 8px;
+    border-left: 3px solid {t['primary']};
+    font-size: 0.88rem;
+}}
+
+/* ── Footer ── */
+.custom-footer {{
+    text-align: center;
+    padding: 18px;
+    color: {t['secondary']};
+    font-size: 13px;
+    margin-top: 1rem;
+}}
+.highlight-dev  {{ color: #00ff99; font-weight: 700; }}
+.highlight-spon {{ color: #ff0066; font-weight: 700; }}
+
+/* ── Divider ── */
+.fancy-divider {{
+    height: 2px;
+    background: linear-gradient(90deg, {t['primary']}55, transparent);
+    border-radius: 2px;
+    margin: 0.8rem 0 1rem 0;
+}}
+
+#MainMenu, footer, header {{ visibility: hidden; }}
+[data-testid="stSidebar"] {{ display: none; }}
+
+@media (max-width: 768px) {{
+    .title {{ font-size: 1.8rem; }}
+    .tool-icon {{ font-size: 2.5rem; }}
+    .tool-card {{ min-height: 150px; padding: 1rem; }}
+}}
+</style>
+"""
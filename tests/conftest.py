@@ -0,0 +1,5 @@
+# tests/conftest.py — module গুলো repo-র root-এ (package নয়), তাই সেখান থেকে import
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
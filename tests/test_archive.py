@@ -0,0 +1,59 @@
+# tests/test_archive.py — ArchiveWriter-এর ZIP zipfile দিয়ে পড়া যায়, byte / CRC / manifest ঠিক থাকে
+import io
+import json
+import zipfile
+
+import pytest
+
+import archive
+
+ENTRIES = [("a.csv", b"x,y\n" + b"1,2\n" * 5000), ("b.xlsx", bytes(range(256)) * 40), ("c.txt", b"")]
+
+
+def _write(policy: str, workers: int) -> tuple:
+    out = io.BytesIO()
+    with archive.ArchiveWriter(out, policy, workers) as z:
+        for name, data in ENTRIES:
+            z.add(name, data, rows=len(data))
+        with z.open("d.csv", rows=1) as f:
+            f.write(b"streamed\n")
+        z.add_manifest(total=4)
+        parallel = z.parallel
+    out.seek(0)
+    return zipfile.ZipFile(out), parallel
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+@pytest.mark.parametrize("policy", archive.POLICIES)
+def test_round_trip(policy, workers):
+    zf, parallel = _write(policy, workers)
+    assert parallel == (workers > 1)
+    assert zf.testzip() is None
+    assert zf.namelist() == ["a.csv", "b.xlsx", "c.txt", "d.csv", "manifest.json"]
+    for name, data in ENTRIES:
+        assert zf.read(name) == data
+        assert zf.getinfo(name).compress_type == archive.choose(name, policy)[0]
+        assert zf.getinfo(name).date_time[0] > 1980
+    assert zf.read("d.csv") == b"streamed\n"
+    manifest = json.loads(zf.read("manifest.json"))
+    assert [p["name"] for p in manifest["parts"]] == ["a.csv", "b.xlsx", "c.txt", "d.csv"]
+
+
+def test_falls_back_without_raw_write(monkeypatch):
+    # অজানা Python version-এ private zipfile অংশ ছোঁয়া হয় না: parallel বন্ধ, ফল একই
+    monkeypatch.setattr(archive, "_raw_writable", lambda z: False)
+    zf, parallel = _write("auto", 3)
+    assert not parallel and zf.testzip() is None
+    assert zf.read("a.csv") == ENTRIES[0][1]
+
+
+def test_raw_write_refused_while_entry_open():
+    z = archive.ArchiveWriter(io.BytesIO(), "auto", 2)
+    if not z.parallel:
+        pytest.skip("raw write not available on this Python")
+    f = z.open("open.csv")
+    z.add("a.csv", b"1\n")
+    with pytest.raises(ValueError):
+        z._drain(0)
+    f.close()
+    z.close()
@@ -0,0 +1,65 @@
+# tests/test_csvio.py — pyarrow আর pandas C engine একই ফাইলে একই output দেয় কিনা
+import io
+
+import pandas as pd
+import pytest
+
+import csvio
+
+pytest.importorskip("pyarrow")
+
+CASES = {
+    "beyond int64": b"id\n12345678901234567890\n",
+    "uint64 max": b"id,v\n18446744073709551615,1\n",
+    "below int64": b"id,v\n-9223372036854775809,1\n",
+    "small then big": b"id\n1\n12345678901234567890\n",
+    "hex": b"id\n0x1F\n",
+    "int then hex": b"id\n1\n0x1F\n",
+    "plus sign": b"phone,v\n+8801712345678,1\n",
+    "plus sign beyond double": b"phone,v\n+88017123456789012,1\n",
+    "header only": b"id,v\n",
+    "plus after sample": b"id,v\n" + b"".join(b"%d,1\n" % i for i in range(20000)) + b"+8801712345678,2\n",
+    # sample (SNIFF_BYTES)-এর অনেক পরে
+    "hex after sample": b"id,v\n" + b"".join(b"%d,1\n" % i for i in range(20000)) + b"0x1F,2\n",
+    "big int after sample": b"id,v\n" + b"".join(b"%d,1\n" % i for i in range(20000)) + b"12345678901234567890,2\n",
+}
+
+
+def _written(df: pd.DataFrame) -> pd.DataFrame:
+    # output ফাইলে যা লেখা হয়, লেখা হিসেবেই (float-এ "1.2345678901234567e+19" ধরা পড়ে)
+    return pd.read_csv(io.StringIO(df.to_csv(index=False)), dtype=str, keep_default_na=False)
+
+
+@pytest.mark.filterwarnings("ignore::pandas.errors.DtypeWarning")
+@pytest.mark.parametrize("data", CASES.values(), ids=CASES.keys())
+def test_read_matches_c_engine(data):
+    expected = _written(csvio.read(io.BytesIO(data), engine="c"))
+    pd.testing.assert_frame_equal(_written(csvio.read(io.BytesIO(data), engine="pyarrow")), expected)
+
+
+@pytest.mark.filterwarnings("ignore::pandas.errors.DtypeWarning")
+@pytest.mark.parametrize("data", CASES.values(), ids=CASES.keys())
+def test_chunks_match_c_engine(data):
+    expected = [_written(c) for c in csvio.chunks(io.BytesIO(data), 7000, engine="c")]
+    got = [_written(c) for c in csvio.chunks(io.BytesIO(data), 7000, engine="pyarrow")]
+    assert len(got) == len(expected)
+    for g, e in zip(got, expected):
+        pd.testing.assert_frame_equal(g, e)
+
+
+def test_literal_text_kept():
+    df = csvio.read(io.BytesIO(b"id,v\n0x1F,1\n12345678901234567890,2\n"), engine="pyarrow")
+    assert [str(v) for v in df["id"]] == ["0x1F", "12345678901234567890"]
+
+
+@pytest.mark.parametrize("streaming, sort_key", [(True, None), (True, "id"), (False, None)])
+def test_merge_with_header_only_file(streaming, sort_key):
+    # শুধু header-এর ফাইল merge-এ int column-কে float বানায় না
+    import engine
+
+    files = [io.BytesIO(b"id,v\n1,2\n"), io.BytesIO(b"id,v\n")]
+    for f in files:
+        f.name = "x.csv"
+    out = io.StringIO()
+    engine.merge_csv(files, out, streaming=streaming, sort_key=sort_key)
+    assert out.getvalue().splitlines() == ["id,v", "1,2"]
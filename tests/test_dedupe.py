@@ -0,0 +1,40 @@
+# tests/test_dedupe.py — hash ধরে duplicate row বাদ: আলাদা row থাকে, একই row (int / float মিলিয়ে) যায়
+import io
+
+import numpy as np
+import pandas as pd
+
+import dedupe
+import engine
+
+
+def test_big_int_ids_stay_distinct():
+    # float64-এ দুটোই 9007199254740992.0
+    df = pd.DataFrame({"id": [9007199254740992, 9007199254740993]})
+    assert len(set(dedupe.row_hashes(df))) == 2
+
+
+def test_int_and_whole_float_match():
+    ints = pd.DataFrame({"id": [1, 2, 3], "v": [10, 20, 30]})
+    floats = pd.DataFrame({"id": [1.0, 2.5, np.nan], "v": [10.0, 20.0, np.nan]})
+    a, b = dedupe.row_hashes(ints), dedupe.row_hashes(floats)
+    assert a[0] == b[0] and a[1] != b[1]
+    nullable = pd.DataFrame({"id": pd.array([1, None], dtype="Int64"), "v": [10.0, np.nan]})
+    assert dedupe.row_hashes(nullable)[0] == a[0] and dedupe.row_hashes(nullable)[1] == b[2]
+
+
+def test_row_filter_keeps_first():
+    with dedupe.RowFilter() as rows:
+        chunks = [pd.DataFrame({"id": [1, 2, 1]}), pd.DataFrame({"id": [2.0, 3.0]})]
+        kept = pd.concat(list(rows.filter(chunks)), ignore_index=True)
+        assert kept["id"].tolist() == [1, 2, 3] and rows.report()["dropped"] == 2
+
+
+def test_merge_keeps_distinct_big_ids():
+    files = [io.BytesIO(b"id,v\n9007199254740992,a\n"), io.BytesIO(b"id,v\n9007199254740993,a\n9007199254740992,a\n")]
+    for f in files:
+        f.name = "x.csv"
+    out = io.StringIO()
+    with dedupe.RowFilter() as rows:
+        assert engine.merge_csv(files, out, dedup=rows) == 2
+    assert out.getvalue().splitlines()[1:] == ["9007199254740992,a", "9007199254740993,a"]
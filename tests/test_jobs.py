@@ -0,0 +1,60 @@
+# tests/test_jobs.py — বাতিল job-এর output buffer job শেষ হওয়ার পরেই বন্ধ হয়
+import threading
+
+import jobs
+import spill
+
+
+def test_after_waits_for_cancelled_job():
+    budget = spill.Budget(1 << 20)
+    out = spill.SpillBuffer(budget=budget)
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def work(meter):
+        started.set()
+        release.wait(5)
+        try:
+            out.write(b"x" * 100)  # বাতিলের পরেও thread লিখছে
+        except ValueError as e:
+            errors.append(e)
+        meter(1, 1)
+
+    runner = jobs.JobRunner(workers=1)
+    job = runner.submit("s", "t", work)
+    assert started.wait(5)
+    runner.cancel(job)
+    job.after(out.close)
+    assert not out.closed
+    release.set()
+    for _ in range(500):
+        if out.closed:
+            break
+        threading.Event().wait(0.01)
+    assert job.state == "cancelled" and out.closed
+    assert errors == [] and budget.used == 0
+
+
+def test_after_on_finished_job_runs_now():
+    runner = jobs.JobRunner(workers=1)
+    job = runner.submit("s", "t", lambda meter: {})
+    for _ in range(500):
+        if not job.active:
+            break
+        threading.Event().wait(0.01)
+    calls = []
+    job.after(lambda: calls.append(1))
+    assert calls == [1]
+
+
+def test_after_on_queued_cancel():
+    runner = jobs.JobRunner(workers=1)
+    gate = threading.Event()
+    first = runner.submit("a", "t", lambda meter: gate.wait(5))
+    queued = runner.submit("b", "t", lambda meter: {})
+    calls = []
+    queued.after(lambda: calls.append(1))
+    runner.cancel(queued)
+    assert queued.state == "cancelled" and calls == [1]
+    gate.set()
+    runner.cancel(first)
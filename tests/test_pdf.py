@@ -0,0 +1,38 @@
+# tests/test_pdf.py — PDF merge-এর dedupe আগে / পরের size
+import io
+
+import pytest
+
+import engine
+
+pypdf = pytest.importorskip("pypdf")
+
+
+def _pdf(pages: int) -> io.BytesIO:
+    w = pypdf.PdfWriter()
+    for _ in range(pages):
+        w.add_blank_page(200, 200)
+    f = io.BytesIO()
+    w.write(f)
+    f.seek(0)
+    return f
+
+
+def test_input_total_without_measuring():
+    files = [_pdf(2), _pdf(3)]
+    total = sum(len(f.getvalue()) for f in files)
+    sizes, out = {}, io.BytesIO()
+    assert engine.merge_pdfs(files, out, dedupe=True, sizes=sizes) == 5
+    assert sizes == {"inputs": total, "after": len(out.getvalue())}
+
+
+def test_before_measured_on_request():
+    sizes = {}
+    engine.merge_pdfs([_pdf(2), _pdf(3)], io.BytesIO(), dedupe=True, sizes=sizes, measure=True)
+    assert sizes["before"] > 0 and sizes["inputs"] > 0
+
+
+def test_no_dedupe_before_is_after():
+    sizes = {}
+    engine.merge_pdfs([_pdf(1)], io.BytesIO(), sizes=sizes)
+    assert sizes["before"] == sizes["after"]
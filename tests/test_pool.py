@@ -0,0 +1,33 @@
+# tests/test_pool.py — parallel excel parse আর part encode একটাই shared process pool ব্যবহার করে
+import io
+
+import pandas as pd
+import pytest
+
+import archive
+import engine
+
+pytest.importorskip("openpyxl")
+
+
+def _xlsx(df: pd.DataFrame) -> io.BytesIO:
+    f = io.BytesIO()
+    df.to_excel(f, index=False)
+    f.seek(0)
+    f.name = "x.xlsx"
+    return f
+
+
+def test_calls_share_one_pool():
+    frames = [pd.DataFrame({"a": [i, i + 1]}) for i in range(3)]
+    dfs = engine.read_excel_parallel([_xlsx(df) for df in frames], 2)
+    pool = engine.process_pool()
+    assert [df["a"].tolist() for df in dfs] == [df["a"].tolist() for df in frames]
+
+    out = io.BytesIO()
+    with archive.ArchiveWriter(out) as z:
+        named = ((f"p{i}.csv", df, {"rows": len(df)}) for i, df in enumerate(frames))
+        assert engine._zip_parallel(named, z, "csv", None, 3, 2) == 3
+    assert engine.process_pool() is pool
+    assert engine.read_excel_parallel([_xlsx(frames[0])], 2)[0]["a"].tolist() == [0, 1]
+    assert engine.process_pool() is pool
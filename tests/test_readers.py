@@ -0,0 +1,34 @@
+# tests/test_readers.py — upload probe-এর xlsx row / column গোনা
+import io
+
+import pytest
+
+import readers
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def _xlsx(rows: int, styled_row: int = None) -> io.BytesIO:
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["a", "b"])
+    for i in range(rows):
+        ws.append([i, i * 2])
+    if styled_row is not None:
+        ws.cell(styled_row, 1).font = openpyxl.styles.Font(bold=True)  # value নেই, শুধু format
+    f = io.BytesIO()
+    wb.save(f)
+    f.seek(0)
+    return f
+
+
+def test_xlsx_shape_plain():
+    f = _xlsx(10)
+    rows, cols, _ = readers.xlsx_shape(f)
+    assert (rows, cols) == (10, 2) and f.tell() == 0
+
+
+def test_xlsx_shape_formatted_tail_not_exact():
+    # dimension A1:B500 বলে, কিন্তু আসল ডেটা 10 row — সংখ্যাটা শুধু আন্দাজ
+    rows, cols, exact = readers.xlsx_shape(_xlsx(10, styled_row=500))
+    assert rows == 499 and cols == 2 and not exact
@@ -0,0 +1,39 @@
+# tests/test_spill.py — SpillBuffer বন্ধ হলে reserve করা memory ফেরত আসে, পরে আর নেয় না
+import pytest
+
+import spill
+
+
+def test_write_after_close_reserves_nothing():
+    budget = spill.Budget(1 << 20)
+    buf = spill.SpillBuffer(budget=budget)
+    buf.write(b"x" * 1000)
+    assert budget.used == 1000
+    buf.close()
+    assert budget.used == 0
+    with pytest.raises(ValueError):
+        buf.write(b"y" * 1000)
+    assert budget.used == 0
+
+
+def test_spills_past_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(spill, "SPILL_DIR", str(tmp_path))
+    budget = spill.Budget(1 << 20)
+    buf = spill.SpillBuffer(limit_mb=1, budget=budget)
+    buf.write(b"x" * 1000)
+    buf.write(b"y" * (1 << 20))
+    assert buf.spilled and budget.used == 0
+    buf.seek(0)
+    assert buf.read(1001) == b"x" * 1000 + b"y"
+    path = buf.path
+    buf.close()
+    assert not (tmp_path / path).exists()
+
+
+def test_spilled_download_reads_bytes(tmp_path, monkeypatch):
+    monkeypatch.setattr(spill, "SPILL_DIR", str(tmp_path))
+    buf = spill.SpillBuffer(limit_mb=0)
+    buf.write(b"abc")
+    data = buf.download_data()
+    assert buf.spilled and callable(data) and data() == b"abc"
+    buf.close()
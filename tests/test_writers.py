@@ -0,0 +1,56 @@
+# tests/test_writers.py — parquet / feather-এ chunk ভেদে type বদলালে (drift) schema চওড়া হয়, crash নয়
+import io
+
+import pandas as pd
+import pytest
+
+import engine
+import writers
+
+pytest.importorskip("pyarrow")
+
+# note প্রথম chunk-এ পুরো খালি (float NaN), পরের chunk-এ লেখা; v প্রথমে int, পরে float
+CHUNKS = [
+    pd.DataFrame({"id": [1, 2], "note": [float("nan")] * 2, "v": [1, 2]}),
+    pd.DataFrame({"id": [3, 4], "note": ["a", "b"], "v": [3.5, 4.0]}),
+]
+
+
+def _read(out: io.BytesIO, ext: str) -> pd.DataFrame:
+    out.seek(0)
+    return pd.read_parquet(out) if ext == "parquet" else pd.read_feather(out)
+
+
+def test_drift_types():
+    assert writers.drift_types({"id": {"i"}, "note": {"f", "O"}, "v": {"i", "f"}}) == {
+        "note": "string", "v": "float64"}
+
+
+@pytest.mark.parametrize("ext", ["parquet", "feather"])
+def test_null_then_string(ext):
+    kinds = {c: {df[c].dtype.kind for df in CHUNKS} for c in CHUNKS[0].columns}
+    out = io.BytesIO()
+    assert writers.write_chunks(iter(CHUNKS), out, ext, writers.drift_types(kinds)) == 4
+    df = _read(out, ext)
+    assert df["note"].isna().tolist() == [True, True, False, False]
+    assert df["note"].tolist()[2:] == ["a", "b"]
+    assert df["v"].tolist() == [1.0, 2.0, 3.5, 4.0]
+
+
+def test_unknown_drift_is_an_error():
+    # types ছাড়া সংখ্যা → লেখা নিরাপদে মেলানো যায় না: পরিষ্কার ValueError, pyarrow-এর cast error নয়
+    chunks = [pd.DataFrame({"x": [1]}), pd.DataFrame({"x": ["a"]})]
+    with pytest.raises(ValueError, match="'x'"):
+        writers.write_chunks(iter(chunks), io.BytesIO(), "parquet")
+
+
+@pytest.mark.parametrize("ext", ["parquet", "feather"])
+def test_convert_csv_with_late_text(tmp_path, ext):
+    # convert চলে chunk ধরে; প্রথম chunk-এ note খালি
+    path = tmp_path / "drift.csv"
+    path.write_text("id,note\n" + "".join(f"{i},\n" for i in range(50)) + "50,text\n")
+    out = tmp_path / f"x.{ext}"
+    with open(path, "rb") as f:
+        engine.merge_csv_stream([f], str(out), chunksize=10, out_ext=ext)
+    df = _read(io.BytesIO(out.read_bytes()), ext)
+    assert len(df) == 51 and df["note"].iloc[-1] == "text"
@@ -0,0 +1,152 @@
+# writers.py — streaming table writer (csv / xlsx / parquet / feather)
+# openpyxl-এর write_only mode: row গুলো আসার সাথে সাথে sheet XML-এ লেখা হয়,
+# পুরো workbook কখনো memory-তে থাকে না। এক sheet-এ Excel-এর সীমা (1,048,576 row)
+# ছাড়িয়ে গেলে header সহ নতুন sheet খোলে — Sheet1, Sheet2, ...
+# Parquet-এ প্রতিটি chunk একটা row group, Feather-এ একটা record batch।
+import pandas as pd
+
+XLSX_MAX_ROWS = 1_048_576  # header সহ এক sheet-এ সর্বোচ্চ row
+ROW_GROUP_ROWS = 100_000  # একটা DataFrame লেখার সময় parquet row group / feather batch-এর মাপ
+TABLE_FORMATS = ("csv", "xlsx", "parquet", "feather")
+MIME_TYPES = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "parquet": "application/vnd.apache.parquet",
+    "feather": "application/vnd.apache.arrow.file",
+}
+
+
+def _header_cells(ws, columns) -> list:
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+
+    # pandas to_excel-এর header style: bold, চারপাশে thin border, মাঝখানে
+    thin = Side(style="thin")
+    cells = []
+    for name in columns:
+        c = WriteOnlyCell(ws, value=name)
+        c.font = Font(bold=True)
+        c.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        c.alignment = Alignment(horizontal="center", vertical="top")
+        cells.append(c)
+    return cells
+
+
+def write_xlsx(chunks, out, max_rows: int = XLSX_MAX_ROWS) -> int:
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws, sheet_rows, columns, total = None, 0, None, 0
+
+    def new_sheet():
+        s = wb.create_sheet(f"Sheet{len(wb.worksheets) + 1}")
+        s.append(_header_cells(s, columns))
+        return s
+
+    for chunk in chunks:
+        if columns is None:
+            columns = list(chunk.columns)
+            ws, sheet_rows = new_sheet(), 1
+        # NaN/NaT → খালি cell, numpy scalar → Python value
+        values = chunk.astype(object).where(chunk.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            if sheet_rows >= max_rows:
+                ws, sheet_rows = new_sheet(), 1
+            ws.append(row)
+            sheet_rows += 1
+        total += len(chunk)
+    if columns is None:  # কোনো chunk-ই আসেনি: খালি sheet
+        wb.create_sheet("Sheet1")
+    wb.save(out)
+    return total
+
+
+def frame_chunks(df: pd.DataFrame, size: int = 50_000):
+    # একটা বড় DataFrame-কে ছোট slice-এ ভাগ করি যাতে astype(object) কপি ছোট থাকে
+    if len(df) == 0:
+        yield df
+    for start in range(0, len(df), size):
+        yield df.iloc[start: start + size]
+
+
+def write_csv(chunks, out) -> int:
+    total, header = 0, True
+    for chunk in chunks:
+        chunk.to_csv(out, index=False, header=header)
+        header = False
+        total += len(chunk)
+    return total
+
+
+def drift_types(kinds: dict) -> dict:
+    # column → chunk গুলোতে দেখা dtype kind-এর set (যেমন {"f", "O"}: এক ফাইলে পুরো খালি, অন্যটায় লেখা)।
+    # একাধিক kind হলে parquet / feather-এর জন্য চওড়া type: শুধু সংখ্যা → float64, বাকি সব → string
+    types = {}
+    for c, k in kinds.items():
+        if len(k) > 1:
+            types[c] = "float64" if k <= {"i", "u", "f"} else "string"
+    return types
+
+
+def _conform(table, schema):
+    # প্রথম chunk-এর (types মেশানো) schema-য় আনি — শুধু নিরাপদ বদল: খালি (null) column, int → float,
+    # যেকোনো কিছু → string। বাকিটা (যেমন প্রথমে সংখ্যা, পরে লেখা) আগে থেকে জানা না থাকলে error
+    import pyarrow as pa
+
+    columns = []
+    for field in schema:
+        col = table.column(field.name)
+        src, dst = col.type, field.type
+        if src != dst:
+            safe = (pa.types.is_null(src) or pa.types.is_string(dst) or pa.types.is_large_string(dst)
+                    or pa.types.is_floating(dst) and (pa.types.is_integer(src) or pa.types.is_floating(src)))
+            if not safe:
+                raise ValueError(f"column {field.name!r} is {src} here but {dst} in the first rows; "
+                                 "write to .csv or make the column's type consistent")
+            col = col.cast(dst)
+        columns.append(col)
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def write_columnar(chunks, out, ext: str, types: dict = None) -> int:
+    # প্রথম chunk-এর schema-ই ফাইলের schema, types (column → "string" / "float64", drift_types) দিয়ে চওড়া করা;
+    # পরের chunk গুলো _conform হয়ে তাতে মেলে
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+
+    def open_writer(schema):
+        if ext == "parquet":
+            return pq.ParquetWriter(out, schema)
+        return ipc.new_file(out, schema, options=ipc.IpcWriteOptions(compression="lz4"))
+
+    writer, schema, total = None, None, 0
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                schema = table.schema
+                for name, alias in (types or {}).items():
+                    if name in schema.names:
+                        i = schema.get_field_index(name)
+                        schema = schema.set(i, schema.field(i).with_type(pa.type_for_alias(alias)))
+                writer = open_writer(schema)
+            if not table.schema.equals(schema):
+                table = _conform(table, schema)
+            writer.write_table(table)
+            total += len(chunk)
+        if writer is None:  # কোনো chunk-ই আসেনি: খালি ফাইল
+            writer = open_writer(pa.schema([]))
+    finally:
+        if writer is not None:
+            writer.close()
+    return total
+
+
+def write_chunks(chunks, out, ext: str, types: dict = None) -> int:
+    # types শুধু parquet / feather-এ লাগে (write_columnar)
+    if ext == "xlsx":
+        return write_xlsx(chunks, out)
+    if ext in ("parquet", "feather"):
+        return write_columnar(chunks, out, ext, types)
+    return write_csv(chunks, out)